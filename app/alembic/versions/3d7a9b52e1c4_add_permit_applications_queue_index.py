@@ -0,0 +1,26 @@
+"""Add reviewer queue index on permit_applications
+
+Revision ID: 3d7a9b52e1c4
+Revises: 8c3e1f27b9d4
+Create Date: 2026-10-17 09:14:22.503117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3d7a9b52e1c4'
+down_revision: Union[str, None] = '8c3e1f27b9d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_permit_applications_queue', 'permit_applications', ['mmda_id', 'department_id', 'status'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_permit_applications_queue', table_name='permit_applications')
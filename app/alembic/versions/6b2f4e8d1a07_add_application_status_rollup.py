@@ -0,0 +1,39 @@
+"""Add application status rollup table
+
+Revision ID: 6b2f4e8d1a07
+Revises: 3d7a9b52e1c4
+Create Date: 2026-10-17 09:31:05.172840
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6b2f4e8d1a07'
+down_revision: Union[str, None] = '3d7a9b52e1c4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Filled from permit_applications by scripts/init_db.py (reconcile_if_empty)
+    op.create_table(
+        'application_status_rollup',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('mmda_id', sa.Integer(), nullable=False),
+        sa.Column('department_id', sa.Integer(), nullable=False),
+        sa.Column('committee_id', sa.Integer(), nullable=False),
+        sa.Column('status', postgresql.ENUM(name='applicationstatus', create_type=False), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['mmda_id'], ['mmdas.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('mmda_id', 'department_id', 'committee_id', 'status', name='uq_application_status_rollup_scope'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('application_status_rollup')
@@ -0,0 +1,35 @@
+"""Add PostGIS and simplified MMDA boundary columns
+
+Revision ID: 8c3e1f27b9d4
+Revises: 5a59f26cf09d
+Create Date: 2025-07-20 10:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from geoalchemy2 import Geometry
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c3e1f27b9d4'
+down_revision: Union[str, None] = '5a59f26cf09d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('mmdas', sa.Column('boundary_geom', Geometry('MULTIPOLYGON', srid=4326, spatial_index=False), nullable=True))
+    op.add_column('mmdas', sa.Column('boundary_high', Geometry('MULTIPOLYGON', srid=4326, spatial_index=False), nullable=True))
+    op.add_column('mmdas', sa.Column('boundary_medium', Geometry('MULTIPOLYGON', srid=4326, spatial_index=False), nullable=True))
+    op.add_column('mmdas', sa.Column('boundary_low', Geometry('MULTIPOLYGON', srid=4326, spatial_index=False), nullable=True))
+    op.create_index('idx_mmdas_boundary_geom', 'mmdas', ['boundary_geom'], unique=False, postgresql_using='gist')
+
+
+def downgrade() -> None:
+    op.drop_index('idx_mmdas_boundary_geom', table_name='mmdas', postgresql_using='gist')
+    op.drop_column('mmdas', 'boundary_low')
+    op.drop_column('mmdas', 'boundary_medium')
+    op.drop_column('mmdas', 'boundary_high')
+    op.drop_column('mmdas', 'boundary_geom')
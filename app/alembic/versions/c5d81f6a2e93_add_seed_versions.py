@@ -0,0 +1,32 @@
+"""Add seed versions table
+
+Revision ID: c5d81f6a2e93
+Revises: 9e4c7a1f3b62
+Create Date: 2026-10-17 09:44:12.381526
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5d81f6a2e93'
+down_revision: Union[str, None] = '9e4c7a1f3b62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'seed_versions',
+        sa.Column('name', sa.String(length=50), nullable=False),
+        sa.Column('content_hash', sa.String(length=64), nullable=False),
+        sa.Column('applied_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('name'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('seed_versions')
@@ -0,0 +1,26 @@
+"""Add expiry to outbox messages
+
+Revision ID: f2b6d8a05c31
+Revises: e7a3c9b4d158
+Create Date: 2026-10-17 14:06:51.228409
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2b6d8a05c31'
+down_revision: Union[str, None] = 'e7a3c9b4d158'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('outbox_messages', sa.Column('expires_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('outbox_messages', 'expires_at')
@@ -0,0 +1,44 @@
+from fastapi import Depends, HTTPException, Request
+from app.core.database import session_manager
+from app.core.security import decode_jwt_token
+from app.services.principal import Principal, PrincipalService
+
+
+async def current_principal(request: Request) -> Principal:
+    """
+    Authenticated caller from the auth_token cookie.
+
+    The token is decoded and the staff scope resolved once per request (the
+    result is kept on request.state), and the scope itself comes from a short
+    TTL cache, so most requests don't query for it at all. A miss uses its own
+    read session, closed before the route runs, rather than a request-scoped
+    one that would hold a second pooled connection next to the route's.
+    """
+    principal = getattr(request.state, "principal", None)
+    if principal is not None:
+        return principal
+
+    token = request.cookies.get("auth_token")
+    if not token:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+
+    try:
+        payload = decode_jwt_token(token)
+        user_id = int(payload.get("sub"))
+    except Exception:
+        raise HTTPException(status_code=401, detail="Invalid or expired token")
+
+    async with session_manager.get_read_session() as db:
+        principal = await PrincipalService.get(db, user_id)
+    if principal is None:
+        raise HTTPException(status_code=404, detail="User not found")
+
+    request.state.principal = principal
+    return principal
+
+
+async def current_staff(principal: Principal = Depends(current_principal)) -> Principal:
+    """Authenticated caller who belongs to a department"""
+    if not principal.is_staff:
+        raise HTTPException(status_code=403, detail="User is not a staff member")
+    return principal
@@ -1,7 +1,9 @@
 # app/api/v1/routers/applications.py
+import logging
 from datetime import datetime, timezone
 import json
-from fastapi import APIRouter, HTTPException, Request, Depends
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Query, Request, Depends
 from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import func, select, update
@@ -9,43 +11,53 @@ from sqlalchemy.dialects.postgresql import insert
 from uuid import uuid4
 from app.api.v1.routers.documents import serialize_geom
 from app.core.constants import PERMIT_TYPE_TO_COMMITTEE, PERMIT_TYPE_TO_DEPARTMENT, InspectionStatus, InspectionType, PaymentPurpose, PaymentStatus, PermitType, ReviewOutcome, ReviewStatus
+from app.api.dependencies import current_principal
 from app.core.database import aget_db
-from sqlalchemy.orm import joinedload
-from app.core.security import decode_jwt_token
 from app.models.application import ApplicationStatusHistory, PermitApplication, ApplicationStatus
 from app.models.document import ApplicationDocument
 from app.models.inspection import Inspection
 from app.models.payment import Payment
 from app.models.review import ApplicationReview, ApplicationReviewStep
-from app.models.zoning import SiteCondition
+from app.models.zoning import SiteCondition, ZoningDistrict
 from app.schemas.ReviewPermitSchemas import FlagStepRequest, ReviewerPermitApplicationOut, UpdateReviewStatusRequest
 from app.schemas.permit_application import PermitApplicationCreate
-from app.models.user import MMDA, Committee, CommitteeMember, Department, DepartmentStaff, ProfessionalInCharge, User
+from app.models.user import MMDA, Committee, Department, ProfessionalInCharge, User
+from app.services.application_detail import ApplicationDetailService
 from app.services.geojson_to_ewkt import geojson_to_ewkt
+from app.services.location_resolver import LocationResolver
+from app.services.principal import Principal
+from app.services.status_rollup import StatusRollupService
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/applications", tags=["applications"])
 
 @router.post("/submit-application")
 async def create_application(
     data: PermitApplicationCreate,
-    request: Request,
+    principal: Principal = Depends(current_principal),
     db: AsyncSession = Depends(aget_db)
 ):
-    # Authentication and user validation
-    token = request.cookies.get("auth_token")
-    if not token:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-
-    try:
-        payload = decode_jwt_token(token)
-        user_id = int(payload.get("sub"))
-    except Exception:
-        raise HTTPException(status_code=401, detail="Invalid token")
-    
+    user_id = principal.user_id
     user = await db.get(User, user_id)
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-    
+
+    # Check the client's MMDA / zoning district against where the pin actually is
+    resolved_district_id = int(data.zoningDistrictId) if data.zoningDistrictId else None
+    if data.latitude is not None and data.longitude is not None:
+        location = await LocationResolver.locate_in_db(db, data.latitude, data.longitude)
+        if location["mmda"] and location["mmda"]["id"] != int(data.mmdaId):
+            raise HTTPException(
+                status_code=400,
+                detail=f"Project location is in {location['mmda']['name']}, not the selected MMDA"
+            )
+        if location["zoning_district"]:
+            if resolved_district_id and resolved_district_id != location["zoning_district"]["id"]:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Project location is in the {location['zoning_district']['name']} zoning district"
+                )
+            resolved_district_id = location["zoning_district"]["id"]
+
     # Get department and committee assignments
     try:
         permit_type = PermitType(data.permitTypeId)
@@ -126,7 +138,7 @@ async def create_application(
         project_description=data.projectDescription,
         project_address=data.projectAddress,
         parcel_number=data.parcelNumber,
-        zoning_district_id=int(data.zoningDistrictId) if data.zoningDistrictId else None,
+        zoning_district_id=resolved_district_id,
         zoning_use_id=int(data.zoningUseId) if data.zoningUseId else None,
         estimated_cost=data.estimatedCost,
         construction_area=data.constructionArea,
@@ -138,7 +150,14 @@ async def create_application(
         latitude=data.latitude,
         longitude=data.longitude,
         parcel_geometry=geojson_to_ewkt(data.parcelGeometry) if data.parcelGeometry else None,
-        spatial_data=geojson_to_ewkt(data.zoningDistrictSpatial) if data.zoningDistrictSpatial else None,
+        # Snapshot the district polygon from the database rather than trusting the client copy
+        spatial_data=(
+            select(ZoningDistrict.spatial_data)
+            .where(ZoningDistrict.id == resolved_district_id)
+            .scalar_subquery()
+        ) if resolved_district_id else (
+            geojson_to_ewkt(data.zoningDistrictSpatial) if data.zoningDistrictSpatial else None
+        ),
         project_location=f"SRID=4326;POINT({data.longitude} {data.latitude})" if data.longitude and data.latitude else None,
         setbacks={
             "front": data.setbackFront,
@@ -165,6 +184,7 @@ async def create_application(
         committee_id=committee.id,
     )
     db.add(application)
+    await StatusRollupService.record_transition(db, application, None, ApplicationStatus.SUBMITTED)
     await db.commit()
     await db.refresh(application)
 
@@ -210,148 +230,62 @@ async def create_application(
 @router.get("/reviewer/permit/{application_id}", response_model=ReviewerPermitApplicationOut)
 async def get_permit_application_for_reviewer(
     application_id: int,
-    request: Request,
-    db: AsyncSession = Depends(aget_db)
+    include: Optional[str] = Query(None, description="Comma-separated sections, e.g. documents,payments (default: all)"),
+    principal: Principal = Depends(current_principal),
+    db: AsyncSession = Depends(aget_db),
 ):
-    # 1. Extract and decode JWT token to get reviewer ID
-    token = request.cookies.get("auth_token")
-
-    print("token is: ", token)
-    if not token:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-
-    try:
-        payload = decode_jwt_token(token)
-        reviewer_user_id = int(payload.get("sub"))
-    except Exception:
-        raise HTTPException(status_code=401, detail="Invalid token")
-
     # 2. Get the MMDA the reviewer is assigned to via committee
-    mmda_query = (
-    select(MMDA.id)
-    .join(Committee)
-    .join(CommitteeMember)
-    .join(DepartmentStaff)  # Add this join
-    .where(DepartmentStaff.user_id == reviewer_user_id)  # Change this condition
-    .limit(1)
-    )
-    mmda_result = await db.execute(mmda_query)
-    mmda_id = mmda_result.scalar()
+    mmda_id = principal.committee_mmda_id
 
     if not mmda_id:
         raise HTTPException(status_code=403, detail="Reviewer not assigned to any MMDA committee")
 
-    # 3. Load the permit application with full relations, but only if in reviewer's MMDA
-    app_query = (
-        select(PermitApplication)
-        .options(
-            joinedload(PermitApplication.applicant).joinedload(User.profile),
-            joinedload(PermitApplication.architect),
-            joinedload(PermitApplication.mmda),
-            joinedload(PermitApplication.permit_type),
-            joinedload(PermitApplication.documents).joinedload(ApplicationDocument.document_type),
-            joinedload(PermitApplication.reviews),
-            joinedload(PermitApplication.inspections),
-            joinedload(PermitApplication.payments),
-            joinedload(PermitApplication.status_history),
-            joinedload(PermitApplication.zoning_district),
-            joinedload(PermitApplication.zoning_use),
-            joinedload(PermitApplication.drainage_type),
-            joinedload(PermitApplication.previous_land_use),
-            joinedload(PermitApplication.site_conditions),
-        )
-        .where(
-            PermitApplication.id == application_id,
-            PermitApplication.mmda_id == mmda_id
-        )
-    )
+    try:
+        sections = ApplicationDetailService.parse_include(include)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-    result = await db.execute(app_query)
-    application = result.unique().scalar_one_or_none()
+    # 3. Load the permit application with the requested sections, but only if in reviewer's MMDA
+    application = await ApplicationDetailService.load(db, application_id, sections, mmda_id=mmda_id)
 
     if not application:
         raise HTTPException(status_code=403, detail="Access denied to this application")
 
     try:
-        data = ReviewerPermitApplicationOut.from_orm(application).model_dump()
+        data = ApplicationDetailService.serialize(application, ReviewerPermitApplicationOut, sections)
         # Manually serialize WKBElement spatial fields
         data["parcel_geometry"] = serialize_geom(application.parcel_geometry)
         data["spatial_data"] = serialize_geom(application.spatial_data)
         data["project_location"] = serialize_geom(application.project_location)
         return data
     except Exception as e:
-        print("Serialization error:", e)
+        logger.error(f"❌ Serialization error: {e}")
         raise HTTPException(status_code=500, detail="Response serialization failed")
-    
-
 
 
 @router.post("/reviewer/applications/{application_id}/review", response_model=ReviewerPermitApplicationOut)
 async def set_under_review(
     application_id: int,
     data: UpdateReviewStatusRequest,
-    request: Request,
-    db: AsyncSession = Depends(aget_db)
+    principal: Principal = Depends(current_principal),
+    db: AsyncSession = Depends(aget_db),
 ):
-    # 1. Decode JWT token from cookie
-    token = request.cookies.get("auth_token")
-    print("Token is: ", token)
-    if not token:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-
-    try:
-        payload = decode_jwt_token(token)
-        reviewer_user_id = int(payload.get("sub"))
-    except Exception:
-        raise HTTPException(status_code=401, detail="Invalid token")
+    reviewer_user_id = principal.user_id
 
     # 2. Get MMDA for reviewer via committee
-    mmda_query = (
-        select(MMDA.id)
-        .join(Committee)
-        .join(CommitteeMember)
-        .join(DepartmentStaff)  # Add this join
-        .where(DepartmentStaff.user_id == reviewer_user_id)  # Change this condition
-        .limit(1)
-    )
-    mmda_result = await db.execute(mmda_query)
-    mmda_id = mmda_result.scalar()
+    mmda_id = principal.committee_mmda_id
 
     if not mmda_id:
         raise HTTPException(status_code=403, detail="Reviewer not assigned to any MMDA committee")
 
     # 3. Load the application (must belong to reviewer's MMDA)
-    app_query = (
-        select(PermitApplication)
-        .options(
-            joinedload(PermitApplication.applicant).joinedload(User.profile),
-            joinedload(PermitApplication.architect),
-            joinedload(PermitApplication.mmda),
-            joinedload(PermitApplication.permit_type),
-            joinedload(PermitApplication.documents).joinedload(ApplicationDocument.document_type),
-            joinedload(PermitApplication.reviews),
-            joinedload(PermitApplication.inspections),
-            joinedload(PermitApplication.payments),
-            joinedload(PermitApplication.status_history),
-            joinedload(PermitApplication.zoning_district),
-            joinedload(PermitApplication.zoning_use),
-            joinedload(PermitApplication.drainage_type),
-            joinedload(PermitApplication.previous_land_use),
-            joinedload(PermitApplication.site_conditions),
-        )
-        .where(
-            PermitApplication.id == application_id,
-            PermitApplication.mmda_id == mmda_id
-        )
-    )
-    app_result = await db.execute(app_query)
-    application = app_result.unique().scalar_one_or_none()
+    application = await ApplicationDetailService.load(db, application_id, mmda_id=mmda_id)
 
     if not application:
         raise HTTPException(status_code=403, detail="Access denied to this application")
 
-    # 4. Save old status and update to new status
-    previous_status = application.status
+    # 4. Save old status (locked) and update to new status
+    previous_status = await StatusRollupService.lock_status(db, application.id)
     application.status = data.newStatus  # e.g., ApplicationStatus.UNDER_REVIEW
 
     # 5. Check for existing review
@@ -385,6 +319,7 @@ async def set_under_review(
         notes=data.comments
     )
     db.add(status_history)
+    await StatusRollupService.record_transition(db, application, previous_status, data.newStatus)
 
     # 7. Commit and refresh
     await db.commit()
@@ -392,28 +327,24 @@ async def set_under_review(
 
     # 8. Serialize application safely
     try:
-        data = ReviewerPermitApplicationOut.from_orm(application).model_dump()
+        data = ApplicationDetailService.serialize(application, ReviewerPermitApplicationOut)
         data["parcel_geometry"] = serialize_geom(application.parcel_geometry)
         data["spatial_data"] = serialize_geom(application.spatial_data)
         data["project_location"] = serialize_geom(application.project_location)
         return data
     except Exception as e:
-        print("Serialization error:", e)
+        logger.error(f"❌ Serialization error: {e}")
         raise HTTPException(status_code=500, detail="Response serialization failed")
 
 
 @router.post("/reviewer/applications/{application_id}/submit-review")
-async def submit_review(application_id: int, request: Request, db: AsyncSession = Depends(aget_db)):
-    # --- Step 0: Authenticate reviewer ---
-    token = request.cookies.get("auth_token")
-    if not token:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-
-    try:
-        payload = decode_jwt_token(token)
-        reviewer_user_id = int(payload["sub"])
-    except (KeyError, ValueError, TypeError):
-        raise HTTPException(status_code=401, detail="Invalid token")
+async def submit_review(
+    application_id: int,
+    request: Request,
+    principal: Principal = Depends(current_principal),
+    db: AsyncSession = Depends(aget_db)
+):
+    reviewer_user_id = principal.user_id
 
     # --- Step 1: Parse input data ---
     body = await request.json()
@@ -445,7 +376,6 @@ async def submit_review(application_id: int, request: Request, db: AsyncSession
 
     new_enum_status = STATUS_MAP_REVERSE.get(normalized_status_str)
     if not new_enum_status:
-        print("No New Enummeration.", new_status_str)
         raise HTTPException(status_code=400, detail=f"Invalid status: {new_status_str}")
 
     # --- Step 3: Determine review outcome ---
@@ -484,7 +414,10 @@ async def submit_review(application_id: int, request: Request, db: AsyncSession
     await db.execute(stmt)
 
     # --- Step 5: Fetch application ---
-    result = await db.execute(select(PermitApplication).where(PermitApplication.id == application_id))
+    # Locked so the status read in step 8 is still current when the rollup moves
+    result = await db.execute(
+        select(PermitApplication).where(PermitApplication.id == application_id).with_for_update()
+    )
     application = result.scalar_one_or_none()
     if not application:
         raise HTTPException(status_code=404, detail="Application not found")
@@ -497,8 +430,6 @@ async def submit_review(application_id: int, request: Request, db: AsyncSession
         except ValueError:
             raise HTTPException(status_code=400, detail="Invalid inspectionDate format")
         
-        print("Enumeration is: ", InspectionType.INITIAL)
-
         inspection = Inspection(
             application_id=application_id,
             inspection_officer_id=None,
@@ -560,6 +491,7 @@ async def submit_review(application_id: int, request: Request, db: AsyncSession
         notes=comments,
     )
     db.add(status_history)
+    await StatusRollupService.record_transition(db, application, original_status, new_enum_status)
 
     # --- Finalize ---
     await db.commit()
@@ -574,18 +506,10 @@ async def submit_review(application_id: int, request: Request, db: AsyncSession
 async def mark_step_complete(
     application_id: int,
     step_name: str,
-    request: Request,
+    principal: Principal = Depends(current_principal),
     db: AsyncSession = Depends(aget_db),
 ):
-    token = request.cookies.get("auth_token")
-    if not token:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-
-    try:
-        payload = decode_jwt_token(token)
-        reviewer_user_id = int(payload.get("sub"))
-    except Exception:
-        raise HTTPException(status_code=401, detail="Invalid token")
+    reviewer_user_id = principal.user_id
 
     # Upsert step completion and clear any flags
     stmt = (
@@ -625,30 +549,13 @@ async def flag_step_exception(
     application_id: int,
     step_name: str,
     data: FlagStepRequest,
-    request: Request,
+    principal: Principal = Depends(current_principal),
     db: AsyncSession = Depends(aget_db),
 ):
-    token = request.cookies.get("auth_token")
-    if not token:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-
-    try:
-        payload = decode_jwt_token(token)
-        reviewer_user_id = int(payload.get("sub"))
-    except Exception:
-        raise HTTPException(status_code=401, detail="Invalid token")
+    reviewer_user_id = principal.user_id
 
     # Ensure reviewer is part of a committee
-    mmda_query = (
-        select(MMDA.id)
-        .join(Committee)
-        .join(CommitteeMember)
-        .join(DepartmentStaff)  # Add this join
-        .where(DepartmentStaff.user_id == reviewer_user_id)  # Change this condition
-        .limit(1)
-    )
-    mmda_result = await db.execute(mmda_query)
-    mmda_id = mmda_result.scalar()
+    mmda_id = principal.committee_mmda_id
     if not mmda_id:
         raise HTTPException(status_code=403, detail="Reviewer not assigned to any MMDA")
 
@@ -1,3 +1,4 @@
+import logging
 from datetime import timedelta
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status, Request
@@ -6,12 +7,13 @@ import jwt
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.constants import VerificationStage
-from app.models.user import ApplicantType, User, UserProfile
+from app.models.user import User, UserProfile
 from app.schemas.AthenticationSchemas import SendOtpRequest, VerifyOtpRequest
 from authlib.integrations.starlette_client import OAuth
-from app.core.database import aget_db
+from app.core.database import aget_db, aget_replica_db
 from app.schemas.User import ApplicantTypeOut, CurrentUserResponse, GhanaCardInput, UserDocumentOut, UserOut, UserProfileOut
 from app.services.otpService import OtpService
+from app.services.reference_cache import reference_cache
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 from app.services.otpService import OTPVerificationStatus
@@ -20,6 +22,8 @@ from dotenv import load_dotenv
 from app.core.security import decode_jwt_token
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
+
 load_dotenv()
 
 
@@ -77,7 +81,6 @@ async def verify_otp(
     user_remember_me = payload.remember
 
     result = await otp_service.verify_otp(payload.contact, payload.otp, user_remember_me, db)
-    print("results is")
     status = result.get("status")
 
     if status == OTPVerificationStatus.SUCCESS:
@@ -85,8 +88,6 @@ async def verify_otp(
         onboarding = result['onboarding']
         role = result["role"]
 
-        print("role is", role)
-
         response = JSONResponse( {
             "message": "OTP verified successfully",
             "onboarding": onboarding,
@@ -109,8 +110,6 @@ async def verify_otp(
         response.headers["Access-Control-Allow-Origin"] = "http://localhost:3000"
         response.headers["Access-Control-Allow-Credentials"] = "true"
 
-        print("Cookie set in response:", response.headers.get("set-cookie"))
-
         return response
 
     if status == OTPVerificationStatus.LOCKED:
@@ -163,10 +162,8 @@ async def google_callback(request: Request, db: AsyncSession = Depends(aget_db))
 @router.get("/me")
 async def get_current_user(request: Request, db: AsyncSession = Depends(aget_db)):
     token = request.cookies.get("auth_token")
-    print("Raw token from cookies:", token)
     
     if not token:
-        print("No token found in cookies")
         raise HTTPException(status_code=401, detail="Not authenticated")
 
     try:
@@ -176,7 +173,6 @@ async def get_current_user(request: Request, db: AsyncSession = Depends(aget_db)
         user = result.scalar_one_or_none()
 
         if not user:
-            print("No subject in payload")
             raise HTTPException(status_code=401, detail="Invalid token claims")
             
         return {
@@ -189,13 +185,11 @@ async def get_current_user(request: Request, db: AsyncSession = Depends(aget_db)
         }
         
     except jwt.ExpiredSignatureError:
-        print("Token expired")
         raise HTTPException(status_code=401, detail="Token expired")
     except jwt.InvalidTokenError as e:
-        print(f"Invalid token: {str(e)}")
         raise HTTPException(status_code=401, detail="Invalid token")
     except Exception as e:
-        print(f"Unexpected error: {str(e)}")
+        logger.warning(f"⚠️ Authentication failed: {type(e).__name__}")
         raise HTTPException(status_code=401, detail="Authentication failed")
     
 
@@ -206,10 +200,8 @@ from sqlalchemy.orm import joinedload
 @router.get("/me/profile", response_model=CurrentUserResponse)
 async def get_current_user(request: Request, db: AsyncSession = Depends(aget_db)):
     token = request.cookies.get("auth_token")
-    print("Raw token from cookies:", token)
     
     if not token:
-        print("No token found in cookies")
         raise HTTPException(status_code=401, detail="Not authenticated")
 
     try:
@@ -223,8 +215,6 @@ async def get_current_user(request: Request, db: AsyncSession = Depends(aget_db)
         )
         user = result.unique().scalar_one_or_none()
 
-        print ("user is", user)
-
         if not user:
             raise HTTPException(status_code=401, detail="Invalid token claims")
 
@@ -236,13 +226,11 @@ async def get_current_user(request: Request, db: AsyncSession = Depends(aget_db)
         )
 
     except jwt.ExpiredSignatureError:
-        print("Token expired")
         raise HTTPException(status_code=401, detail="Token expired")
     except jwt.InvalidTokenError as e:
-        print(f"Invalid token: {str(e)}")
         raise HTTPException(status_code=401, detail="Invalid token")
     except Exception as e:
-        print(f"Unexpected error: {str(e)}")
+        logger.warning(f"⚠️ Authentication failed: {type(e).__name__}")
         raise HTTPException(status_code=401, detail="Authentication failed")
 
 
@@ -253,7 +241,6 @@ async def submit_ghana_card(
     db: AsyncSession = Depends(aget_db)
 ):
     token = request.cookies.get("auth_token")
-    print("Token is", token)
     if not token:
         raise HTTPException(status_code=401, detail="Not authenticated")
 
@@ -294,6 +281,5 @@ async def logout():
 
 
 @router.get("/applicant-types", response_model=List[ApplicantTypeOut])
-async def get_applicant_types(db: AsyncSession = Depends(aget_db)):
-    result = await db.execute(select(ApplicantType).order_by(ApplicantType.name))
-    return result.scalars().all()
\ No newline at end of file
+async def get_applicant_types(request: Request, db: AsyncSession = Depends(aget_replica_db)):
+    return reference_cache.respond(request, await reference_cache.get(db, "applicant_types"))
\ No newline at end of file
@@ -1,5 +1,9 @@
+import logging
 import json
-from fastapi import APIRouter, Depends, HTTPException, Request
+from datetime import date, timedelta
+from functools import partial
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from geoalchemy2 import WKBElement, WKTElement
 from requests import session
 from sqlalchemy import and_, exists, func, or_
@@ -7,19 +11,28 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
 from typing import List, Optional
-from sqlalchemy.orm import joinedload
 from app.core.constants import ApplicationStatus, InspectionStatus, UserRole
-from app.core.database import aget_db
-from app.core.security import decode_jwt_token
+from app.api.dependencies import current_principal, current_staff
+from app.core.database import aget_db, aget_read_db, aget_replica_db, session_manager
+from app.core.responses import FastJSONResponse, compose
 from app.models.application import PermitApplication
-from app.models.document import ApplicationDocument, PermitTypeModel, PermitDocumentRequirement, DocumentTypeModel
+from app.models.document import PermitTypeModel, PermitDocumentRequirement
 from geoalchemy2.shape import to_shape
 from shapely.geometry import mapping
 from app.models.inspection import Inspection
-from app.models.user import MMDA, CommitteeMember, Department, DepartmentStaff
-from app.models.zoning import DrainageType, PreviousLandUse, SiteCondition, ZoningDistrict, ZoningPermittedUse, ZoningUseDocumentRequirement
+from app.models.user import MMDA, Department, DepartmentStaff
 from app.schemas.PermitSchemas import DrainageTypeOut, PermitTypeOut, PermitTypeWithRequirements, PreviousLandUseOut, SiteConditionOut, ZoningDistrictOut, ZoningPermittedUseOut
 from app.schemas.permit_application import ApplicationDetailOut, ApplicationDocumentOut, ApplicationOut, ApplicationUpdate
+from app.services.application_export import EXPORT_FORMATS, ApplicationExportService
+from app.services.application_detail import APPLICANT_SECTIONS, ApplicationDetailService
+from app.services.mmda_boundaries import MMDABoundaryService
+from app.services.permit_tiles import MVT_MEDIA_TYPE, PermitTileService
+from app.services.permit_projections import PermitProjectionService
+from app.services.principal import Principal
+from app.services.reference_cache import reference_cache
+from app.services.status_rollup import StatusRollupService
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(
     prefix="/permits",
@@ -40,61 +53,28 @@ def serialize_geom(geom):
             return geom  # just return as-is
     raise TypeError(f"Unsupported geometry format: {type(geom)}")
 
+def resolve_boundary_detail(detail: Optional[str], zoom: Optional[int]) -> str:
+    """Boundary detail level for map endpoints (?detail=full|high|medium|low or ?zoom=)"""
+    try:
+        return MMDABoundaryService.resolve_detail(detail, zoom)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
 
 
 @router.get("/my-applications", response_model=List[ApplicationOut])
 async def get_user_applications(
-    request: Request,
-    db: AsyncSession = Depends(aget_db)
+    principal: Principal = Depends(current_principal),
+    db: AsyncSession = Depends(aget_read_db)
 ):
-    token = request.cookies.get("auth_token")
-    if not token:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-
-    payload = decode_jwt_token(token)
-    user_id = int(payload.get("sub"))
-
-    # ✅ Build query
-    stmt = (
-        select(PermitApplication)
-        .where(PermitApplication.applicant_id == user_id)
-        .options(
-            selectinload(PermitApplication.documents).selectinload(ApplicationDocument.document_type),
-            selectinload(PermitApplication.permit_type),
-            selectinload(PermitApplication.mmda),
-        )
-        .order_by(PermitApplication.created_at.desc())
-    )
-
-    # ✅ Execute it only once
-    result = await db.execute(stmt)
-    apps = result.scalars().all()
-
-    print("✅ Final serialized apps:", apps)
-    return [ApplicationOut.from_orm(app) for app in apps]
+    # Tuples straight from SQL; the rows were validated when they were written
+    applications = await PermitProjectionService.applicant_applications(db, principal.user_id)
+    return FastJSONResponse(applications)
 
 
 @router.get("/my-applications/{application_id}", response_model=ApplicationDetailOut)
-async def get_application(application_id: int, db: AsyncSession = Depends(aget_db)):
-    result = await db.execute(
-        select(PermitApplication)
-        .options(
-            joinedload(PermitApplication.zoning_use),
-            joinedload(PermitApplication.drainage_type),
-            joinedload(PermitApplication.zoning_district),
-            joinedload(PermitApplication.previous_land_use),
-            joinedload(PermitApplication.site_conditions),
-            joinedload(PermitApplication.architect),
-            joinedload(PermitApplication.mmda),
-            joinedload(PermitApplication.applicant),
-            joinedload(PermitApplication.permit_type),
-            joinedload(PermitApplication.documents).joinedload(ApplicationDocument.document_type),
-            joinedload(PermitApplication.payments),
-        )
-        .filter(PermitApplication.id == application_id)
-    )
-    
-    app = result.unique().scalar_one_or_none()
+async def get_application(application_id: int, db: AsyncSession = Depends(aget_read_db)):
+    app = await ApplicationDetailService.load(db, application_id, APPLICANT_SECTIONS)
 
     if not app:
         raise HTTPException(status_code=404, detail="Application not found")
@@ -102,7 +82,7 @@ async def get_application(application_id: int, db: AsyncSession = Depends(aget_d
     # Manually serialize spatial fields to GeoJSON
 
 
-    data = ApplicationDetailOut.from_orm(app).dict()
+    data = ApplicationDetailService.serialize(app, ApplicationDetailOut, APPLICANT_SECTIONS)
     data["parcel_geometry"] = serialize_geom(app.parcel_geometry)
     data["spatial_data"] = serialize_geom(app.spatial_data)
     data["project_location"] = serialize_geom(app.project_location)
@@ -123,8 +103,6 @@ async def update_application(
     if not app:
         raise HTTPException(status_code=404, detail="Application not found")
 
-    print("App status:", app.status.value)  # or use logger
-
     if app.status.value not in ("draft", "submitted"):
         raise HTTPException(status_code=400, detail="This application cannot be edited.")
 
@@ -139,134 +117,63 @@ async def update_application(
 
 
 @router.get("/dashboard/applicant-map")
-async def get_dashboard_data(request: Request, db: AsyncSession = Depends(aget_db)):
-    token = request.cookies.get("auth_token")
-    if not token:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    
-    try:
-        payload = decode_jwt_token(token)
-        user_id = int(payload.get("sub"))
-    except Exception:
-        raise HTTPException(status_code=401, detail="Invalid token")
-
-    # Fetch user permits + basic details
-    permit_result = await db.execute(
-        select(PermitApplication)
-        .options(
-            joinedload(PermitApplication.mmda),
-            joinedload(PermitApplication.permit_type)
-        )
-        .filter(PermitApplication.applicant_id == user_id)
-    )
-    permits = permit_result.scalars().all()
+async def get_dashboard_data(
+    principal: Principal = Depends(current_principal),
+    db: AsyncSession = Depends(aget_replica_db),
+    zoom: Optional[int] = None,
+    detail: Optional[str] = None
+):
+    boundary_detail = resolve_boundary_detail(detail, zoom)
+    user_id = principal.user_id
 
-    # Group MMDAs related to user’s permits
-    mmda_ids = list({permit.mmda_id for permit in permits})
+    # Permits as JSON built by Postgres, plus the MMDAs they fall in
+    permits, mmda_ids = await PermitProjectionService.map_permits(
+        db, PermitApplication.applicant_id == user_id
+    )
 
     # Fetch MMDAs + permit stats
-    mmda_result = await db.execute(
-        select(MMDA)
-        .options(selectinload(MMDA.permit_applications))
-        .filter(MMDA.id.in_(mmda_ids))
-    )
-    mmdas = mmda_result.scalars().all()
-
-    mmda_data = []
-    for mmda in mmdas:
-        permits_in_mmda = mmda.permit_applications
-        status_counts = {}
-        for permit in permits_in_mmda:
-            status = permit.status.value if hasattr(permit.status, "value") else permit.status
-            status_counts[status] = status_counts.get(status, 0) + 1
-        
-        mmda_data.append({
-            "id": mmda.id,
-            "name": mmda.name,
-            "region": mmda.region,
-            "type": mmda.type,
-            "jurisdiction_boundaries": mmda.jurisdiction_boundaries,
-            "status_counts": status_counts,
-        })
-        
+    mmdas = await MMDABoundaryService.fetch_mmdas(db, mmda_ids, boundary_detail)
+    rollup_counts = await StatusRollupService.counts_by_mmda(db, mmda_ids)
 
-    return {
-        "permits": [
-            {
-                "id": p.id,
-                "project_name": p.project_name,
-                "status": p.status.value if hasattr(p.status, "value") else p.status,
-                "permit_type": {"id": p.permit_type.id, "name": p.permit_type.name} if p.permit_type else None,
-                "mmda_id": p.mmda_id,
-                "parcel_geometry": serialize_geom(p.parcel_geometry),
-                "latitude": p.latitude,
-                "longitude": p.longitude,
-            }
-            for p in permits
-        ],
-        "mmdas": mmda_data,
-    }
+    mmda_data = [
+        format_mmda_data(mmda, rollup_counts.get(mmda.id, {}), boundary)
+        for mmda, boundary in mmdas
+    ]
+
+    return FastJSONResponse(compose({"permits": permits, "mmdas": mmda_data}))
 
 
 @router.get("/dashboard/reviewer-map")
 async def get_reviewer_map_data(
-    request: Request, 
-    db: AsyncSession = Depends(aget_db)
+    staff: Principal = Depends(current_staff),
+    db: AsyncSession = Depends(aget_replica_db),
+    zoom: Optional[int] = None,
+    detail: Optional[str] = None
 ):
     """Get map data for reviewer dashboard, filtered by department and committee assignments"""
-    # Authentication
-    token = request.cookies.get("auth_token")
-    if not token:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    
-    try:
-        payload = decode_jwt_token(token)
-        user_id = int(payload.get("sub"))
-    except Exception as e:
-        raise HTTPException(status_code=401, detail="Invalid token")
-
-    # Get reviewer's department and committee assignments
-    staff = await get_staff_with_assignments(db, user_id)
-    if not staff:
-        raise HTTPException(status_code=403, detail="User is not a staff member")
-
-    mmda_id = staff.department.mmda_id
+    boundary_detail = resolve_boundary_detail(detail, zoom)
+    user_id = staff.user_id
+    mmda_id = staff.mmda_id
 
     # Build base filter for applications this reviewer should see
     base_filter = build_reviewer_filter(staff, mmda_id)
 
-    # Fetch relevant permits
-    work_permits = await fetch_work_permits(db, base_filter)
-    personal_permits = await fetch_personal_permits(db, user_id, mmda_id)
-    
-    # Process and combine results
-    all_permits = work_permits + personal_permits
-    personal_permit_ids = {p.id for p in personal_permits}
-    mmda_ids = {mmda_id} | {p.mmda_id for p in personal_permits}
+    # Work permits plus the reviewer's own applications in other MMDAs, in one query
+    personal_filter = and_(PermitApplication.applicant_id == user_id, PermitApplication.mmda_id != mmda_id)
+    permits, permit_mmda_ids = await PermitProjectionService.map_permits(
+        db, or_(base_filter, personal_filter), {"is_personal": personal_filter}
+    )
+    mmda_ids = {mmda_id} | set(permit_mmda_ids)
     
     # Get MMDA data with statistics
-    mmdas_data = await process_mmda_data(db, mmda_ids, staff, mmda_id)
+    mmdas_data = await process_mmda_data(db, mmda_ids, staff, mmda_id, boundary_detail)
 
-    # Debug logging (keep your existing print statements)
-    debug_reviewer_data(base_filter, staff, work_permits, all_permits)
+    debug_reviewer_data(staff, permit_mmda_ids)
 
-    return format_reviewer_response(all_permits, personal_permit_ids, mmdas_data, mmda_id)
+    return FastJSONResponse(compose({"permits": permits, "mmdas": mmdas_data, "reviewer_mmda_id": mmda_id}))
 
 # Helper functions (kept minimal to match your style)
-async def get_staff_with_assignments(db: AsyncSession, user_id: int):
-    """Get staff member with department and committee assignments"""
-    result = await db.execute(
-        select(DepartmentStaff)
-        .join(Department)
-        .options(
-            joinedload(DepartmentStaff.department).joinedload(Department.mmda),
-            joinedload(DepartmentStaff.committee_memberships).joinedload(CommitteeMember.committee)
-        )
-        .where(DepartmentStaff.user_id == user_id)
-    )
-    return result.scalars().first()
-
-def build_reviewer_filter(staff: DepartmentStaff, mmda_id: int):
+def build_reviewer_filter(staff: Principal, mmda_id: int):
     """Build filter for applications this reviewer should see"""
     base_filter = and_(
         PermitApplication.mmda_id == mmda_id,
@@ -274,348 +181,174 @@ def build_reviewer_filter(staff: DepartmentStaff, mmda_id: int):
     )
 
     if not staff.is_head:
-        committee_ids = [cm.committee.id for cm in staff.committee_memberships]
         base_filter = and_(
             base_filter,
             or_(
-                PermitApplication.committee_id.in_(committee_ids),
+                PermitApplication.committee_id.in_(staff.committee_ids),
                 PermitApplication.committee_id.is_(None)
             )
         )
     return base_filter
 
-async def fetch_work_permits(db: AsyncSession, base_filter):
-    """Fetch work permits based on filter"""
-    result = await db.execute(
-        select(PermitApplication)
-        .options(
-            joinedload(PermitApplication.mmda),
-            joinedload(PermitApplication.permit_type),
-            joinedload(PermitApplication.department),
-            joinedload(PermitApplication.committee)
-        )
-        .where(base_filter)
-    )
-    return result.scalars().all()
-
-async def fetch_personal_permits(db: AsyncSession, user_id: int, mmda_id: int):
-    """Fetch personal permits in other MMDAs"""
-    result = await db.execute(
-        select(PermitApplication)
-        .options(
-            joinedload(PermitApplication.mmda),
-            joinedload(PermitApplication.permit_type)
-        )
-        .where(
-            PermitApplication.applicant_id == user_id,
-            PermitApplication.mmda_id != mmda_id
-        )
-    )
-    return result.scalars().all()
-
-async def process_mmda_data(db: AsyncSession, mmda_ids: set, staff: DepartmentStaff, work_mmda_id: int):
+async def process_mmda_data(db: AsyncSession, mmda_ids: set, staff: Principal, work_mmda_id: int, boundary_detail: str = "full"):
     """Process MMDA data with statistics"""
-    mmdas_data = []
-    for current_mmda_id in mmda_ids:
-        mmda = await fetch_mmda(db, current_mmda_id)
-        if mmda:
-            status_counts = await get_mmda_status_counts(
-                db, current_mmda_id, staff, work_mmda_id
-            )
-            mmdas_data.append(format_mmda_data(mmda, status_counts))
-    return mmdas_data
-
-async def fetch_mmda(db: AsyncSession, mmda_id: int):
-    """Fetch single MMDA"""
-    result = await db.execute(
-        select(MMDA)
-        .options(selectinload(MMDA.permit_applications))
-        .where(MMDA.id == mmda_id)
+    mmdas = await MMDABoundaryService.fetch_mmdas(db, mmda_ids, boundary_detail)
+    # Only the reviewer's own department is counted in their work MMDA
+    rollup_counts = await StatusRollupService.counts_by_mmda(
+        db, mmda_ids, department_filter={work_mmda_id: staff.department_id}
     )
-    return result.scalars().first()
+    return [
+        format_mmda_data(mmda, dashboard_status_counts(rollup_counts.get(mmda.id, {})), boundary)
+        for mmda, boundary in mmdas
+    ]
 
-async def get_mmda_status_counts(db: AsyncSession, mmda_id: int, staff: DepartmentStaff, work_mmda_id: int):
-    """Get status counts for MMDA permits"""
-    status_filter = and_(
-        PermitApplication.mmda_id == mmda_id,
-        PermitApplication.department_id == staff.department_id if mmda_id == work_mmda_id else True
-    )
-    
-    status_counts_result = await db.execute(
-        select(
-            PermitApplication.status,
-            func.count(PermitApplication.id)
-        )
-        .where(status_filter)
-        .group_by(PermitApplication.status)
-    )
-    
-    status_counts = {
-        "submitted": 0,
-        "under_review": 0,
-        "approved": 0,
-        "rejected": 0
+def dashboard_status_counts(status_counts: dict):
+    """Narrow rollup counts to the statuses shown on the dashboard maps"""
+    return {
+        status_key: status_counts.get(status_key, 0)
+        for status_key in ("submitted", "under_review", "approved", "rejected")
     }
-    
-    for status, count in status_counts_result:
-        status_key = status.value if hasattr(status, "value") else status
-        if status_key in status_counts:
-            status_counts[status_key] = count
-    
-    return status_counts
 
-def format_mmda_data(mmda: MMDA, status_counts: dict):
+def format_mmda_data(mmda: MMDA, status_counts: dict, boundary=None):
     """Format MMDA data for response"""
     return {
         "id": mmda.id,
         "name": mmda.name,
         "region": mmda.region,
         "type": mmda.type,
-        "jurisdiction_boundaries": mmda.jurisdiction_boundaries,
+        "jurisdiction_boundaries": boundary,
         "status_counts": status_counts,
     }
 
-def format_reviewer_response(permits: list, personal_permit_ids: set, mmdas_data: list, reviewer_mmda_id: int):
-    """Format final response with reviewer's MMDA ID"""
-    return {
-        "permits": [
-            {
-                "id": p.id,
-                "project_name": p.project_name,
-                "status": p.status.value if hasattr(p.status, "value") else p.status,
-                "permit_type": {
-                    "id": p.permit_type.id,
-                    "name": p.permit_type.name
-                } if p.permit_type else None,
-                "mmda_id": p.mmda_id,
-                "parcel_geometry": serialize_geom(p.parcel_geometry),
-                "latitude": p.latitude,
-                "longitude": p.longitude,
-                "is_personal": p.id in personal_permit_ids,
-            }
-            for p in permits
-        ],
-        "mmdas": mmdas_data,
-        "reviewer_mmda_id": reviewer_mmda_id,  # Add reviewer's work MMDA ID
-    }
-
-def debug_reviewer_data(base_filter, staff, work_permits, all_permits):
-    """Debug logging (keeping your existing print statements)"""
-    print("Base filter applied", base_filter)
-    print("Staff Committee Membership", [
-        {"committee_id": cm.committee_id, "role": cm.role} 
-        for cm in staff.committee_memberships
-    ])
-    print("SOMETHING PERMITS:", work_permits)
-    print("ALL PERMITS:", all_permits)
+def debug_reviewer_data(staff, permit_mmda_ids):
+    """Debug logging; only formatted when DEBUG is enabled for this module"""
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            f"Reviewer map: committees={list(staff.committee_ids)} "
+            f"permit_mmdas={sorted(permit_mmda_ids)}"
+        )
 
 
 
 @router.get("/dashboard/inspector-map")
 async def get_inspector_map_data(
-    request: Request, 
-    db: AsyncSession = Depends(aget_db)
+    staff: Principal = Depends(current_staff),
+    db: AsyncSession = Depends(aget_replica_db),
+    zoom: Optional[int] = None,
+    detail: Optional[str] = None
 ):
     """Get map data for inspector dashboard including:
     - Inspector's personal applications (any MMDA)
     - Applications ready for inspection in assigned MMDA
     """
-    # Authentication
-    token = request.cookies.get("auth_token")
-    if not token:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    
-    try:
-        payload = decode_jwt_token(token)
-        user_id = int(payload.get("sub"))
-    except Exception as e:
-        raise HTTPException(status_code=401, detail="Invalid token")
-
-    # Get inspector's department and MMDA info
-    staff = await get_inspector_staff_info(db, user_id)
-    if not staff:
-        raise HTTPException(status_code=403, detail="User is not a staff member")
-
-    mmda_id = staff.department.mmda_id
+    boundary_detail = resolve_boundary_detail(detail, zoom)
+    user_id = staff.user_id
+    mmda_id = staff.mmda_id
 
     try:
-        # Fetch applications in two categories:
-        # 1. Personal applications (any MMDA)
-        personal_applications = await fetch_personal_applications(db, user_id)
-        
-        # 2. Applications ready for inspection in assigned MMDA
-        inspection_ready_apps = await fetch_inspection_ready_apps(db, mmda_id, user_id)
-
-        # Combine and deduplicate
-        all_applications = await combine_inspection_data(inspection_ready_apps, personal_applications)
-        personal_permit_ids = {p.id for p in personal_applications}
-        mmda_ids = {mmda_id} | {app.mmda_id for app in personal_applications}
+        # Applications ready for inspection in the assigned MMDA plus the
+        # inspector's own applications (any MMDA), with inspections nested by Postgres
+        personal_filter = PermitApplication.applicant_id == user_id
+        permits, permit_mmda_ids = await PermitProjectionService.map_permits(
+            db,
+            or_(build_inspection_ready_filter(mmda_id, user_id), personal_filter),
+            {"is_personal": personal_filter, **PermitProjectionService.inspection_fields()},
+        )
+        mmda_ids = {mmda_id} | set(permit_mmda_ids)
         
         # Get MMDA data with statistics
-        mmdas_data = await process_inspection_mmda_data(db, mmda_ids, mmda_id)
+        mmdas_data = await process_inspection_mmda_data(db, mmda_ids, mmda_id, boundary_detail)
 
-        return format_inspector_response(all_applications, personal_permit_ids, mmdas_data, mmda_id)
+        return FastJSONResponse(compose({"permits": permits, "mmdas": mmdas_data, "inspector_mmda_id": mmda_id}))
 
     except Exception as e:
         import traceback
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=str(e))
 
-async def get_inspector_staff_info(db: AsyncSession, user_id: int):
-    """Get inspector staff member with department info"""
-    result = await db.execute(
-        select(DepartmentStaff)
-        .join(Department)
-        .options(
-            selectinload(DepartmentStaff.department)
-            .selectinload(Department.mmda)
-        )
-        .where(DepartmentStaff.user_id == user_id)
-    )
-    return result.scalars().first()
-
-async def fetch_inspection_ready_apps(db: AsyncSession, mmda_id: int, user_id: int):
-    """Fetch applications ready for inspection in the specified MMDA"""
-    # First get applications that need inspection
-    needs_inspection = await db.execute(
-        select(PermitApplication)
-        .options(
-            selectinload(PermitApplication.permit_type),
-            selectinload(PermitApplication.mmda),
-            selectinload(PermitApplication.inspections)
-        )
-        .where(
-            PermitApplication.mmda_id == mmda_id,
-            PermitApplication.status.in_([
-                ApplicationStatus.APPROVED,
-                ApplicationStatus.UNDER_REVIEW
-            ]),
-            ~exists().where(Inspection.application_id == PermitApplication.id)
-        )
-    )
-    apps_needing_inspection = needs_inspection.scalars().all()
-
-    # Then get applications with pending inspections assigned to this inspector
-    pending_inspections = await db.execute(
-        select(PermitApplication)
-        .options(
-            selectinload(PermitApplication.permit_type),
-            selectinload(PermitApplication.mmda),
-            selectinload(PermitApplication.inspections)
-        )
-        .join(Inspection, Inspection.application_id == PermitApplication.id)
-        .where(
-            PermitApplication.mmda_id == mmda_id,
-            Inspection.inspection_officer_id == user_id,
-            Inspection.status == InspectionStatus.PENDING
-        )
-    )
-    apps_with_pending = pending_inspections.scalars().all()
-
-    # Combine and deduplicate
-    seen_ids = set()
-    combined = []
-    for app in apps_needing_inspection + apps_with_pending:
-        if app.id not in seen_ids:
-            seen_ids.add(app.id)
-            combined.append(app)
-    return combined
-
-async def fetch_personal_applications(db: AsyncSession, user_id: int):
-    """Fetch inspector's personal applications from any MMDA"""
-    result = await db.execute(
-        select(PermitApplication)
-        .options(
-            selectinload(PermitApplication.permit_type),
-            selectinload(PermitApplication.mmda),
-            selectinload(PermitApplication.inspections)
+def build_inspection_ready_filter(mmda_id: int, user_id: int):
+    """Build filter for applications an inspector should see in their MMDA:
+    - approved/under review applications with no inspection yet
+    - applications with a pending inspection assigned to this inspector
+    """
+    return and_(
+        PermitApplication.mmda_id == mmda_id,
+        or_(
+            and_(
+                PermitApplication.status.in_([
+                    ApplicationStatus.APPROVED,
+                    ApplicationStatus.UNDER_REVIEW
+                ]),
+                ~exists().where(Inspection.application_id == PermitApplication.id)
+            ),
+            exists().where(
+                Inspection.application_id == PermitApplication.id,
+                Inspection.inspection_officer_id == user_id,
+                Inspection.status == InspectionStatus.PENDING
+            )
         )
-        .where(PermitApplication.applicant_id == user_id)
     )
-    return result.scalars().all()
-
-async def combine_inspection_data(inspection_ready_apps: list, personal_apps: list):
-    """Combine inspection and application data"""
-    seen_ids = set()
-    unique_apps = []
-    
-    for app in inspection_ready_apps + personal_apps:
-        if app.id not in seen_ids:
-            seen_ids.add(app.id)
-            unique_apps.append(app)
-    
-    return unique_apps
 
-async def process_inspection_mmda_data(db: AsyncSession, mmda_ids: set, work_mmda_id: int):
+async def process_inspection_mmda_data(db: AsyncSession, mmda_ids: set, work_mmda_id: int, boundary_detail: str = "full"):
     """Process MMDA data with inspection statistics"""
-    mmdas_data = []
-    for current_mmda_id in mmda_ids:
-        mmda = await fetch_mmda(db, current_mmda_id)
-        if mmda:
-            status_counts = await get_inspection_status_counts(
-                db, current_mmda_id, work_mmda_id
-            )
-            mmdas_data.append(format_mmda_data(mmda, status_counts))
-    return mmdas_data
-
-async def fetch_mmda(db: AsyncSession, mmda_id: int):
-    """Fetch single MMDA"""
-    result = await db.execute(
-        select(MMDA)
-        .where(MMDA.id == mmda_id)
-    )
-    return result.scalars().first()
-
-async def get_inspection_status_counts(db: AsyncSession, mmda_id: int, work_mmda_id: int):
-    """Get status counts for inspections in MMDA"""
-    # Initialize counts
+    status_counts = await get_inspection_status_counts(db, mmda_ids, work_mmda_id)
+    return [
+        format_mmda_data(mmda, status_counts[mmda.id], boundary)
+        for mmda, boundary in await MMDABoundaryService.fetch_mmdas(db, mmda_ids, boundary_detail)
+    ]
+
+# Map inspection (and legacy application) statuses onto the inspector map buckets
+INSPECTION_STATUS_MAPPING = {
+    "pending": "pending",
+    "scheduled": "scheduled",
+    "in_progress": "in_progress",
+    "completed": "completed",
+    "cancelled": "cancelled",
+    "inspected": "completed",
+    "approved": "awaiting_inspection",
+    "under_review": "awaiting_inspection",
+    "inspection_pending": "awaiting_inspection",
+    "submitted": "pending",
+    "draft": "pending",
+    "additional_info_requested": "pending",
+    "rejected": "cancelled",
+    "issued": "completed",
+}
+
+async def get_inspection_status_counts(db: AsyncSession, mmda_ids: set, work_mmda_id: int):
+    """Inspection status counts for every MMDA in one grouped query (plus one for the work MMDA backlog)"""
     status_counts = {
-        "pending": 0,
-        "scheduled": 0,
-        "in_progress": 0,
-        "completed": 0,
-        "cancelled": 0,
-        "awaiting_inspection": 0
-    }
-    
-    # Map inspection statuses
-    STATUS_MAPPING = {
-        "pending": "pending",
-        "scheduled": "scheduled",
-        "in_progress": "in_progress",
-        "completed": "completed",
-        "cancelled": "cancelled",
-        "inspected": "completed",
-        "approved": "awaiting_inspection",
-        "under_review": "awaiting_inspection",
-        "inspection_pending": "awaiting_inspection",
-        "submitted": "pending",
-        "draft": "pending",
-        "additional_info_requested": "pending",
-        "rejected": "cancelled",
-        "issued": "completed",
+        mmda_id: {
+            "pending": 0,
+            "scheduled": 0,
+            "in_progress": 0,
+            "completed": 0,
+            "cancelled": 0,
+            "awaiting_inspection": 0
+        }
+        for mmda_id in mmda_ids
     }
-    
-    # Count inspections by status
+
+    # Count inspections by MMDA and status
     inspection_stats = await db.execute(
-        select(Inspection.status, func.count(Inspection.id))
+        select(PermitApplication.mmda_id, Inspection.status, func.count(Inspection.id))
         .join(PermitApplication, Inspection.application_id == PermitApplication.id)
-        .filter(PermitApplication.mmda_id == mmda_id)
-        .group_by(Inspection.status)
+        .filter(PermitApplication.mmda_id.in_(mmda_ids))
+        .group_by(PermitApplication.mmda_id, Inspection.status)
     )
-    
-    for status, count in inspection_stats.all():
+
+    for mmda_id, status, count in inspection_stats.all():
         raw = status.value if hasattr(status, "value") else status
-        mapped = STATUS_MAPPING.get(raw.lower(), "pending")
-        if mapped in status_counts:
-            status_counts[mapped] += count
-    
+        mapped = INSPECTION_STATUS_MAPPING.get(raw.lower(), "pending")
+        if mapped in status_counts[mmda_id]:
+            status_counts[mmda_id][mapped] += count
+
     # Count applications needing inspection (only for work MMDA)
-    if mmda_id == work_mmda_id:
+    if work_mmda_id in status_counts:
         needs_inspection_count = await db.execute(
             select(func.count(PermitApplication.id))
             .filter(
-                PermitApplication.mmda_id == mmda_id,
+                PermitApplication.mmda_id == work_mmda_id,
                 PermitApplication.status.in_([
                     ApplicationStatus.APPROVED,
                     ApplicationStatus.UNDER_REVIEW
@@ -623,297 +356,229 @@ async def get_inspection_status_counts(db: AsyncSession, mmda_id: int, work_mmda
                 ~exists().where(Inspection.application_id == PermitApplication.id)
             )
         )
-        status_counts["awaiting_inspection"] += needs_inspection_count.scalar_one() or 0
-    
+        status_counts[work_mmda_id]["awaiting_inspection"] += needs_inspection_count.scalar_one() or 0
+
     return status_counts
 
-def format_mmda_data(mmda: MMDA, status_counts: dict):
+def format_mmda_data(mmda: MMDA, status_counts: dict, boundary=None):
     """Format MMDA data for response"""
     return {
         "id": mmda.id,
         "name": mmda.name,
         "region": mmda.region,
         "type": mmda.type,
-        "jurisdiction_boundaries": mmda.jurisdiction_boundaries,
+        "jurisdiction_boundaries": boundary,
         "status_counts": status_counts,
     }
 
-def format_inspector_response(applications: list, personal_permit_ids: set, mmdas_data: list, inspector_mmda_id: int):
-    """Format final response for inspector map"""
-    print("MMDA Data:", mmdas_data)  # Debugging output
-    return {
-        "permits": [
-            {
-                "id": app.id,
-                "project_name": app.project_name,
-                "status": app.status.value if hasattr(app.status, "value") else app.status,
-                "permit_type": {
-                    "id": app.permit_type.id,
-                    "name": app.permit_type.name
-                } if app.permit_type else None,
-                "mmda_id": app.mmda_id,
-                "parcel_geometry": serialize_geom(app.parcel_geometry),
-                "latitude": app.latitude,
-                "longitude": app.longitude,
-                "is_personal": app.id in personal_permit_ids,
-                "inspections": [
-                    {
-                        "id": insp.id,
-                        "status": insp.status.value if hasattr(insp.status, "value") else insp.status,
-                        "scheduled_date": insp.scheduled_date.isoformat() if insp.scheduled_date else None,
-                        "actual_date": insp.actual_date.isoformat() if insp.actual_date else None,
-                        "inspection_type": insp.inspection_type.value if insp.inspection_type else None,
-                        "outcome": insp.outcome.value if insp.outcome else None,
-                        "officer_id": insp.inspection_officer_id
-                    }
-                    for insp in app.inspections
-                ],
-                "needs_inspection": (
-                    app.status in [ApplicationStatus.APPROVED, ApplicationStatus.UNDER_REVIEW]
-                    and len(app.inspections) == 0
-                )
-            }
-            for app in applications
-        ],
-        "mmdas": mmdas_data,
-        "inspector_mmda_id": inspector_mmda_id,  # Add inspector's work MMDA ID
-    }
-
 @router.get("/dashboard/admin-map")
-async def get_admin_dashboard_map(request: Request, db: AsyncSession = Depends(aget_db)):
+async def get_admin_dashboard_map(
+    staff: Principal = Depends(current_staff),
+    db: AsyncSession = Depends(aget_replica_db),
+    zoom: Optional[int] = None,
+    detail: Optional[str] = None
+):
     """Get comprehensive dashboard data for admin users including permits, MMDAs, and departments"""
-    # Authentication
-    token = request.cookies.get("auth_token")
-    if not token:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    
-    try:
-        payload = decode_jwt_token(token)
-        user_id = int(payload.get("sub"))
-        
-        # Get the admin's department and MMDA info
-        staff_result = await db.execute(
-            select(DepartmentStaff)
-            .join(Department)
-            .options(
-                joinedload(DepartmentStaff.department)
-                .joinedload(Department.mmda)
-            )
-            .filter(DepartmentStaff.user_id == user_id)
-        )
-        staff = staff_result.scalars().first()
-        
-        if not staff:
-            raise HTTPException(status_code=403, detail="User is not a staff member")
-        
-        mmda_id = staff.department.mmda_id
-    except Exception as e:
-        raise HTTPException(status_code=401, detail="Invalid token")
-
-    # Fetch all permits for the admin's MMDA (administrative jurisdiction)
-    mmda_permits_result = await db.execute(
-        select(PermitApplication)
-        .options(
-            joinedload(PermitApplication.mmda),
-            joinedload(PermitApplication.permit_type),
-            joinedload(PermitApplication.applicant),
-            joinedload(PermitApplication.department)
-        )
-        .filter(PermitApplication.mmda_id == mmda_id)
+    boundary_detail = resolve_boundary_detail(detail, zoom)
+    user_id = staff.user_id
+    mmda_id = staff.mmda_id
+
+    # Permits in the admin's MMDA plus their own applications elsewhere, as JSON built by Postgres
+    personal_filter = and_(PermitApplication.applicant_id == user_id, PermitApplication.mmda_id != mmda_id)
+    permits, permit_mmda_ids = await PermitProjectionService.map_permits(
+        db,
+        or_(PermitApplication.mmda_id == mmda_id, personal_filter),
+        {
+            "application_number": PermitApplication.application_number,
+            "is_personal": personal_filter,
+            "applicant_name": PermitProjectionService.applicant_name(),
+            "department_id": PermitApplication.department_id,
+        },
+        join_applicant=True,
     )
-    mmda_permits = mmda_permits_result.scalars().all()
-
-    # Fetch any personal permits the admin has applied for (in any MMDA)
-    personal_permits_result = await db.execute(
-        select(PermitApplication)
-        .options(
-            joinedload(PermitApplication.mmda),
-            joinedload(PermitApplication.permit_type),
-            joinedload(PermitApplication.applicant)
-        )
-        .filter(PermitApplication.applicant_id == user_id)
-        .filter(PermitApplication.mmda_id != mmda_id)  # Exclude those already in work MMDA
-    )
-    personal_permits = personal_permits_result.scalars().all()
-
-    # Get IDs of personal permits for efficient checking
-    personal_permit_ids = {p.id for p in personal_permits}
-    
-    # Combine both permit lists
-    all_permits = mmda_permits + personal_permits
 
     # Get all unique MMDAs involved (work MMDA + any personal permit MMDAs)
-    mmda_ids = {mmda_id} | {p.mmda_id for p in personal_permits}
+    mmda_ids = {mmda_id} | set(permit_mmda_ids)
 
     # Fetch all relevant MMDAs and their permit stats
-    mmdas_data = []
-    for current_mmda_id in mmda_ids:
-        mmda_result = await db.execute(
-            select(MMDA)
-            .options(selectinload(MMDA.permit_applications))
-            .filter(MMDA.id == current_mmda_id)
-        )
-        mmda = mmda_result.scalars().first()
-
-        if mmda:
-            # Calculate status counts for this MMDA
-            status_counts = {
-                "submitted": 0,
-                "under_review": 0,
-                "approved": 0,
-                "rejected": 0
-            }
-            for permit in mmda.permit_applications:
-                status = permit.status.value if hasattr(permit.status, "value") else permit.status
-                if status in status_counts:
-                    status_counts[status] += 1
-
-            mmdas_data.append({
-                "id": mmda.id,
-                "name": mmda.name,
-                "region": mmda.region,
-                "type": mmda.type,
-                "jurisdiction_boundaries": mmda.jurisdiction_boundaries,
-                "status_counts": status_counts,
-            })
-
-    # Fetch departments within the admin's MMDA with accurate application counts
+    mmdas = await MMDABoundaryService.fetch_mmdas(db, mmda_ids, boundary_detail)
+    rollup_counts = await StatusRollupService.counts_by_mmda(db, mmda_ids)
+    mmdas_data = [
+        format_mmda_data(mmda, dashboard_status_counts(rollup_counts.get(mmda.id, {})), boundary)
+        for mmda, boundary in mmdas
+    ]
+
+    # Fetch departments within the admin's MMDA with their staff counts
     departments_result = await db.execute(
-        select(Department)
+        select(Department, func.count(DepartmentStaff.user_id))
+        .outerjoin(DepartmentStaff, DepartmentStaff.department_id == Department.id)
         .filter(Department.mmda_id == mmda_id)
+        .group_by(Department.id)
     )
-    departments = departments_result.scalars().all()
-
-    departments_data = []
-    for dept in departments:
-        # Count staff in this department
-        staff_count_result = await db.execute(
-            select(func.count(DepartmentStaff.user_id))
-            .filter(DepartmentStaff.department_id == dept.id)
-        )
-        staff_count = staff_count_result.scalar_one() or 0
-
-        # Count active applications for this department
-        active_apps_result = await db.execute(
-            select(func.count(PermitApplication.id))
-            .filter(PermitApplication.department_id == dept.id)
-            .filter(
-                PermitApplication.status.in_([
-                    ApplicationStatus.SUBMITTED,
-                    ApplicationStatus.UNDER_REVIEW
-                ])
-            )
-        )
-        active_apps = active_apps_result.scalar_one() or 0
-
-        # Count total applications for this department
-        total_apps_result = await db.execute(
-            select(func.count(PermitApplication.id))
-            .filter(PermitApplication.department_id == dept.id)
-        )
-        total_apps = total_apps_result.scalar_one() or 0
 
-        # Get status breakdown for this department
-        status_counts_result = await db.execute(
-            select(
-                PermitApplication.status,
-                func.count(PermitApplication.id)
-            )
-            .filter(PermitApplication.department_id == dept.id)
-            .group_by(PermitApplication.status)
-        )
-        status_counts = {
-            status.value if hasattr(status, "value") else status: count 
-            for status, count in status_counts_result
-        }
+    # Application counts per department come from the status rollup
+    department_counts = await StatusRollupService.counts_by_department(db, mmda_id)
 
+    departments_data = []
+    for dept, staff_count in departments_result.all():
+        status_counts = department_counts.get(dept.id, {})
         departments_data.append({
             "id": dept.id,
             "name": dept.name,
             "code": dept.code,
             "mmda_id": dept.mmda_id,
-            "staff_count": staff_count,
-            "active_applications": active_apps,
-            "total_applications": total_apps,
+            "staff_count": staff_count or 0,
+            "active_applications": (
+                status_counts.get(ApplicationStatus.SUBMITTED.value, 0)
+                + status_counts.get(ApplicationStatus.UNDER_REVIEW.value, 0)
+            ),
+            "total_applications": sum(status_counts.values()),
             "status_counts": status_counts,
         })
 
-    return {
-        "permits": [
-            {
-                "id": p.id,
-                "application_number": p.application_number,
-                "project_name": p.project_name,
-                "status": p.status.value if hasattr(p.status, "value") else p.status,
-                "permit_type": {
-                    "id": p.permit_type.id,
-                    "name": p.permit_type.name
-                } if p.permit_type else None,
-                "mmda_id": p.mmda_id,
-                "parcel_geometry": serialize_geom(p.parcel_geometry),
-                "latitude": p.latitude,
-                "longitude": p.longitude,
-                "is_personal": p.id in personal_permit_ids,
-                "applicant_name": f"{p.applicant.first_name} {p.applicant.last_name}" if p.applicant else "Unknown",
-                "department_id": p.department_id,
-            }
-            for p in all_permits
-        ],
-        "mmdas": mmdas_data,
-        "departments": departments_data,
-    }
+    return FastJSONResponse(compose({"permits": permits, "mmdas": mmdas_data, "departments": departments_data}))
+
+
+EXPORT_SCOPES = ("admin", "reviewer")
+
+def build_export_filter(
+    scope: str,
+    staff: Principal,
+    statuses: Optional[List[ApplicationStatus]] = None,
+    created_from: Optional[date] = None,
+    created_to: Optional[date] = None,
+):
+    """Work scope of the admin or reviewer map (no personal applications), narrowed by the export filters"""
+    if scope == "reviewer":
+        conditions = [build_reviewer_filter(staff, staff.mmda_id)]
+    else:
+        conditions = [PermitApplication.mmda_id == staff.mmda_id]
+
+    if statuses:
+        conditions.append(PermitApplication.status.in_(statuses))
+    if created_from:
+        conditions.append(PermitApplication.created_at >= created_from)
+    if created_to:
+        # Inclusive of the whole end day
+        conditions.append(PermitApplication.created_at < created_to + timedelta(days=1))
+    return and_(*conditions)
+
+
+@router.get("/export")
+async def export_applications(
+    staff: Principal = Depends(current_staff),
+    format: str = "ndjson",
+    scope: str = "admin",
+    status: Optional[List[ApplicationStatus]] = Query(None),
+    created_from: Optional[date] = None,
+    created_to: Optional[date] = None,
+):
+    """Stream the MMDA's applications as NDJSON or CSV, with the admin (admins only) or reviewer map scope"""
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"Unknown format. Must be one of: {list(EXPORT_FORMATS)}")
+    if scope not in EXPORT_SCOPES:
+        raise HTTPException(status_code=400, detail=f"Unknown scope. Must be one of: {list(EXPORT_SCOPES)}")
+    # The admin scope is every application in the MMDA, applicant details included
+    if scope == "admin" and staff.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Only admins can export the admin scope")
+
+    where = build_export_filter(scope, staff, status, created_from, created_to)
+    filename = f"applications-mmda-{staff.mmda_id}-{scope}.{format}"
+    # From a replica when one is in rotation; read_only=False because the server-side cursor needs a transaction
+    return StreamingResponse(
+        ApplicationExportService.stream(partial(session_manager.get_replica_session, read_only=False), where, format),
+        media_type=EXPORT_FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"', "Cache-Control": "no-store"},
+    )
+
+
+TILE_LAYERS = ("applicant", "reviewer", "inspector", "admin")
+
+def build_tile_scope_filter(layer: str, principal: Principal):
+    """Same role scopes as the dashboard map endpoints, as a single filter"""
+    user_id = principal.user_id
+    personal_filter = PermitApplication.applicant_id == user_id
+    if layer == "applicant":
+        return personal_filter
+
+    if not principal.is_staff:
+        raise HTTPException(status_code=403, detail="User is not a staff member")
+    staff = principal
+    mmda_id = staff.mmda_id
+
+    if layer == "reviewer":
+        work_filter = build_reviewer_filter(staff, mmda_id)
+    elif layer == "inspector":
+        work_filter = build_inspection_ready_filter(mmda_id, user_id)
+    else:
+        work_filter = PermitApplication.mmda_id == mmda_id
+
+    return or_(work_filter, personal_filter)
+
+
+@router.get("/tiles/{layer}/{z}/{x}/{y}.mvt")
+async def get_permit_tile(
+    layer: str,
+    z: int,
+    x: int,
+    y: int,
+    request: Request,
+    principal: Principal = Depends(current_principal),
+    db: AsyncSession = Depends(aget_read_db)
+):
+    """Mapbox Vector Tile of the permits visible on the given dashboard map layer"""
+    user_id = principal.user_id
+
+    if layer not in TILE_LAYERS:
+        raise HTTPException(status_code=404, detail=f"Unknown layer. Must be one of: {list(TILE_LAYERS)}")
+    if not PermitTileService.is_valid_tile(z, x, y):
+        raise HTTPException(status_code=400, detail="Invalid tile coordinates")
+
+    scope_filter = build_tile_scope_filter(layer, principal)
+    etag, tile = await PermitTileService.render(
+        db, scope_filter, layer, z, x, y, user_id,
+        if_none_match=request.headers.get("if-none-match")
+    )
+
+    # Tiles are per user, so only the browser may cache them
+    headers = {"ETag": etag, "Cache-Control": "private, max-age=60, must-revalidate", "Vary": "Cookie"}
+    if tile is None:
+        return Response(status_code=304, headers=headers)
+    return Response(content=tile, media_type=MVT_MEDIA_TYPE, headers=headers)
 
 
 @router.get("/types", response_model=List[PermitTypeWithRequirements])
 async def get_permit_types_with_requirements(
-    db: AsyncSession = Depends(aget_db)
+    request: Request,
+    db: AsyncSession = Depends(aget_replica_db)
 ):
     """
     Get all permit types with their document requirements
     
     Returns:
-        List of permit types with nested document requirements
+        List of permit types with nested document requirements, from the
+        reference data cache (ETag / If-None-Match aware)
     """
-
-    print ("PERMIT REQUEST RECEIVED")
     try:
-        # Query permit types with their requirements and document types
-        result = await db.execute(
-            select(PermitTypeModel)
-            .options(
-                selectinload(PermitTypeModel.required_documents)
-                .selectinload(PermitDocumentRequirement.document_type)
-            )
-            .order_by(PermitTypeModel.name)
-        )
-        
-        permit_types = result.scalars().all()
-        
-        if not permit_types:
-            raise HTTPException(
-                status_code=404,
-                detail="No permit types found"
-            )
-        
-        # Sort requirements by mandatory status (mandatory first)
-        for permit_type in permit_types:
-            permit_type.required_documents.sort(
-                key=lambda x: (not x.is_mandatory, x.document_type.name)
-            )
-        
-        return permit_types
-        
+        entry = await reference_cache.get(db, "permit_types_with_requirements")
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"Error fetching permit types: {str(e)}"
         )
+
+    if not entry.count:
+        raise HTTPException(
+            status_code=404,
+            detail="No permit types found"
+        )
+    return reference_cache.respond(request, entry)
     
 # Get Permit Type by ID 
 @router.get("/types/{permit_type_id}", response_model=PermitTypeWithRequirements)
 async def get_permit_type_by_id(
     permit_type_id: str,
-    db: AsyncSession = Depends(aget_db)
+    db: AsyncSession = Depends(aget_replica_db)
 ):
     """
     Get a specific permit type by ID with its document requirements
@@ -928,8 +593,6 @@ async def get_permit_type_by_id(
         HTTPException: 404 if permit type not found
         HTTPException: 500 if database error occurs
     """
-    print(f"PERMIT TYPE REQUEST RECEIVED FOR ID: {permit_type_id}")
-    
     try:
         # Query permit type with its requirements and document types
         result = await db.execute(
@@ -963,75 +626,47 @@ async def get_permit_type_by_id(
         )
 
 @router.get("/permit-types", response_model=List[PermitTypeOut])
-async def get_permit_types(db: AsyncSession = Depends(aget_db)):
-    result = await db.execute(select(PermitTypeModel).where(PermitTypeModel.is_active == True))
-    return result.scalars().all()
+async def get_permit_types(request: Request, db: AsyncSession = Depends(aget_replica_db)):
+    return reference_cache.respond(request, await reference_cache.get(db, "permit_types"))
 
 
 @router.get("/zoning-districts", response_model=List[ZoningDistrictOut])
-async def get_all_zoning_districts(db: AsyncSession = Depends(aget_db)):
+async def get_all_zoning_districts(request: Request, db: AsyncSession = Depends(aget_replica_db)):
     try:
-        result = await db.execute(
-            select(ZoningDistrict)
-            .order_by(ZoningDistrict.name)
-        )
-        districts = result.scalars().all()
-
-        # Remove spatial_data explicitly (not included in schema anyway)
-        for d in districts:
-            d.spatial_data = None  # Optional: strip it if you want
-
-        return districts
-
+        return reference_cache.respond(request, await reference_cache.get(db, "zoning_districts"))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to load zoning districts: {str(e)}")
 
 @router.get("/zoning-uses", response_model=List[ZoningPermittedUseOut])
 async def get_zoning_uses(
+    request: Request,
     zoning_district_id: Optional[int] = None,
-    db: AsyncSession = Depends(aget_db)
+    db: AsyncSession = Depends(aget_replica_db)
 ):
     try:
-        query = (
-            select(ZoningPermittedUse)
-            .options(
-                selectinload(ZoningPermittedUse.required_documents)
-                .selectinload(ZoningUseDocumentRequirement.document_type)
-            )
-        )
-
-        if zoning_district_id:
-            query = query.where(ZoningPermittedUse.zoning_district_id == zoning_district_id)
-
-        result = await db.execute(query)
-        uses = result.scalars().all()
-        return uses
-
+        return reference_cache.respond(request, await reference_cache.get(db, "zoning_uses", zoning_district_id or None))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to load zoning uses: {str(e)}")
 
 
 @router.get("/drainage-types", response_model=List[DrainageTypeOut])
-async def get_all_drainage_types(db: AsyncSession = Depends(aget_db)):
+async def get_all_drainage_types(request: Request, db: AsyncSession = Depends(aget_replica_db)):
     try:
-        result = await db.execute(select(DrainageType).order_by(DrainageType.name))
-        return result.scalars().all()
+        return reference_cache.respond(request, await reference_cache.get(db, "drainage_types"))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch drainage types: {str(e)}")
 
 
 @router.get("/site-conditions", response_model=List[SiteConditionOut])
-async def get_site_conditions(db: AsyncSession = Depends(aget_db)):
+async def get_site_conditions(request: Request, db: AsyncSession = Depends(aget_replica_db)):
     try:
-        result = await db.execute(select(SiteCondition).order_by(SiteCondition.name))
-        return result.scalars().all()
+        return reference_cache.respond(request, await reference_cache.get(db, "site_conditions"))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to load site conditions: {str(e)}")
     
 @router.get("/previous-land-uses", response_model=List[PreviousLandUseOut])
-async def get_previous_land_uses(db: AsyncSession = Depends(aget_db)):
+async def get_previous_land_uses(request: Request, db: AsyncSession = Depends(aget_replica_db)):
     try:
-        result = await db.execute(select(PreviousLandUse).order_by(PreviousLandUse.name))
-        return result.scalars().all()
+        return reference_cache.respond(request, await reference_cache.get(db, "previous_land_uses"))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to load previous land uses: {str(e)}")
\ No newline at end of file
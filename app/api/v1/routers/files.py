@@ -0,0 +1,58 @@
+# app/api/routes/files.py
+#
+# Serves and accepts files for the local storage backend. With S3 the files
+# live at AWS_S3_BASE_URL instead and these routes answer 404.
+
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import FileResponse
+from app.services.storage import get_storage
+from app.services.storage.local import LocalStorageBackend
+
+router = APIRouter(prefix="/files", tags=["files"])
+
+
+def get_local_storage() -> LocalStorageBackend:
+    storage = get_storage()
+    if not isinstance(storage, LocalStorageBackend):
+        raise HTTPException(status_code=404, detail="Not found")
+    return storage
+
+
+@router.get("/{key:path}")
+async def get_file(key: str):
+    storage = get_local_storage()
+    try:
+        path = storage.path_for(key)
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Not found")
+    if not path.is_file():
+        raise HTTPException(status_code=404, detail="Not found")
+
+    # FileResponse lets the server use sendfile when it supports it
+    head = await storage.head(key)
+    return FileResponse(path, media_type=head["content_type"] if head else None)
+
+
+@router.put("/{key:path}")
+async def put_file(
+    key: str,
+    request: Request,
+    expires: int = Query(...),
+    max_size: int = Query(...),
+    signature: str = Query(...),
+):
+    """Target of a presigned upload URL issued by the local storage backend"""
+    storage = get_local_storage()
+    content_type = request.headers.get("content-type", "")
+    if not storage.verify_signature(key, content_type, max_size, expires, signature):
+        raise HTTPException(status_code=403, detail="Invalid or expired upload URL")
+
+    declared = request.headers.get("content-length")
+    if declared and declared.isdigit() and int(declared) > max_size:
+        raise HTTPException(status_code=413, detail="File is too large")
+
+    try:
+        await storage.write_chunks(key, request.stream(), max_size=max_size)
+    except ValueError as e:
+        raise HTTPException(status_code=413 if "large" in str(e) else 400, detail=str(e))
+    return {"key": key}
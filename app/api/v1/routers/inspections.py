@@ -7,6 +7,7 @@ from sqlalchemy import func, select
 from sqlalchemy.orm import joinedload, selectinload
 from datetime import datetime, timezone
 
+from app.api.dependencies import current_principal
 from app.core.constants import ApplicationStatus, InspectionOutcome, UserRole
 from app.core.database import aget_db
 from app.models.document import ApplicationDocument
@@ -14,7 +15,8 @@ from app.models.inspection import Inspection, InspectionPhoto, InspectionStatus,
 from app.models.application import ApplicationStatusHistory, PermitApplication
 from app.models.user import MMDA, User
 from app.schemas.InspectionSchema import InspectionCompleteIn, InspectionDetailOut, InspectionOut, InspectionPhotoOut, InspectionRequest, InspectorViolationOut, PaginatedViolationsOut
-from app.core.security import decode_jwt_token
+from app.services.principal import Principal
+from app.services.status_rollup import StatusRollupService
 from app.schemas.permit_application import ApplicationDocumentOut  # make sure this function exists
 
 router = APIRouter(
@@ -24,19 +26,11 @@ router = APIRouter(
 
 @router.post("/request", status_code=status.HTTP_201_CREATED)
 async def request_inspection(
-    request: Request,
     payload: InspectionRequest,
+    principal: Principal = Depends(current_principal),
     db: AsyncSession = Depends(aget_db),
 ):
-    token = request.cookies.get("auth_token")
-    if not token:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-
-    try:
-        decoded = decode_jwt_token(token)
-        user_id = int(decoded.get("sub"))
-    except Exception:
-        raise HTTPException(status_code=401, detail="Invalid token")
+    user_id = principal.user_id
 
     app_result = await db.execute(
         select(PermitApplication)
@@ -73,19 +67,10 @@ async def request_inspection(
 
 @router.get("/user")
 async def get_user_inspections(
-    request: Request,
+    principal: Principal = Depends(current_principal),
     db: AsyncSession = Depends(aget_db),
 ):
-    token = request.cookies.get("auth_token")
-    if not token:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-
-    try:
-        decoded = decode_jwt_token(token)
-        user_id = int(decoded.get("sub"))
-        user_role = decoded.get("role")  # make sure you include this in your token
-    except Exception:
-        raise HTTPException(status_code=401, detail="Invalid token")
+    user_id = principal.user_id
 
     # Inspections requested by this user
     requested_stmt = (
@@ -101,7 +86,7 @@ async def get_user_inspections(
     requested_inspections = requested_result.scalars().unique().all()
 
     assigned_inspections = []
-    if user_role == "inspection_officer":
+    if principal.role == UserRole.INSPECTION_OFFICER:
         assigned_stmt = (
             select(Inspection)
             .options(
@@ -124,20 +109,10 @@ async def get_user_inspections(
 @router.get("/{inspection_id}", response_model=InspectionDetailOut)
 async def get_inspection_detail(
     inspection_id: int,
-    request: Request,
+    principal: Principal = Depends(current_principal),
     db: AsyncSession = Depends(aget_db),
 ):
-    # Verify authentication
-    token = request.cookies.get("auth_token")
-    if not token:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-
     try:
-        # Decode token to verify user
-        payload = decode_jwt_token(token)
-        user_id = payload.get("sub")
-        user_role = payload.get("role")
-
         # Get inspection with all relationships loaded
         stmt = (
             select(Inspection)
@@ -223,24 +198,10 @@ async def get_inspection_detail(
 @router.get("/{inspection_id}/documents", response_model=List[ApplicationDocumentOut])
 async def get_inspection_documents(
     inspection_id: int,
-    request: Request,
+    principal: Principal = Depends(current_principal),
     db: AsyncSession = Depends(aget_db)
 ):
-    # Verify authentication
-    token = request.cookies.get("auth_token")
-    if not token:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-
-    payload = decode_jwt_token(token)
-    user_id = int(payload.get("sub"))
-
-    # 🔍 Get actual user role from DB
-    user_result = await db.execute(
-        select(User.role).where(User.id == user_id)
-    )
-    user_role = user_result.scalar_one_or_none()
-
-    if user_role != UserRole.INSPECTION_OFFICER:
+    if principal.role != UserRole.INSPECTION_OFFICER:
         raise HTTPException(
             status_code=403,
             detail="Only inspectors can access inspection documents"
@@ -271,23 +232,11 @@ async def get_inspection_documents(
 @router.get("/{inspection_id}/photos", response_model=List[InspectionPhotoOut])
 async def get_inspection_photos(
     inspection_id: int,
-    request: Request,
+    principal: Principal = Depends(current_principal),
     db: AsyncSession = Depends(aget_db)
 ):
-    # Verify authentication
-    token = request.cookies.get("auth_token")
-    if not token:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-
-    try:
-        payload = decode_jwt_token(token)
-        user_id = int(payload.get("sub"))
-    except Exception:
-        raise HTTPException(status_code=401, detail="Invalid or expired token")
-
     # Verify user is inspection officer
-    user = await db.get(User, user_id)
-    if not user or user.role != UserRole.INSPECTION_OFFICER:
+    if principal.role != UserRole.INSPECTION_OFFICER:
         raise HTTPException(
             status_code=403,
             detail="Only inspection officers can access inspection photos"
@@ -314,28 +263,19 @@ from fastapi import status
 @router.post("/{inspection_id}/complete", status_code=status.HTTP_200_OK)
 async def complete_inspection(
     inspection_id: int,
-    request: Request,
     inspection_data: InspectionCompleteIn,
+    principal: Principal = Depends(current_principal),
     db: AsyncSession = Depends(aget_db)
 ):
-    # Authentication
-    token = request.cookies.get("auth_token")
-    if not token:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-
-    try:
-        payload = decode_jwt_token(token)
-        user_id = int(payload.get("sub"))
-    except Exception:
-        raise HTTPException(status_code=401, detail="Invalid or expired token")
-
     # Authorization - must be inspection officer
-    user = await db.get(User, user_id)
-    if not user or user.role != UserRole.INSPECTION_OFFICER:
+    if principal.role != UserRole.INSPECTION_OFFICER:
         raise HTTPException(
             status_code=403,
             detail="Only inspection officers can complete inspections"
         )
+    user_id = principal.user_id
+    # Full row for the officer's name in the history note
+    user = await db.get(User, user_id)
 
     # Get inspection with application relationship loaded
     inspection = await db.execute(
@@ -374,16 +314,20 @@ async def complete_inspection(
 
     # Update application status to INSPECTION_COMPLETED
     if inspection.application:
+        previous_status = await StatusRollupService.lock_status(db, inspection.application.id)
         inspection.application.status = ApplicationStatus.INSPECTION_COMPLETED
         # Add status history record
         status_history = ApplicationStatusHistory(
             application_id=inspection.application.id,
-            from_status=inspection.application.status,
+            from_status=previous_status,
             to_status=ApplicationStatus.INSPECTION_COMPLETED,
             changed_by_id=user_id,
             notes=f"Inspection completed by {user.first_name} {user.last_name}"
         )
         db.add(status_history)
+        await StatusRollupService.record_transition(
+            db, inspection.application, previous_status, ApplicationStatus.INSPECTION_COMPLETED
+        )
 
     # Handle photos (create records for any new photos)
     if inspection_data.photos:
@@ -410,20 +354,10 @@ async def complete_inspection(
 @router.get("/application/{application_id}", response_model=InspectionDetailOut)
 async def get_inspection_by_application(
     application_id: int,
-    request: Request,
+    principal: Principal = Depends(current_principal),
     db: AsyncSession = Depends(aget_db),
 ):
-    # Verify authentication
-    token = request.cookies.get("auth_token")
-    if not token:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-
     try:
-        # Decode token to verify user
-        payload = decode_jwt_token(token)
-        user_id = payload.get("sub")
-        user_role = payload.get("role")
-
         # Get inspection for this application with all relationships loaded
         stmt = (
             select(Inspection)
@@ -514,25 +448,14 @@ from fastapi import HTTPException
 @router.post("/reviewer-schedule", status_code=201)
 async def reviewer_schedule_inspection(
     request: Request,
+    principal: Principal = Depends(current_principal),
     db: AsyncSession = Depends(aget_db),
 ):
     try:
-        # Authentication
-        token = request.cookies.get("auth_token")
-        if not token:
-            raise HTTPException(status_code=401, detail="Not authenticated")
-
-        try:
-            payload = decode_jwt_token(token)
-            user_id = int(payload.get("sub"))
-        except Exception as e:
-            traceback.print_exc()
-            raise HTTPException(status_code=401, detail="Invalid or expired token")
+        user_id = principal.user_id
 
         # Authorization - must be reviewer
-        user = await db.get(User, user_id)
-        print("user", user.role != UserRole.REVIEW_OFFICER)
-        if not user or user.role != UserRole.REVIEW_OFFICER:
+        if principal.role != UserRole.REVIEW_OFFICER:
             raise HTTPException(
                 status_code=403,
                 detail="Only reviewers can schedule inspections"
@@ -542,24 +465,20 @@ async def reviewer_schedule_inspection(
         body = await request.json()
         
         application_id = body.get("application_id")
-        print("Application: ", application_id)
         if not application_id:
             raise HTTPException(status_code=400, detail="application_id is required")
 
         inspection_date = body.get("scheduled_date")
 
-        print("Application: ", application_id)
         if not inspection_date:
             raise HTTPException(status_code=400, detail="inspection_date is required")
 
-        print("Application: ", application_id)
         try:
             dt = datetime.fromisoformat(inspection_date.replace("Z", "+00:00"))
             inspection_dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
 
             if inspection_dt < datetime.utcnow():
                 raise HTTPException(status_code=400, detail="Inspection date must be in the future")
-            print("Application: ", application_id)
             
         except ValueError as e:
             traceback.print_exc()
@@ -574,6 +493,7 @@ async def reviewer_schedule_inspection(
             select(PermitApplication)
             .where(PermitApplication.id == application_id)
             .options(selectinload(PermitApplication.applicant))
+            .with_for_update(of=PermitApplication)
         )
         application = result.scalar_one_or_none()
         
@@ -597,18 +517,22 @@ async def reviewer_schedule_inspection(
         db.add(inspection)
 
         # --- Step 5: Update application status ---
+        previous_status = application.status
         application.status = ApplicationStatus.INSPECTION_PENDING
         application.updated_at = datetime.utcnow()
 
         # --- Step 6: Record status history ---
         status_history = ApplicationStatusHistory(
             application_id=application_id,
-            from_status=application.status,
+            from_status=previous_status,
             to_status=ApplicationStatus.INSPECTION_PENDING,
             changed_by_id=user_id,
             notes=f"Inspection scheduled for {inspection_dt.isoformat()}",
         )
         db.add(status_history)
+        await StatusRollupService.record_transition(
+            db, application, previous_status, ApplicationStatus.INSPECTION_PENDING
+        )
 
         await db.commit()
 
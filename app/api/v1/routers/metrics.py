@@ -1,13 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends
 from sqlalchemy import func, extract
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from datetime import datetime, timedelta
 
 from app.core.constants import ReviewStatus
-from app.core.database import aget_db
+from app.api.dependencies import current_principal
+from app.core.database import aget_replica_db
 from app.models.review import ApplicationReview, ApplicationReviewStep
-from app.core.security import decode_jwt_token
+from app.services.principal import Principal
 
 router = APIRouter(
     prefix="/metrics",
@@ -17,19 +18,10 @@ router = APIRouter(
 
 @router.get("/reviewer/metrics")
 async def get_reviewer_metrics(
-    request: Request,
-    db: AsyncSession = Depends(aget_db),
+    principal: Principal = Depends(current_principal),
+    db: AsyncSession = Depends(aget_replica_db),
 ):
-    # Authenticate reviewer
-    token = request.cookies.get("auth_token")
-    if not token:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-
-    try:
-        payload = decode_jwt_token(token)
-        user_id = int(payload.get("sub"))
-    except Exception:
-        raise HTTPException(status_code=401, detail="Invalid token")
+    user_id = principal.user_id
 
     now = datetime.now()
     today_start = datetime.combine(now.date(), datetime.min.time())
@@ -1,19 +1,25 @@
 from datetime import datetime, time, timedelta
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import and_, case, distinct, func, or_, select
-from sqlalchemy.orm import joinedload
 from app.core.constants import ApplicationStatus, InspectionStatus, ReviewStatus
-from app.core.database import aget_db
-from app.core.security import decode_jwt_token
+from app.api.dependencies import current_staff
+from app.core.database import aget_replica_db
 from app.models.application import PermitApplication
 from app.models.document import PermitTypeModel
 from app.models.inspection import Inspection
 from app.models.review import ApplicationReview
-from app.models.user import MMDA, Committee, CommitteeMember, Department, DepartmentStaff, User
+from app.models.user import MMDA, Committee, Department, DepartmentStaff, User
 from app.schemas.User import CommitteeBase, DepartmentBase
 from app.schemas.mmda import MMDABase  # You’ll need this schema
+from app.services.location_resolver import location_resolver
+from app.services.principal import Principal
+from app.services.mmda_boundaries import MMDABoundaryService
+from app.services.reference_cache import reference_cache
+from app.services.reviewer_queue import ReviewerQueueService
+from app.services.reviewer_stats import ReviewerStatsService
+from app.services.status_rollup import StatusRollupService
 
 router = APIRouter(
     prefix="/mmdas",
@@ -21,19 +27,38 @@ router = APIRouter(
 )
 
 @router.get("/", response_model=List[MMDABase])
-async def get_all_mmdas(db: AsyncSession = Depends(aget_db)):
-    result = await db.execute(select(MMDA))
-    mmdas = result.scalars().all()
-    return mmdas
+async def get_all_mmdas(
+    request: Request,
+    db: AsyncSession = Depends(aget_replica_db),
+    zoom: Optional[int] = None,
+    detail: Optional[str] = None
+):
+    """All MMDAs; pass ?detail=high|medium|low or ?zoom= for simplified boundaries"""
+    try:
+        boundary_detail = MMDABoundaryService.resolve_detail(detail, zoom)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    # One cached body per detail level
+    return reference_cache.respond(request, await reference_cache.get(db, "mmdas", boundary_detail))
+
+@router.get("/locate")
+async def locate_mmda(
+    lat: float = Query(..., ge=-90, le=90),
+    lng: float = Query(..., ge=-180, le=180),
+    db: AsyncSession = Depends(aget_replica_db)
+):
+    """Which MMDA and zoning district contain this point. Cheap enough to call on every pin drag."""
+    return await location_resolver.locate(db, lat, lng)
 
 @router.get("/{mmda_id}/departments", response_model=List[DepartmentBase])
-async def get_mmda_departments(mmda_id: int, db: AsyncSession = Depends(aget_db)):
+async def get_mmda_departments(mmda_id: int, db: AsyncSession = Depends(aget_replica_db)):
     result = await db.execute(select(Department).where(Department.mmda_id == mmda_id))
     departments = result.scalars().all()
     return departments
 
 @router.get("/{mmda_id}/committees", response_model=List[CommitteeBase])
-async def get_mmda_committees(mmda_id: int, db: AsyncSession = Depends(aget_db)):
+async def get_mmda_committees(mmda_id: int, db: AsyncSession = Depends(aget_replica_db)):
     result = await db.execute(select(Committee).where(Committee.mmda_id == mmda_id))
     committees = result.scalars().all()
     return committees
@@ -41,345 +66,92 @@ async def get_mmda_committees(mmda_id: int, db: AsyncSession = Depends(aget_db))
 
 @router.get("/dashboard/reviewer-stats")
 async def get_reviewer_stats(
-    request: Request, 
-    db: AsyncSession = Depends(aget_db)
+    staff: Principal = Depends(current_staff),
+    db: AsyncSession = Depends(aget_replica_db)
 ):
     """Get statistics for reviewer dashboard, filtered by department and committee assignments"""
-    # Authentication
-    token = request.cookies.get("auth_token")
-    if not token:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    
-    try:
-        payload = decode_jwt_token(token)
-        user_id = int(payload.get("sub"))
-    except Exception:
-        raise HTTPException(status_code=401, detail="Invalid token")
-
-    # Get reviewer's department and committee assignments
-    staff_result = await db.execute(
-        select(DepartmentStaff)
-        .join(Department)
-        .options(
-            joinedload(DepartmentStaff.department),
-            joinedload(DepartmentStaff.committee_memberships)
-            .joinedload(CommitteeMember.committee)
-        )
-        .where(DepartmentStaff.user_id == user_id)
-    )
-    staff = staff_result.scalars().first()
-    
-    if not staff:
-        raise HTTPException(status_code=403, detail="User is not a staff member")
-
-    now = datetime.now()
-    today_start = datetime.combine(now.date(), time.min)
-    today_end = datetime.combine(now.date(), time.max)
+    user_id = staff.user_id
 
     # Base filter for applications this reviewer should see
     base_filter = and_(
-        PermitApplication.mmda_id == staff.department.mmda_id,
+        PermitApplication.mmda_id == staff.mmda_id,
         PermitApplication.department_id == staff.department_id
     )
 
     if not staff.is_head:
         # Regular reviewers only see applications from their committees
-        committee_ids = [cm.committee.id for cm in staff.committee_memberships]
         base_filter = and_(
             base_filter,
             or_(
-                PermitApplication.committee_id.in_(committee_ids),
+                PermitApplication.committee_id.in_(staff.committee_ids),
                 PermitApplication.committee_id.is_(None)  # Department-only reviews
             )
         )
 
-    # 1. Pending Reviews (filtered by department/committee)
-    pending_result = await db.execute(
-        select(func.count(PermitApplication.id))
-        .where(
-            base_filter,
-            PermitApplication.status == ApplicationStatus.SUBMITTED
-        )
-    )
-    pending_review = pending_result.scalar_one() or 0
-
-    # 2. Overdue Applications (filtered by department/committee)
-    permits_with_duration = await db.execute(
-        select(
-            PermitApplication.id,
-            PermitApplication.status,
-            PermitApplication.submitted_at,
-            PermitTypeModel.standard_duration_days
-        )
-        .join(PermitTypeModel)
-        .where(base_filter)
-    )
-
-    overdue_count = 0
-    for permit in permits_with_duration:
-        if not permit.submitted_at:
-            continue
-            
-        time_in_review = now - permit.submitted_at
-        standard_duration = permit.standard_duration_days or 30  # Default 30 days
-
-        if (permit.status == ApplicationStatus.SUBMITTED and time_in_review > timedelta(days=2)):
-            overdue_count += 1
-        elif (permit.status == ApplicationStatus.UNDER_REVIEW and 
-              time_in_review > timedelta(days=standard_duration / 2)):
-            overdue_count += 1
-        elif time_in_review > timedelta(days=standard_duration):
-            overdue_count += 1
-
-    # 3. Completed Today - Department/Committee scope
-    completed_today_result = await db.execute(
-        select(func.count(PermitApplication.id))
-        .where(
-            base_filter,
-            or_(
-                PermitApplication.status == ApplicationStatus.APPROVED,
-                PermitApplication.status == ApplicationStatus.REJECTED
-            ),
-            PermitApplication.updated_at.between(today_start, today_end)
-        )
-    )
-    completed_today = completed_today_result.scalar_one() or 0
-
-    # 4. Reviewer's Completed Today
-    completed_today_reviewer_result = await db.execute(
-        select(func.count())
-        .select_from(ApplicationReview)
-        .join(PermitApplication, ApplicationReview.application_id == PermitApplication.id)
-        .where(
-            ApplicationReview.review_officer_id == user_id,
-            ApplicationReview.status == ReviewStatus.COMPLETED,
-            ApplicationReview.updated_at.between(today_start, today_end),
-            base_filter  # Ensure it's within reviewer's scope
-        )
-    )
-    completed_today_reviewer = completed_today_reviewer_result.scalar_one() or 0
-
-    # 5. Average Review Time - Department/Committee scope
-    avg_review_time_result = await db.execute(
-        select(
-            func.avg(
-                func.extract('epoch', PermitApplication.updated_at - PermitApplication.submitted_at) / 86400
-            )
-        )
-        .where(
-            base_filter,
-            or_(
-                PermitApplication.status == ApplicationStatus.APPROVED,
-                PermitApplication.status == ApplicationStatus.REJECTED
-            ),
-            PermitApplication.submitted_at.isnot(None)
-        )
-    )
-    avg_review_time = avg_review_time_result.scalar_one() or 0
-    avg_review_time_rounded = round(float(avg_review_time), 1) if avg_review_time else 0
-
-    # 6. Reviewer's Average Review Time
-    avg_reviewer_time_result = await db.execute(
-        select(
-            func.avg(
-                func.extract('epoch', ApplicationReview.updated_at - ApplicationReview.created_at) / 86400
-            )
-        )
-        .join(PermitApplication, ApplicationReview.application_id == PermitApplication.id)
-        .where(
-            ApplicationReview.review_officer_id == user_id,
-            ApplicationReview.status == ReviewStatus.COMPLETED,
-            base_filter  # Ensure it's within reviewer's scope
-        )
-    )
-    avg_reviewer_time = avg_reviewer_time_result.scalar_one() or 0
-    avg_reviewer_time_rounded = round(float(avg_reviewer_time), 1) if avg_reviewer_time else 0
-
-    return {
-        "pending_review": pending_review,
-        "overdue": overdue_count,
-        "completed_today": completed_today,
-        "completed_today_reviewer": completed_today_reviewer,
-        "avg_review_time_days": avg_review_time_rounded,
-        "avg_review_time_days_reviewer": avg_reviewer_time_rounded,
-        # "department": staff.department.name,
-        # "is_department_head": staff.is_head,
-        # "committee_count": len(staff.committee_memberships)
-    }
+    return await ReviewerStatsService.get_reviewer_stats(db, base_filter, user_id)
 
 
 
 @router.get("/dashboard/reviewer-queue")
 async def get_reviewer_queue(
-    request: Request, 
-    db: AsyncSession = Depends(aget_db),
-    status: Optional[ApplicationStatus] = None
+    staff: Principal = Depends(current_staff),
+    db: AsyncSession = Depends(aget_replica_db),
+    status: Optional[ApplicationStatus] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=200)
 ):
     """
     Get applications in the reviewer's queue, filtered by their department and committee assignments.
-    """
-    # Authentication
-    token = request.cookies.get("auth_token")
-    if not token:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    
-    try:
-        payload = decode_jwt_token(token)
-        user_id = int(payload.get("sub"))
-    except Exception:
-        raise HTTPException(status_code=401, detail="Invalid token")
-
-    # Get reviewer's department and committee assignments
-    staff_result = await db.execute(
-        select(DepartmentStaff)
-        .join(Department)
-        .options(
-            joinedload(DepartmentStaff.department)
-            .joinedload(Department.mmda),
-            joinedload(DepartmentStaff.committee_memberships)
-            .joinedload(CommitteeMember.committee)
-        )
-        .where(DepartmentStaff.user_id == user_id)
-    )
-    staff = staff_result.scalars().first()
-    
-    if not staff:
-        raise HTTPException(status_code=403, detail="User is not a staff member")
 
-    # Get current date and time
-    now = datetime.now()
-
-    # Base query with all necessary joins
-    query = (
-        select(
-            PermitApplication.id,
-            PermitApplication.application_number,
-            PermitTypeModel.name.label("permit_type"),
-            User.first_name,
-            User.last_name,
-            PermitApplication.submitted_at,
-            PermitApplication.created_at,
-            PermitApplication.status,
-            PermitTypeModel.standard_duration_days,
-            Department.name.label("department_name"),
-            Committee.name.label("committee_name")
-        )
-        .join(PermitTypeModel, PermitApplication.permit_type_id == PermitTypeModel.id)
-        .join(User, PermitApplication.applicant_id == User.id)
-        .join(Department, PermitApplication.department_id == Department.id)
-        .join(Committee, PermitApplication.committee_id == Committee.id)
-        .where(PermitApplication.mmda_id == staff.department.mmda_id)
-    )
+    Ordered by priority (high first) then days in queue, one page at a time.
+    Pass the returned next_cursor back as `cursor` to fetch the following page.
+    """
+    # Applications in the reviewer's MMDA
+    scope_filter = PermitApplication.mmda_id == staff.mmda_id
 
     # Filter by status if provided
     if status:
-        query = query.where(PermitApplication.status == status)
+        scope_filter = and_(scope_filter, PermitApplication.status == status)
     else:
-        query = query.where(
-            or_(
-                PermitApplication.status == ApplicationStatus.SUBMITTED,
-                PermitApplication.status == ApplicationStatus.UNDER_REVIEW
-            )
+        scope_filter = and_(
+            scope_filter,
+            PermitApplication.status.in_([
+                ApplicationStatus.SUBMITTED,
+                ApplicationStatus.UNDER_REVIEW
+            ])
         )
 
     # Filter by reviewer's department and committees
     if staff.is_head:
         # Department heads see all applications in their department
-        query = query.where(PermitApplication.department_id == staff.department_id)
+        scope_filter = and_(scope_filter, PermitApplication.department_id == staff.department_id)
     else:
         # Regular reviewers see applications where:
         # 1. They're assigned to the department AND
         # 2. They're members of the committee OR it's a department-level review
-        committee_ids = [cm.committee.id for cm in staff.committee_memberships]
-        query = query.where(
-            and_(
-                PermitApplication.department_id == staff.department_id,
-                or_(
-                    PermitApplication.committee_id.in_(committee_ids),
-                    PermitApplication.committee_id.is_(None)  # Department-only reviews
-                )
+        scope_filter = and_(
+            scope_filter,
+            PermitApplication.department_id == staff.department_id,
+            or_(
+                PermitApplication.committee_id.in_(staff.committee_ids),
+                PermitApplication.committee_id.is_(None)  # Department-only reviews
             )
         )
 
-    # Execute the query
-    result = await db.execute(query)
-    applications = result.all()
-
-    # Process applications into queue data
-    queue_data = []
-    for app in applications:
-        # Calculate days in queue
-        submitted_date = app.submitted_at or app.created_at
-        days_in_queue = (now - submitted_date).days
-        standard_duration = app.standard_duration_days or 30  # Default 30 days if not set
-
-        # Determine priority
-        if app.status == ApplicationStatus.SUBMITTED and days_in_queue > 2:
-            priority = "high"
-        elif (app.status == ApplicationStatus.UNDER_REVIEW and 
-              days_in_queue > (standard_duration / 2)):
-            priority = "high"
-        elif days_in_queue > standard_duration:
-            priority = "high"
-        elif (app.status == ApplicationStatus.UNDER_REVIEW and 
-              days_in_queue > (standard_duration / 4)):
-            priority = "medium"
-        else:
-            priority = "low"
-
-        queue_data.append({
-            "permit_no": app.application_number,
-            "type": app.permit_type,
-            "applicant": f"{app.first_name} {app.last_name}",
-            "days_in_queue": days_in_queue,
-            "priority": priority,
-            "permit_id": app.id,
-            "has_submission_date": submitted_date.isoformat(),
-        })
-
-    # Sort by priority (high first) and days in queue (descending)
-    queue_data.sort(key=lambda x: (
-        -1 if x["priority"] == "high" else 
-        -0.5 if x["priority"] == "medium" else 0,
-        -x["days_in_queue"]
-    ))
-
-    return queue_data[:100]  # Return top 100 by default
+    try:
+        return await ReviewerQueueService.get_queue_page(db, scope_filter, limit, cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
 
 
 @router.get("/dashboard/inspection-stats")
 async def get_inspection_stats(
-    request: Request, 
-    db: AsyncSession = Depends(aget_db)
+    staff: Principal = Depends(current_staff),
+    db: AsyncSession = Depends(aget_replica_db)
 ):
     """Get statistics for inspector dashboard, filtered by department assignments"""
-    # Authentication
-    token = request.cookies.get("auth_token")
-    if not token:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    
-    try:
-        payload = decode_jwt_token(token)
-        user_id = int(payload.get("sub"))
-    except Exception:
-        raise HTTPException(status_code=401, detail="Invalid token")
-
-    # Get inspector's department and MMDA info
-    staff_result = await db.execute(
-        select(DepartmentStaff)
-        .join(Department)
-        .options(
-            joinedload(DepartmentStaff.department)
-            .joinedload(Department.mmda)
-        )
-        .where(DepartmentStaff.user_id == user_id)
-    )
-    staff = staff_result.scalars().first()
-    
-    if not staff:
-        raise HTTPException(status_code=403, detail="User is not a staff member")
-
-    mmda_id = staff.department.mmda_id
+    user_id = staff.user_id
+    mmda_id = staff.mmda_id
     now = datetime.now()
     today_start = datetime.combine(now.date(), time.min)
     today_end = datetime.combine(now.date(), time.max)
@@ -539,38 +311,13 @@ async def get_inspection_stats(
 
 @router.get("/inspections/dashboard/inspector-queue")
 async def get_inspector_queue(
-    request: Request, 
-    db: AsyncSession = Depends(aget_db),
+    staff: Principal = Depends(current_staff),
+    db: AsyncSession = Depends(aget_replica_db),
     status: Optional[InspectionStatus] = None
 ):
     """Get inspections in the inspector's queue, filtered by their department assignments"""
-    # Authentication
-    token = request.cookies.get("auth_token")
-    if not token:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    
-    try:
-        payload = decode_jwt_token(token)
-        user_id = int(payload.get("sub"))
-    except Exception:
-        raise HTTPException(status_code=401, detail="Invalid token")
-
-    # Get inspector's department and MMDA info
-    staff_result = await db.execute(
-        select(DepartmentStaff)
-        .join(Department)
-        .options(
-            joinedload(DepartmentStaff.department)
-            .joinedload(Department.mmda)
-        )
-        .where(DepartmentStaff.user_id == user_id)
-    )
-    staff = staff_result.scalars().first()
-    
-    if not staff:
-        raise HTTPException(status_code=403, detail="User is not a staff member")
-
-    mmda_id = staff.department.mmda_id
+    user_id = staff.user_id
+    mmda_id = staff.mmda_id
 
     # Get current date and time
     now = datetime.now()
@@ -667,30 +414,8 @@ async def get_inspector_queue(
 # Admin Dashboard Endpoints
 
 @router.get("/dashboard/admin-stats")
-async def get_admin_stats(request: Request, db: AsyncSession = Depends(aget_db)):
-    token = request.cookies.get("auth_token")
-    if not token:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    
-    try:
-        payload = decode_jwt_token(token)
-        user_id = int(payload.get("sub"))
-
-        # Get the admin's department and MMDA info
-        staff_result = await db.execute(
-            select(DepartmentStaff)
-            .join(Department)
-            .options(joinedload(DepartmentStaff.department).joinedload(Department.mmda))
-            .filter(DepartmentStaff.user_id == user_id)
-        )
-        staff = staff_result.scalars().first()
-
-        if not staff:
-            raise HTTPException(status_code=403, detail="User is not a staff member")
-
-        mmda_id = staff.department.mmda_id
-    except Exception:
-        raise HTTPException(status_code=401, detail="Invalid token")
+async def get_admin_stats(staff: Principal = Depends(current_staff), db: AsyncSession = Depends(aget_replica_db)):
+    mmda_id = staff.mmda_id
 
     now = datetime.now()
     today_start = datetime.combine(now.date(), time.min)
@@ -717,18 +442,16 @@ async def get_admin_stats(request: Request, db: AsyncSession = Depends(aget_db))
     total_users = len(unique_user_ids)
 
 
+    # Status counts come from the incrementally maintained rollup
+    mmda_status_counts = (
+        await StatusRollupService.counts_by_mmda(db, [mmda_id])
+    )[mmda_id]
+
     # 2. Active Applications
-    active_applications_result = await db.execute(
-        select(func.count(PermitApplication.id))
-        .filter(PermitApplication.mmda_id == mmda_id)
-        .filter(
-            PermitApplication.status.in_([
-                ApplicationStatus.SUBMITTED,
-                ApplicationStatus.UNDER_REVIEW
-            ])
-        )
+    active_applications = (
+        mmda_status_counts.get(ApplicationStatus.SUBMITTED.value, 0)
+        + mmda_status_counts.get(ApplicationStatus.UNDER_REVIEW.value, 0)
     )
-    active_applications = active_applications_result.scalar_one() or 0
 
     # 3. Average Processing Time
     avg_processing_result = await db.execute(
@@ -770,12 +493,7 @@ async def get_admin_stats(request: Request, db: AsyncSession = Depends(aget_db))
     system_health = max(0, 100 - (overdue_count * 5)) if active_applications > 0 else 100
 
     # 5. Pending Reviews
-    pending_reviews_result = await db.execute(
-        select(func.count(PermitApplication.id))
-        .filter(PermitApplication.mmda_id == mmda_id)
-        .filter(PermitApplication.status == ApplicationStatus.SUBMITTED)
-    )
-    pending_reviews = pending_reviews_result.scalar_one() or 0
+    pending_reviews = mmda_status_counts.get(ApplicationStatus.SUBMITTED.value, 0)
 
     # 6. Active Staff
     active_staff_result = await db.execute(
@@ -786,26 +504,10 @@ async def get_admin_stats(request: Request, db: AsyncSession = Depends(aget_db))
     active_staff = active_staff_result.scalar_one() or 0
 
     # 7. Status Distribution
-    status_distribution_result = await db.execute(
-        select(
-            PermitApplication.status,
-            func.count(PermitApplication.id)
-        )
-        .filter(PermitApplication.mmda_id == mmda_id)
-        .group_by(PermitApplication.status)
-    )
-    
     status_distribution = {
-        "submitted": 0,
-        "under_review": 0,
-        "approved": 0,
-        "rejected": 0
+        status_key: mmda_status_counts.get(status_key, 0)
+        for status_key in ("submitted", "under_review", "approved", "rejected")
     }
-    
-    for status, count in status_distribution_result:
-        status_key = status.value if hasattr(status, "value") else status
-        if status_key in status_distribution:
-            status_distribution[status_key] = count
 
     # 8. Department Performance
     # 8. Department Performance (Fixed)
@@ -863,30 +565,9 @@ async def get_admin_stats(request: Request, db: AsyncSession = Depends(aget_db))
 
 
 @router.get("/dashboard/recent-activities")
-async def get_recent_activities(request: Request, db: AsyncSession = Depends(aget_db)):
-    token = request.cookies.get("auth_token")
-    if not token:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    print("Token is Authenticated")
-    try:
-        payload = decode_jwt_token(token)
-        user_id = int(payload.get("sub"))
-        
-        # Get the admin's MMDA
-        staff_result = await db.execute(
-            select(DepartmentStaff)
-            .options(joinedload(DepartmentStaff.department).joinedload(Department.mmda))
-            .filter(DepartmentStaff.user_id == user_id)
-        )
-        staff = staff_result.scalars().first()
-        if not staff:
-            raise HTTPException(status_code=403, detail="User is not a staff member")
-        mmda_id = staff.department.mmda_id
-    except Exception:
-        raise HTTPException(status_code=401, detail="Invalid token")
+async def get_recent_activities(staff: Principal = Depends(current_staff), db: AsyncSession = Depends(aget_replica_db)):
+    mmda_id = staff.mmda_id
     
-    print("Out of Verification related Staff")
-
     # Get recent activities within the MMDA (last 24 hours)
     recent_time = datetime.now() - timedelta(hours=24)
     activities = []
@@ -7,6 +7,7 @@ from sqlalchemy.orm import joinedload
 from app.models.user import Committee, CommitteeMember, Department, DepartmentStaff, User, UserDocument, ProfessionalInCharge, UserProfile
 from app.core.constants import DocumentType, UserRole, VerificationStage
 from app.schemas.User import OnboardingData, StaffOnboardingRequest
+from app.services.principal import principal_cache
 from datetime import datetime
 
 from app.utils.contact_utils import normalize_contact
@@ -83,6 +84,7 @@ async def complete_onboarding(
         db.add(prof)
 
     await db.commit()
+    principal_cache.invalidate(user.id)
 
     return {"message": "Onboarding complete", "user_id": user.id}
 
@@ -207,5 +209,7 @@ async def onboard_staff(
         committee_member.role = payload.role.replace("_", " ").title()
 
     await db.commit()
+    # Role, department and committees may all have changed
+    principal_cache.invalidate(user.id)
 
     return {"message": "User onboarding completed successfully"}
\ No newline at end of file
@@ -35,7 +35,6 @@ async def initialize_payment(
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
-    print("User is: ", user)
     # 💳 Create pending payment
     reference = f"APP-{uuid4().hex[:10].upper()}"
     payment = Payment(
@@ -1,105 +1,169 @@
 # app/api/routes/uploads.py
 
-import traceback
-from fastapi import APIRouter, Depends, Form, Request, UploadFile, File, HTTPException
+import logging
+from fastapi import APIRouter, Depends, Form, UploadFile, File, HTTPException
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.constants import UserRole
+from app.api.dependencies import current_principal
 from app.core.database import aget_db
-from app.core.security import decode_jwt_token
+from app.models.application import PermitApplication
+from app.models.document import ApplicationDocument
 from app.models.inspection import Inspection, InspectionPhoto
 from app.models.user import User
-from app.services.s3_uploadService import upload_file_to_s3
+from app.schemas.upload import (
+    CompleteUploadRequest,
+    CompleteUploadResponse,
+    PresignUploadRequest,
+    PresignUploadResponse,
+)
+from app.services.direct_upload import DirectUploadService
+from app.services.principal import Principal
+from app.services.storage import get_storage
 from sqlalchemy.orm import selectinload
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/uploads", tags=["uploads"])
 
-@router.post("/user-documents")
-async def upload_file(
-    request: Request,
-    file: UploadFile = File(...),
+@router.post("/presign", response_model=PresignUploadResponse)
+async def presign_upload(
+    body: PresignUploadRequest,
+    principal: Principal = Depends(current_principal),
+):
+    """
+    Issue a presigned PUT URL (or POST form) so the client can send the file
+    straight to storage. Call /uploads/complete afterwards to record it.
+    """
+    try:
+        return await DirectUploadService.presign(
+            purpose=body.purpose,
+            user_id=principal.user_id,
+            filename=body.filename,
+            content_type=body.content_type,
+            size=body.size,
+            method=body.method,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.exception("❌ Presign failed")
+        raise HTTPException(status_code=500, detail=f"Could not prepare upload: {str(e)}")
+
+
+@router.post("/complete", response_model=CompleteUploadResponse)
+async def complete_upload(
+    body: CompleteUploadRequest,
+    principal: Principal = Depends(current_principal),
     db: AsyncSession = Depends(aget_db),
 ):
-    # 🔐 Extract token from cookie
-    token = request.cookies.get("auth_token")
-    if not token:
-        raise HTTPException(status_code=401, detail="Not authenticated")
+    """Verify a presigned upload landed in storage and record it"""
+    user_id = principal.user_id
+
+    if not DirectUploadService.owns_key(body.purpose, user_id, body.key):
+        raise HTTPException(status_code=403, detail="Upload key does not belong to you")
+
+    # Check the target before touching storage so bad requests are cheap
+    if body.purpose == "application_document":
+        if body.application_id is None or body.document_type_id is None:
+            raise HTTPException(status_code=400, detail="application_id and document_type_id are required")
+        application = await db.get(PermitApplication, body.application_id)
+        if not application:
+            raise HTTPException(status_code=404, detail="Application not found")
+        if application.applicant_id != user_id:
+            raise HTTPException(status_code=403, detail="You can only upload documents to your own applications")
+    elif body.purpose == "inspection_photo":
+        if body.inspection_id is None:
+            raise HTTPException(status_code=400, detail="inspection_id is required")
+        inspection = await db.get(Inspection, body.inspection_id)
+        if not inspection:
+            raise HTTPException(status_code=404, detail="Inspection not found")
+
+    try:
+        await DirectUploadService.verify_object(body.purpose, body.key, body.size)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    url = DirectUploadService.file_url(body.key)
+    if body.purpose == "user_document":
+        # Ghana card images are saved on the profile by the onboarding flow
+        return {"file_url": url, "record_id": None}
 
     try:
-        payload = decode_jwt_token(token)
-        user_id = int(payload.get("sub"))
-    except Exception:
-        raise HTTPException(status_code=401, detail="Invalid or expired token")
+        if body.purpose == "application_document":
+            record = ApplicationDocument(
+                application_id=body.application_id,
+                document_type_id=body.document_type_id,
+                file_path=url,
+                uploaded_by_id=user_id
+            )
+        else:
+            record = InspectionPhoto(
+                inspection_id=body.inspection_id,
+                file_path=url,
+                caption=body.caption,
+                uploaded_by_id=user_id
+            )
+        db.add(record)
+        await db.commit()
+        return {"file_url": url, "record_id": record.id}
+    except Exception as e:
+        await db.rollback()
+        logger.exception("❌ Upload failed")
+        raise HTTPException(status_code=500, detail=f"Could not record upload: {str(e)}")
 
-    # 🔍 Get user from DB
-    user = await db.get(User, user_id)
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
 
-    # 📤 Upload to S3 with user-named folder
+@router.post("/user-documents")
+async def upload_file(
+    file: UploadFile = File(...),
+    principal: Principal = Depends(current_principal),
+    db: AsyncSession = Depends(aget_db),
+):
+    # Full row for the storage folder name
+    user = await db.get(User, principal.user_id)
+
+    # 📤 Upload to storage with user-named folder
     try:
-        url = upload_file_to_s3(
+        url = await get_storage().upload(
             file,
             folder="uploads/user_documents/ghanacards",
             username=user.first_name or user.email
         )
         return {"file_url": url}
     except Exception as e:
-        print("UPLOAD ERROR:", traceback.format_exc())
+        logger.exception("❌ Upload failed")
         raise HTTPException(status_code=500, detail=f"Upload failed: {str(e)}")
 
 
 @router.post("/application-documents")
 async def upload_application_document(
-    request: Request,
     file: UploadFile = File(...),
+    principal: Principal = Depends(current_principal),
     db: AsyncSession = Depends(aget_db)
 ):
-    token = request.cookies.get("auth_token")
-    if not token:
-        raise HTTPException(status_code=401, detail="Not authenticated")
+    # Full row for the storage folder name
+    user = await db.get(User, principal.user_id)
 
     try:
-        payload = decode_jwt_token(token)
-        user_id = int(payload.get("sub"))
-    except Exception:
-        raise HTTPException(status_code=401, detail="Invalid or expired token")
-
-    user = await db.get(User, user_id)
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-
-    try:
-        url = upload_file_to_s3(
+        url = await get_storage().upload(
             file,
             folder="uploads/application_documents",
             username=user.first_name or user.email
         )
         return {"file_url": url}
     except Exception as e:
-        print("UPLOAD ERROR:", traceback.format_exc())
+        logger.exception("❌ Upload failed")
         raise HTTPException(status_code=500, detail=f"Upload failed: {str(e)}")
     
 @router.post("/inspection-photos")
 async def upload_inspection_photo(
-    request: Request,
     file: UploadFile = File(...),
     inspection_id: str = Form(...),
+    principal: Principal = Depends(current_principal),
     db: AsyncSession = Depends(aget_db)
 ):
-    token = request.cookies.get("auth_token")
-    if not token:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-
-    try:
-        payload = decode_jwt_token(token)
-        user_id = int(payload.get("sub"))
-    except Exception:
-        raise HTTPException(status_code=401, detail="Invalid or expired token")
-
-    user = await db.get(User, user_id)
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
+    # Full row for the storage folder name
+    user = await db.get(User, principal.user_id)
 
     # Verify inspection exists
     inspection = await db.get(Inspection, int(inspection_id))
@@ -107,8 +171,8 @@ async def upload_inspection_photo(
         raise HTTPException(status_code=404, detail="Inspection not found")
 
     try:
-        # Upload to S3
-        url = upload_file_to_s3(
+        # Upload to storage
+        url = await get_storage().upload(
             file,
             folder="uploads/inspection_photos",
             username=user.first_name or user.email
@@ -118,7 +182,7 @@ async def upload_inspection_photo(
         photo = InspectionPhoto(
             inspection_id=int(inspection_id),
             file_path=url,
-            uploaded_by_id=user_id
+            uploaded_by_id=user.id
         )
         db.add(photo)
         await db.commit()
@@ -126,30 +190,19 @@ async def upload_inspection_photo(
         return {"file_url": url}
     except Exception as e:
         await db.rollback()
-        print("UPLOAD ERROR:", traceback.format_exc())
+        logger.exception("❌ Upload failed")
         raise HTTPException(status_code=500, detail=f"Upload failed: {str(e)}")
 
 @router.delete("/inspection-photos/{photo_id}")
 async def delete_inspection_photo(
     photo_id: int,
-    request: Request,
+    principal: Principal = Depends(current_principal),
     db: AsyncSession = Depends(aget_db)
 ):
-    # Verify authentication
-    token = request.cookies.get("auth_token")
-    if not token:
-        raise HTTPException(status_code=401, detail="Not authenticated")
+    user_id = principal.user_id
+    user_role = principal.role
 
     try:
-        # Decode token to get user ID
-        payload = decode_jwt_token(token)
-        user_id = int(payload.get("sub"))
-
-        # Get user role from database
-        user_result = await db.execute(
-            select(User.role).where(User.id == user_id)
-        )
-        user_role = user_result.scalar_one_or_none()
 
         if user_role != UserRole.INSPECTION_OFFICER:
             raise HTTPException(
@@ -4,7 +4,7 @@ import logging
 from dotenv import load_dotenv
 from pydantic import Field
 from pydantic_settings import BaseSettings
-from typing import ClassVar, List, Dict, Any
+from typing import ClassVar, List, Dict, Any, Optional
 
 load_dotenv(".env", override=True)
 logger = logging.getLogger(__name__)
@@ -21,21 +21,62 @@ class Settings(BaseSettings):
     APOSTGRES_DATABASE_URL: str = Field(env="APOSTGRES_DATABASE_URL")
     HASHED_API_KEY: str = Field(env="HASHED_API_KEY")
     OPENAI_API_KEY: str = Field(env="OPENAI_API_KEY")
-    AWS_ACCESS_KEY_ID: str = Field(env="AWS_ACCESS_KEY_ID")
-    AWS_SECRET_ACCESS_KEY: str = Field(env="AWS_SECRET_ACCESS_KEY")
-    AWS_REGION: str = Field(env="AWS_REGION")
-    AWS_S3_BUCKET: str = Field(env="AWS_S3_BUCKET")
-    AWS_S3_BASE_URL: str = Field(env="AWS_S3_BASE_URL")
+    STORAGE_BACKEND: str = Field("s3", env="STORAGE_BACKEND")  # "s3" or "local"
+    LOCAL_STORAGE_ROOT: str = Field("./storage", env="LOCAL_STORAGE_ROOT")
+    LOCAL_STORAGE_BASE_URL: str = Field("http://localhost:8000/files/", env="LOCAL_STORAGE_BASE_URL")
+    # Only required when STORAGE_BACKEND is "s3"; keys may also come from the instance role
+    AWS_ACCESS_KEY_ID: Optional[str] = Field(None, env="AWS_ACCESS_KEY_ID")
+    AWS_SECRET_ACCESS_KEY: Optional[str] = Field(None, env="AWS_SECRET_ACCESS_KEY")
+    AWS_REGION: Optional[str] = Field(None, env="AWS_REGION")
+    AWS_S3_BUCKET: Optional[str] = Field(None, env="AWS_S3_BUCKET")
+    AWS_S3_BASE_URL: Optional[str] = Field(None, env="AWS_S3_BASE_URL")
+    S3_UPLOAD_PART_SIZE: int = Field(8 * 1024 * 1024, env="S3_UPLOAD_PART_SIZE")  # bytes, min 5 MiB
+    S3_UPLOAD_CONCURRENCY: int = Field(4, env="S3_UPLOAD_CONCURRENCY")  # parts in flight per upload
+    S3_UPLOAD_MAX_WORKERS: int = Field(8, env="S3_UPLOAD_MAX_WORKERS")  # upload threads per process
     SECRET_KEY: str = Field(env="SECRET_KEY")
     ALGORITHM: str = Field(env="ALGORITHM")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(env="ACCESS_TOKEN_EXPIRE", default=30)
     EMAIL_FROM: str = os.getenv("EMAIL_FROM", "no-reply@versecatch.pro")
     BASE_URL: str = os.getenv("BASE_URL")
     PAYSTACK_SECRET_KEY: str = os.getenv("PAYSTACK_SECRET_KEY")
+    PAYSTACK_TIMEOUT_SECONDS: float = Field(15.0, env="PAYSTACK_TIMEOUT_SECONDS")
+    ARKESEL_TIMEOUT_SECONDS: float = Field(10.0, env="ARKESEL_TIMEOUT_SECONDS")
+    HTTP_MAX_CONNECTIONS: int = Field(20, env="HTTP_MAX_CONNECTIONS")  # per integration, per process
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = Field(10, env="HTTP_MAX_KEEPALIVE_CONNECTIONS")
     DATA_DIR: str = Field(default="../../data",env="DATA_DIR")
-    SEED_ON_STARTUP: bool = Field(True, env="SEED_ON_STARTUP")
+    OUTBOX_ENABLED: bool = Field(True, env="OUTBOX_ENABLED")  # Run the delivery worker in this process
+    OUTBOX_POLL_SECONDS: float = Field(2.0, env="OUTBOX_POLL_SECONDS")
+    OUTBOX_BATCH_SIZE: int = Field(50, env="OUTBOX_BATCH_SIZE")
+    OUTBOX_MAX_ATTEMPTS: int = Field(6, env="OUTBOX_MAX_ATTEMPTS")
+    OUTBOX_EMAIL_CONCURRENCY: int = Field(4, env="OUTBOX_EMAIL_CONCURRENCY")
+    OUTBOX_SMS_CONCURRENCY: int = Field(4, env="OUTBOX_SMS_CONCURRENCY")
+    OUTBOX_RETENTION_DAYS: int = Field(7, env="OUTBOX_RETENTION_DAYS")  # Sent/failed messages are deleted after this
+    SEED_ON_STARTUP: bool = Field(False, env="SEED_ON_STARTUP")  # Run scripts.init_db inside the app; single-worker/dev only
     FORCE_SEED: bool = Field(False, env="FORCE_SEED")  # Ignore existing data
     REQUIRE_SEED: bool = Field(False, env="REQUIRE_SEED")  # Crash if seeding fails
+    LOG_LEVEL: str = Field("INFO", env="LOG_LEVEL")
+    LOG_FORMAT: str = Field("text", env="LOG_FORMAT")  # "text" or "json"
+    LOG_LEVELS: str = Field("", env="LOG_LEVELS")  # Per-module overrides, e.g. "app.services=DEBUG,httpx=WARNING"
+    LOG_SAMPLE_RATE: float = Field(1.0, env="LOG_SAMPLE_RATE")  # Fraction of DEBUG/INFO records kept
+    APOSTGRES_REPLICA_URLS: str = Field("", env="APOSTGRES_REPLICA_URLS")  # Comma-separated read replicas for dashboards/reference data
+    REPLICA_MAX_LAG_SECONDS: float = Field(10.0, env="REPLICA_MAX_LAG_SECONDS")  # Further behind than this, reads go to the primary
+    REPLICA_LAG_CHECK_SECONDS: float = Field(5.0, env="REPLICA_LAG_CHECK_SECONDS")  # How often a worker re-checks replica lag
+    REPLICA_CHECK_TIMEOUT_SECONDS: float = Field(1.0, env="REPLICA_CHECK_TIMEOUT_SECONDS")
+    DB_POOL_SIZE: int = Field(15, env="DB_POOL_SIZE")  # Connections kept open per worker process
+    DB_MAX_OVERFLOW: int = Field(5, env="DB_MAX_OVERFLOW")  # Extra connections allowed under burst
+    DB_POOL_TIMEOUT: float = Field(30.0, env="DB_POOL_TIMEOUT")  # Seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = Field(1800, env="DB_POOL_RECYCLE")  # Reconnect connections older than this many seconds; -1 never
+    DB_POOL_PRE_PING: bool = Field(True, env="DB_POOL_PRE_PING")  # Round trip on every checkout to catch dropped connections
+    DB_STATEMENT_CACHE_SIZE: int = Field(256, env="DB_STATEMENT_CACHE_SIZE")  # Prepared statements kept per connection; 0 disables
+    DB_PGBOUNCER: bool = Field(False, env="DB_PGBOUNCER")  # Behind PgBouncer transaction pooling (needs max_prepared_statements > 0 to keep the cache on)
+    SQL_ECHO: bool = Field(False, env="SQL_ECHO")  # Log every SQL statement; never in production
+    DEBUG: bool = Field(False, env="DEBUG")  # Adds X-DB-* query stats headers to responses
+    QUERY_STATS_ENABLED: bool = Field(True, env="QUERY_STATS_ENABLED")
+    N_PLUS_ONE_THRESHOLD: int = Field(5, env="N_PLUS_ONE_THRESHOLD")  # Same statement this often in one request gets flagged
+    REFERENCE_CACHE_CHECK_SECONDS: float = Field(15.0, env="REFERENCE_CACHE_CHECK_SECONDS")  # How stale a worker's reference data may get
+    TELEMETRY_ENABLED: bool = Field(True, env="TELEMETRY_ENABLED")
+    TELEMETRY_PATH: str = Field("/telemetry", env="TELEMETRY_PATH")  # Prometheus scrape target
+    TELEMETRY_TOKEN: Optional[str] = Field(None, env="TELEMETRY_TOKEN")  # Bearer token required to scrape, if set
     DB_MODELS: ClassVar[List[str]] = [
         "app.models.application",
         "app.models.document",
@@ -43,6 +84,7 @@ class Settings(BaseSettings):
         "app.models.notification",
         "app.models.payment",
         "app.models.review",
+        "app.models.seed",
         "app.models.user",
     ]
     class Config:
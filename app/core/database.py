@@ -1,67 +1,184 @@
 """
 Enhanced Async Database Manager for PostgreSQL with SQLAlchemy
-- Automatic database creation if missing
-- Proper table initialization
+- Automatic database creation if missing (init command)
+- Proper table initialization (init command, under an advisory lock)
+- Readiness check for workers
+- One sessionmaker; sessions commit only when they wrote something, and a
+  read-only variant runs in autocommit (no BEGIN/COMMIT round trips)
+- Optional read replicas for lag-tolerant reads (dashboards, reference data)
 - Render.com optimization
+- Pool and prepared-statement cache tuned from the DB_* settings (PgBouncer aware)
 - Comprehensive error handling
 """
+import logging
+import time
 from importlib import import_module
-from asyncio import current_task
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator, Optional
-from sqlalchemy import text
+from uuid import uuid4
+from sqlalchemy import event, exc, text
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
-    async_scoped_session,
     create_async_engine,
     async_sessionmaker,
     AsyncEngine
 )
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 import asyncpg
 from app.core.config import settings
+from app.core.replicas import ReplicaRouter, replica_urls
+from app.core.telemetry import DB_POOL_CHECKOUT_WAIT, DB_POOL_TIMEOUTS, DB_REPLICA_FALLBACKS, watch_pool, watch_replicas
 from app.models.base import Base
 
+logger = logging.getLogger(__name__)
+
+READ_ONLY_KEY = "read_only"
+WRITES_KEY = "has_writes"
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_writes(orm_execute_state):
+    """Note statements that may write; read-only sessions refuse DML outright"""
+    if orm_execute_state.is_select:
+        return
+    session = orm_execute_state.session
+    if session.info.get(READ_ONLY_KEY) and (
+        orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete
+    ):
+        raise RuntimeError("Write attempted on a read-only session; use aget_db")
+    session.info[WRITES_KEY] = True
+
+
+@event.listens_for(Session, "before_flush")
+def _refuse_read_only_flush(session, flush_context, instances):
+    if session.info.get(READ_ONLY_KEY):
+        raise RuntimeError("Flush attempted on a read-only session; use aget_db")
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_flushed(session, flush_context):
+    session.info[WRITES_KEY] = True
+
+
+def has_writes(session: AsyncSession) -> bool:
+    """Whether the session flushed, executed DML, or still holds unflushed changes"""
+    return bool(session.info.get(WRITES_KEY) or session.new or session.dirty or session.deleted)
+
+
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long each checkout takes and how often it times out"""
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            DB_POOL_TIMEOUTS.inc()
+            raise
+        finally:
+            DB_POOL_CHECKOUT_WAIT.observe(time.perf_counter() - started)
+
+
+def engine_options(db_url: str, config=settings) -> dict:
+    """
+    create_async_engine keyword arguments from the DB_* settings.
+
+    Statements are prepared once per connection and reused from
+    DB_STATEMENT_CACHE_SIZE slots, so the hot dashboard queries aren't re-parsed
+    and re-planned on every call. Behind PgBouncer in transaction mode, each
+    prepared statement gets a unique name: a client connection's statements can
+    then land on any server connection without colliding, which PgBouncer
+    1.21+ (max_prepared_statements > 0) supports. Set DB_STATEMENT_CACHE_SIZE=0
+    for an older PgBouncer.
+    """
+    connect_args = {
+        "ssl": "require" if "render.com" in db_url else None,
+        "prepared_statement_cache_size": config.DB_STATEMENT_CACHE_SIZE,
+    }
+    if config.DB_PGBOUNCER:
+        connect_args["prepared_statement_name_func"] = lambda: f"__asyncpg_{uuid4()}__"
+        # asyncpg's own cache (used for its introspection queries) numbers names per connection, which collide there
+        connect_args["statement_cache_size"] = 0
+
+    return {
+        "poolclass": InstrumentedAsyncPool,
+        "pool_size": config.DB_POOL_SIZE,
+        "max_overflow": config.DB_MAX_OVERFLOW,
+        "pool_timeout": config.DB_POOL_TIMEOUT,
+        "pool_recycle": config.DB_POOL_RECYCLE,
+        "pool_pre_ping": config.DB_POOL_PRE_PING,
+        "echo": config.SQL_ECHO,
+        "connect_args": connect_args,
+    }
+
+
 class DatabaseSessionManager:
     def __init__(self):
         self.engine: Optional[AsyncEngine] = None
         self.session_factory: Optional[async_sessionmaker] = None
+        self._read_bind: Optional[AsyncEngine] = None
+        self.replica_router: Optional[ReplicaRouter] = None
 
     async def init(self):
-        """Initialize database connection with auto-creation fallback"""
+        """Create the engine and session factory. Schema setup and seeding belong to the init command"""
         try:
             db_url = self._ensure_ssl(settings.APOSTGRES_DATABASE_URL)
-            self.engine = create_async_engine(
-                db_url,
-                pool_size=15,
-                max_overflow=5,
-                pool_timeout=30,
-                pool_recycle=300,
-                pool_pre_ping=True,
-                echo=True,  # Enable for debugging
-                connect_args={
-                    "ssl": "require" if "render.com" in db_url else None,
-                    "prepared_statement_cache_size": 0
-                }
-            )
-
-            try:
-                async with self.engine.begin() as conn:
-                    await self._setup_database(conn)
-            except asyncpg.exceptions.InvalidCatalogNameError:
-                if not await self._create_database():
-                    raise
-                await self._setup_database_after_creation()
-
-            self.session_factory = async_sessionmaker(
-                bind=self.engine,
-                expire_on_commit=False,
-                autoflush=False
-            )
+            self.use_engine(create_async_engine(db_url, **engine_options(db_url)))
 
+            replica_engines = []
+            for url in replica_urls():
+                url = self._ensure_ssl(url)
+                replica_engines.append(create_async_engine(url, **engine_options(url)))
+            if replica_engines:
+                self.replica_router = ReplicaRouter(replica_engines)
+                logger.info(f"📖 {len(replica_engines)} read replica(s) configured")
         except Exception as e:
-            print(f"❌ Database initialization failed: {e}")
+            logger.error(f"❌ Database initialization failed: {e}")
             raise
 
+    def use_engine(self, engine: AsyncEngine):
+        """Build the one sessionmaker (and the read-only bind) for an engine"""
+        self.engine = engine
+        self.session_factory = async_sessionmaker(
+            bind=engine,
+            expire_on_commit=False,
+            autoflush=False
+        )
+        # Same pool; each statement commits on its own, so no BEGIN/COMMIT around reads
+        self._read_bind = engine.execution_options(isolation_level="AUTOCOMMIT")
+
+    async def check_ready(self):
+        """Readiness check for workers: the database answers and the init command has created the schema"""
+        async with self.engine.connect() as conn:
+            initialized = await conn.scalar(text("SELECT to_regclass('seed_versions') IS NOT NULL"))
+        if not initialized:
+            raise RuntimeError("Database schema is missing; run `python -m scripts.init_db` first")
+
+    async def ensure_database(self):
+        """Create the database if it does not exist yet"""
+        try:
+            async with self.engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+        except asyncpg.exceptions.InvalidCatalogNameError:
+            if not await self._create_database():
+                raise
+
+    async def setup_schema(self):
+        """Extensions and tables; only the init command calls this, under the init lock"""
+        async with self.engine.begin() as conn:
+            await self._setup_database(conn)
+
+    @asynccontextmanager
+    async def advisory_lock(self, key: int) -> AsyncGenerator[None, None]:
+        """Hold a session-level PostgreSQL advisory lock; other holders of `key` wait their turn"""
+        async with self.engine.connect() as conn:
+            await conn.execute(text("SELECT pg_advisory_lock(:key)"), {"key": key})
+            try:
+                yield
+            finally:
+                await conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": key})
+
     def _ensure_ssl(self, db_url: str) -> str:
         """Ensure SSL is properly configured for Render"""
         if "render.com" in db_url and "?ssl=" not in db_url:
@@ -81,57 +198,71 @@ class DatabaseSessionManager:
             for model in settings.DB_MODELS:
                 import_module(model)
             
-            print(f"📝 Models registered: {list(Base.metadata.tables.keys())}")
+            logger.debug(f"📝 Models registered: {list(Base.metadata.tables.keys())}")
             await conn.run_sync(Base.metadata.create_all)
             
-            # Verify tables
-            result = await conn.execute(text("""
-                SELECT table_name 
-                FROM information_schema.tables 
-                WHERE table_schema = 'public'
-            """))
-            created_tables = [row[0] for row in result]
-            print(f"✅ Tables created: {created_tables}")
+            if logger.isEnabledFor(logging.DEBUG):
+                result = await conn.execute(text("""
+                    SELECT table_name 
+                    FROM information_schema.tables 
+                    WHERE table_schema = 'public'
+                """))
+                created_tables = [row[0] for row in result]
+                logger.debug(f"✅ Tables created: {created_tables}")
 
         except Exception as e:
-            print(f"❌ Database setup failed: {e}")
+            logger.error(f"❌ Database setup failed: {e}")
             raise
 
-    async def _setup_database_after_creation(self):
-        """Reinitialize after database creation"""
-        print("🔄 Setting up newly created database...")
-        self.engine = create_async_engine(
-            settings.APOSTGRES_DATABASE_URL,
-            pool_size=15,
-            max_overflow=5,
-            pool_pre_ping=True,
-            echo=True
-        )
-        async with self.engine.begin() as conn:
-            await self._setup_database(conn)
+    @asynccontextmanager
+    async def get_session(self, read_only: bool = False, use_replica: bool = False) -> AsyncGenerator[AsyncSession, None]:
+        """
+        Session for one unit of work. A connection is only checked out on the
+        first statement, and the session commits only if it wrote something;
+        otherwise close() just hands the connection back.
+
+        read_only sessions run in autocommit and refuse flushes and DML. They
+        can't hold a server-side cursor (stream_results), which needs a
+        transaction.
 
-    @property
-    def session(self) -> async_scoped_session:
-        """Scoped session for the current async task"""
+        use_replica reads from a replica within REPLICA_MAX_LAG_SECONDS when
+        one is configured and healthy, otherwise from the primary. Replica
+        sessions always refuse writes; only use them where data up to that
+        many seconds old is acceptable.
+        """
         if not self.session_factory:
             raise RuntimeError("DatabaseSessionManager not initialized")
-        return async_scoped_session(
-            self.session_factory,
-            scopefunc=current_task
-        )
+        replica = await self.replica_router.pick() if use_replica and self.replica_router else None
+        if use_replica and self.replica_router and replica is None:
+            DB_REPLICA_FALLBACKS.inc()
 
-    @asynccontextmanager
-    async def get_session(self) -> AsyncGenerator[AsyncSession, None]:
-        """Context manager for safe session handling"""
-        async with self.session() as session:
-            try:
-                yield session
+        if replica is not None:
+            bind = replica.autocommit if read_only else replica.engine
+            session = self.session_factory(bind=bind, info={READ_ONLY_KEY: True})
+        elif read_only:
+            session = self.session_factory(bind=self._read_bind, info={READ_ONLY_KEY: True})
+        elif use_replica:
+            # Fell back to the primary: same rules as on a replica
+            session = self.session_factory(info={READ_ONLY_KEY: True})
+        else:
+            session = self.session_factory()
+        try:
+            yield session
+            if has_writes(session):
                 await session.commit()
-            except Exception:
-                await session.rollback()
-                raise
-            finally:
-                await session.close()
+        except Exception:
+            await session.rollback()
+            raise
+        finally:
+            await session.close()
+
+    def get_read_session(self):
+        """Read-only get_session, for code that takes a session factory"""
+        return self.get_session(read_only=True)
+
+    def get_replica_session(self, read_only: bool = True):
+        """Replica-routed get_session; read_only=False keeps a transaction (e.g. for server-side cursors)"""
+        return self.get_session(read_only=read_only, use_replica=True)
 
     async def _create_database(self) -> bool:
         """Create the database if it does not exist"""
@@ -141,19 +272,16 @@ class DatabaseSessionManager:
             db_url = make_url(settings.APOSTGRES_DATABASE_URL)
             db_name = db_url.database
 
-            print("Database URL is:", db_url )
-            print("Database URL name:", db_name )
-
             # Connect to the default database (usually 'postgres')
             default_url = db_url.set(database="postgres")
-            engine = create_async_engine(str(default_url), echo=True)
+            engine = create_async_engine(str(default_url), echo=settings.SQL_ECHO)
             async with engine.begin() as conn:
                 await conn.execute(text(f'CREATE DATABASE "{db_name}"'))
             await engine.dispose()
-            print(f"✅ Database '{db_name}' created successfully.")
+            logger.info(f"✅ Database '{db_name}' created successfully.")
             return True
         except Exception as e:
-            print(f"❌ Failed to create database: {e}")
+            logger.error(f"❌ Failed to create database: {e}")
             return False
 
     async def close(self):
@@ -162,9 +290,15 @@ class DatabaseSessionManager:
             await self.engine.dispose()
             self.engine = None
             self.session_factory = None
+            self._read_bind = None
+        if self.replica_router:
+            await self.replica_router.close()
+            self.replica_router = None
 
 # Initialize session manager
 session_manager = DatabaseSessionManager()
+watch_pool(lambda: session_manager.engine)
+watch_replicas(lambda: session_manager.replica_router)
 
 async def aget_db() -> AsyncGenerator[AsyncSession, None]:
     """
@@ -175,4 +309,23 @@ async def aget_db() -> AsyncGenerator[AsyncSession, None]:
         ...
     """
     async with session_manager.get_session() as session:
-        yield session
\ No newline at end of file
+        yield session
+
+
+async def aget_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    FastAPI dependency for read-only endpoints: autocommit, so a request pays
+    for its queries and nothing else. Writes raise; use aget_db for those.
+    """
+    async with session_manager.get_session(read_only=True) as session:
+        yield session
+
+
+async def aget_replica_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    FastAPI dependency for dashboard and reference reads: read-only, from a
+    replica within REPLICA_MAX_LAG_SECONDS, or the primary when none is.
+    Not for reads that must see the caller's own writes straight away.
+    """
+    async with session_manager.get_replica_session() as session:
+        yield session
@@ -0,0 +1,131 @@
+"""
+Application-scoped outbound HTTP clients
+- One pooled httpx.AsyncClient per integration, opened in lifespan
+- Keep-alive connections so payments and OTPs skip the TLS handshake
+- HTTP/2 when the optional h2 package is installed
+- Every call is timed per integration for the telemetry endpoint
+"""
+import importlib.util
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+import httpx
+from app.core.config import settings
+from app.core.telemetry import track_outbound
+
+logger = logging.getLogger(__name__)
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+@dataclass(frozen=True)
+class IntegrationConfig:
+    base_url: str = ""
+    connect_timeout: float = 5.0
+    read_timeout: float = 15.0
+    write_timeout: float = 15.0
+    pool_timeout: float = 5.0
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 60.0
+    headers: Dict[str, str] = field(default_factory=dict)
+
+
+def default_integrations() -> Dict[str, IntegrationConfig]:
+    return {
+        "paystack": IntegrationConfig(
+            base_url="https://api.paystack.co",
+            read_timeout=settings.PAYSTACK_TIMEOUT_SECONDS,
+            max_connections=settings.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            headers={"Content-Type": "application/json"},
+        ),
+        "arkesel": IntegrationConfig(
+            base_url="https://sms.arkesel.com",
+            read_timeout=settings.ARKESEL_TIMEOUT_SECONDS,
+            max_connections=settings.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        ),
+    }
+
+
+class TimedTransport(httpx.AsyncBaseTransport):
+    """Records time to response headers; 5xx responses count as errors"""
+
+    def __init__(self, integration: str, transport: httpx.AsyncBaseTransport):
+        self.integration = integration
+        self.transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        with track_outbound(self.integration) as call:
+            response = await self.transport.handle_async_request(request)
+            if response.status_code >= 500:
+                call.outcome = "error"
+            return response
+
+    async def aclose(self):
+        await self.transport.aclose()
+
+
+class HTTPClientRegistry:
+    def __init__(self, integrations: Optional[Dict[str, IntegrationConfig]] = None):
+        self._integrations = integrations
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+
+    @staticmethod
+    def _build(name: str, config: IntegrationConfig) -> httpx.AsyncClient:
+        transport = httpx.AsyncHTTPTransport(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=config.max_connections,
+                max_keepalive_connections=config.max_keepalive_connections,
+                keepalive_expiry=config.keepalive_expiry,
+            ),
+        )
+        return httpx.AsyncClient(
+            base_url=config.base_url,
+            headers=config.headers,
+            timeout=httpx.Timeout(
+                connect=config.connect_timeout,
+                read=config.read_timeout,
+                write=config.write_timeout,
+                pool=config.pool_timeout,
+            ),
+            transport=TimedTransport(name, transport),
+        )
+
+    @property
+    def integrations(self) -> Dict[str, IntegrationConfig]:
+        if self._integrations is None:
+            self._integrations = default_integrations()
+        return self._integrations
+
+    async def init(self):
+        """Open a client for every configured integration"""
+        for name, config in self.integrations.items():
+            if name not in self._clients:
+                self._clients[name] = self._build(name, config)
+        logger.info(
+            f"🌐 HTTP clients ready: {', '.join(self._clients)} "
+            f"({'HTTP/2' if HTTP2_AVAILABLE else 'HTTP/1.1'})"
+        )
+
+    def get(self, name: str) -> httpx.AsyncClient:
+        client = self._clients.get(name)
+        if client is None or client.is_closed:
+            if name not in self.integrations:
+                raise KeyError(f"Unknown HTTP integration {name!r}")
+            # Outside the app lifespan (scripts, tests) build the client on first use
+            client = self._clients[name] = self._build(name, self.integrations[name])
+        return client
+
+    async def close(self):
+        for name, client in list(self._clients.items()):
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.error(f"⚠️ Error closing HTTP client {name}: {str(e)}")
+        self._clients.clear()
+
+
+http_clients = HTTPClientRegistry()
@@ -0,0 +1,129 @@
+"""
+Logging setup driven by Settings
+- Root level plus per-module overrides (LOG_LEVELS="sqlalchemy.engine=INFO,app.services=DEBUG")
+- Plain text or one-JSON-object-per-line output
+- Sampling of DEBUG/INFO records from chatty loggers; warnings and errors are always kept
+- Records are handed to a background thread so request handlers never block on stdout
+"""
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import random
+import sys
+from datetime import datetime, timezone
+from typing import Dict, Optional
+from app.core.config import settings
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+TEXT_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+
+# Attributes every LogRecord has; anything else was passed through `extra=`
+_RESERVED = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        entry.update({key: value for key, value in vars(record).items() if key not in _RESERVED})
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """Keep a fraction of records below WARNING"""
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or self.rate >= 1:
+            return True
+        return random.random() < self.rate
+
+
+class _InProcessQueueHandler(logging.handlers.QueueHandler):
+    """
+    The stock prepare() formats the record on the calling thread so it can be
+    pickled; records here never leave the process, so only the message is
+    frozen and formatting happens on the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def parse_levels(spec: Optional[str]) -> Dict[str, int]:
+    """Parse "logger=LEVEL,other.logger=LEVEL" into {logger: level}"""
+    levels = {}
+    for item in (spec or "").split(","):
+        name, sep, level = item.strip().partition("=")
+        if not sep or not name.strip():
+            continue
+        levels[name.strip()] = logging.getLevelName(level.strip().upper())
+    return {name: level for name, level in levels.items() if isinstance(level, int)}
+
+
+def configure_logging(
+    level: Optional[str] = None,
+    fmt: Optional[str] = None,
+    levels: Optional[str] = None,
+    sample_rate: Optional[float] = None,
+    stream=None,
+):
+    """Install the app's handlers on the root logger. Safe to call more than once."""
+    global _listener
+    level = (level or settings.LOG_LEVEL).upper()
+    fmt = (fmt or settings.LOG_FORMAT).lower()
+    sample_rate = settings.LOG_SAMPLE_RATE if sample_rate is None else sample_rate
+
+    handler = logging.StreamHandler(stream or sys.stdout)
+    handler.setFormatter(JsonFormatter() if fmt == "json" else logging.Formatter(TEXT_FORMAT))
+
+    if _listener is not None:
+        _listener.stop()
+    records = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(records, handler, respect_handler_level=True)
+    _listener.start()
+
+    queue_handler = _InProcessQueueHandler(records)
+    if sample_rate < 1:
+        queue_handler.addFilter(SamplingFilter(sample_rate))
+
+    # Neither format prints thread or process details; skip collecting them per record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
+    root = logging.getLogger()
+    for existing in list(root.handlers):
+        root.removeHandler(existing)
+    root.addHandler(queue_handler)
+    root.setLevel(level)
+
+    # SQLAlchemy logs every statement at INFO; only show it when asked for
+    logging.getLogger("sqlalchemy.engine").setLevel(logging.INFO if settings.SQL_ECHO else logging.WARNING)
+    for name, module_level in parse_levels(levels if levels is not None else settings.LOG_LEVELS).items():
+        logging.getLogger(name).setLevel(module_level)
+
+
+def shutdown_logging():
+    """Flush queued records; called at exit"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(shutdown_logging)
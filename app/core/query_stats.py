@@ -0,0 +1,128 @@
+"""
+Per-request SQL statement accounting
+- Counts statements and time spent in the database for the current request
+- Flags statement shapes repeated within one request as probable N+1 queries
+- Reported as X-DB-* response headers when DEBUG is on
+
+Listeners are attached to the Engine class, so any engine (including test and
+script engines) is covered. Outside a tracked block they cost one ContextVar
+lookup per statement.
+"""
+import logging
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Iterator, List, Optional, Tuple
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_STARTED_KEY = "query_stats_started"
+
+
+@dataclass
+class QueryStats:
+    count: int = 0
+    duration: float = 0.0
+    shapes: Counter = field(default_factory=Counter)
+    parent: Optional["QueryStats"] = None
+
+    def record(self, statement: str, elapsed: float):
+        stats = self
+        while stats is not None:
+            stats.count += 1
+            stats.duration += elapsed
+            stats.shapes[statement] += 1
+            stats = stats.parent
+
+    def repeated(self, threshold: Optional[int] = None) -> List[Tuple[str, int]]:
+        """Statements (already parameterized by the driver) run at least `threshold` times"""
+        threshold = threshold or settings.N_PLUS_ONE_THRESHOLD
+        return [(statement, count) for statement, count in self.shapes.most_common() if count >= threshold]
+
+    def summary(self, limit: int = 5) -> str:
+        lines = [f"{self.count} statements in {self.duration * 1000:.1f} ms"]
+        for statement, count in self.shapes.most_common(limit):
+            lines.append(f"  {count}x {' '.join(statement.split())[:200]}")
+        return "\n".join(lines)
+
+
+_current: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Collect statements run in this context; nested blocks also count towards the outer one"""
+    stats = QueryStats(parent=_current.get())
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current.get() is not None:
+        conn.info.setdefault(_STARTED_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    started = conn.info.get(_STARTED_KEY)
+    if stats is None or not started:
+        return
+    stats.record(statement, time.perf_counter() - started.pop())
+
+
+def _handle_error(exception_context):
+    started = exception_context.connection.info.get(_STARTED_KEY) if exception_context.connection else None
+    if started:
+        started.pop()
+
+
+def install():
+    """Attach the listeners once per process"""
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(Engine, "handle_error", _handle_error)
+
+
+class QueryStatsMiddleware:
+    """Tracks each HTTP request; warns about probable N+1 patterns and, in DEBUG, sets X-DB-* headers"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+            async def send_with_headers(message):
+                if message["type"] == "http.response.start" and settings.DEBUG:
+                    headers = list(message.get("headers", []))
+                    headers.append((b"x-db-query-count", str(stats.count).encode()))
+                    headers.append((b"x-db-time-ms", f"{stats.duration * 1000:.1f}".encode()))
+                    headers.append((b"x-db-repeated-statements", str(len(stats.repeated())).encode()))
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            await self.app(scope, receive, send_with_headers)
+
+        repeated = stats.repeated()
+        if repeated:
+            route = getattr(scope.get("route"), "path", scope["path"])
+            statement, count = repeated[0]
+            logger.warning(
+                f"⚠️ Probable N+1 on {scope['method']} {route}: {count}x "
+                f"{' '.join(statement.split())[:200]} ({stats.count} statements total)"
+            )
+
+
+install()
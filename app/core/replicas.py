@@ -0,0 +1,117 @@
+"""
+Read-replica routing
+- Optional replicas from APOSTGRES_REPLICA_URLS, one engine (pool) each
+- Replication lag is re-checked at most every REPLICA_LAG_CHECK_SECONDS
+- Replicas that lag more than REPLICA_MAX_LAG_SECONDS, or don't answer, are
+  skipped; with none left, reads fall back to the primary
+"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import List, Optional
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 0 on a primary, and on a standby that has replayed everything it received
+# (an idle primary would otherwise look like a lagging replica)
+LAG_QUERY = text("""
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+""")
+
+
+def replica_urls(value: Optional[str] = None) -> List[str]:
+    """Comma-separated URL list from settings"""
+    value = settings.APOSTGRES_REPLICA_URLS if value is None else value
+    return [url.strip() for url in (value or "").split(",") if url.strip()]
+
+
+@dataclass
+class Replica:
+    engine: AsyncEngine
+    autocommit: AsyncEngine = field(init=False)
+    lag: Optional[float] = None
+    available: bool = False
+
+    def __post_init__(self):
+        self.autocommit = self.engine.execution_options(isolation_level="AUTOCOMMIT")
+
+    @property
+    def name(self) -> str:
+        """host:port/db, never the credentials"""
+        url = make_url(str(self.engine.url))
+        return f"{url.host}:{url.port or 5432}/{url.database}"
+
+
+class ReplicaRouter:
+    """
+    Picks a replica for lag-tolerant reads, round robin over the ones that
+    are within REPLICA_MAX_LAG_SECONDS. Lag is refreshed in-line by whichever
+    request finds the last check too old, under a lock so only one checks.
+    """
+
+    def __init__(self, engines: List[AsyncEngine], config=settings):
+        self.replicas = [Replica(engine) for engine in engines]
+        self.config = config
+        self._checked_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+        self._next = 0
+
+    @staticmethod
+    async def _lag(replica: Replica):
+        async with replica.autocommit.connect() as conn:
+            return await conn.scalar(LAG_QUERY)
+
+    async def _check(self, replica: Replica):
+        was_available = replica.available
+        try:
+            # Bounded, connect included: a replica that hangs must not stall the request doing the check
+            lag = await asyncio.wait_for(self._lag(replica), self.config.REPLICA_CHECK_TIMEOUT_SECONDS)
+            replica.lag = float(lag or 0)
+            replica.available = replica.lag <= self.config.REPLICA_MAX_LAG_SECONDS
+            if was_available and not replica.available:
+                logger.warning(f"🐢 Replica {replica.name} is {replica.lag:.1f}s behind, reading from the primary instead")
+        except Exception as e:
+            replica.lag = None
+            replica.available = False
+            if was_available or self._checked_at is None:
+                logger.warning(f"⚠️ Replica {replica.name} unavailable: {e}")
+        if replica.available and not was_available:
+            logger.info(f"📖 Replica {replica.name} in rotation (lag {replica.lag:.1f}s)")
+
+    def _is_fresh(self) -> bool:
+        return self._checked_at is not None and time.monotonic() - self._checked_at < self.config.REPLICA_LAG_CHECK_SECONDS
+
+    async def refresh(self, force: bool = False):
+        if not force and self._is_fresh():
+            return
+        async with self._lock:
+            if not force and self._is_fresh():
+                return
+            await asyncio.gather(*[self._check(replica) for replica in self.replicas])
+            self._checked_at = time.monotonic()
+
+    async def pick(self) -> Optional[Replica]:
+        """A replica within the lag budget, or None to use the primary"""
+        if not self.replicas:
+            return None
+        await self.refresh()
+        available = [replica for replica in self.replicas if replica.available]
+        if not available:
+            return None
+        replica = available[self._next % len(available)]
+        self._next += 1
+        return replica
+
+    async def close(self):
+        for replica in self.replicas:
+            await replica.engine.dispose()
+        self.replicas = []
@@ -0,0 +1,70 @@
+"""
+JSON encoding for the heavy list and map endpoints
+- orjson (in requirements.txt); the stdlib encoder, with a warning, if it is missing
+- RawJSON splices in bytes that were already encoded (e.g. by json_agg in Postgres)
+- FastJSONResponse skips FastAPI's response_model validation and jsonable_encoder
+
+Only use these for data whose shape was enforced when it was written; the
+response_model on the route is then documentation only.
+"""
+import enum
+import json
+import logging
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Mapping
+from fastapi import Response
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is a requirement
+    orjson = None
+    logger.warning("⚠️ orjson is not installed, heavy JSON responses fall back to the slower stdlib encoder")
+
+
+class RawJSON:
+    """Bytes that are already valid JSON, embedded as-is by compose()"""
+    __slots__ = ("raw",)
+
+    def __init__(self, raw):
+        self.raw = raw.encode() if isinstance(raw, str) else raw
+
+
+def _default(value: Any):
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dumps(value: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, default=_default, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def compose(fields: Mapping[str, Any]) -> bytes:
+    """Encode a top-level object whose values may be RawJSON"""
+    parts = [
+        dumps(key) + b":" + (value.raw if isinstance(value, RawJSON) else dumps(value))
+        for key, value in fields.items()
+    ]
+    return b"{" + b",".join(parts) + b"}"
+
+
+class FastJSONResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, RawJSON):
+            return content.raw
+        if isinstance(content, bytes):
+            return content
+        return dumps(content)
@@ -1,9 +1,12 @@
 import hashlib
+import logging
 from typing import Optional
 from datetime import datetime, timedelta
 import jwt
 from .config import settings
 
+logger = logging.getLogger(__name__)
+
 
 def hash_key(key: str) -> str:
     """Hash the key using SHA-256."""
@@ -34,7 +37,6 @@ def create_jwt_token(data: dict, expires_delta: timedelta = timedelta(hours=1)):
         "iat": datetime.utcnow()  # Add issued at time
     })
     token = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
-    print("Created token:", token)  # Debug print
     return token
 
 def decode_jwt_token(token: str):
@@ -44,8 +46,7 @@ def decode_jwt_token(token: str):
             settings.SECRET_KEY,
             algorithms=[settings.ALGORITHM]
         )
-        print("Decoded payload:", payload)  # Debug print
         return payload
     except Exception as e:
-        print(f"JWT Decode Error: {str(e)}")  # Detailed error logging
+        logger.debug(f"JWT decode failed: {type(e).__name__}")
         raise
\ No newline at end of file
@@ -0,0 +1,304 @@
+"""
+Operational metrics in the Prometheus text exposition format
+- Per-route request latency histograms, status counts and in-flight requests
+- Database pool gauges, read from the engine only when scraped
+- Latency and outcome of outbound calls (Paystack, Arkesel, Postmark, S3)
+
+Recording is a dict lookup and a few additions under a lock, so it stays on in
+production. Metrics are per process: with several workers, scrape each one.
+"""
+import hmac
+import threading
+from abc import ABC, abstractmethod
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, Response
+from app.core.config import settings
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds; covers fast cache hits through slow map/tile queries
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+class Metric(ABC):
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    @abstractmethod
+    def samples(self) -> Iterable[str]:
+        """Exposition lines for every label set, without the HELP/TYPE header"""
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}", *self.samples()]
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0)
+
+    def samples(self):
+        for labels, value in sorted(self._values.items()):
+            yield f"{self.name}{_labels(self.labelnames, labels)} {_number(value)}"
+
+
+class Gauge(Metric):
+    """A settable value, or one computed by `callback` at scrape time"""
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        callback: Optional[Callable[[], Optional[float]]] = None,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.callback = callback
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def dec(self, *labels: str, amount: float = 1):
+        self.inc(*labels, amount=-amount)
+
+    def set(self, value: float, *labels: str):
+        with self._lock:
+            self._values[labels] = value
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0)
+
+    def samples(self):
+        if self.callback is not None:
+            value = self.callback()
+            if value is not None:
+                yield f"{self.name} {_number(value)}"
+            return
+        for labels, value in sorted(self._values.items()):
+            yield f"{self.name}{_labels(self.labelnames, labels)} {_number(value)}"
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # labels -> [per-bucket counts (last one is +Inf), sum, count]
+        self._series: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, value: float, *labels: str):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def count(self, *labels: str) -> int:
+        series = self._series.get(labels)
+        return series[2] if series else 0
+
+    def samples(self):
+        with self._lock:
+            snapshot = [(labels, list(series[0]), series[1], series[2]) for labels, series in self._series.items()]
+        for labels, counts, total, count in sorted(snapshot):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                le = f'le="{_number(bound)}"'
+                yield f"{self.name}_bucket{_labels(self.labelnames, labels, le)} {cumulative}"
+            yield f"{self.name}_sum{_labels(self.labelnames, labels)} {_number(total)}"
+            yield f"{self.name}_count{_labels(self.labelnames, labels)} {count}"
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name!r} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = (), callback=None) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames, callback))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets=LATENCY_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+REQUEST_LATENCY = registry.histogram(
+    "http_request_duration_seconds", "Time to serve a request, by route template", ("method", "route")
+)
+REQUESTS = registry.counter(
+    "http_requests_total", "Requests served, by route template and status code", ("method", "route", "status")
+)
+IN_FLIGHT = registry.gauge("http_requests_in_flight", "Requests currently being served")
+
+OUTBOUND_LATENCY = registry.histogram(
+    "outbound_request_duration_seconds", "Time spent in calls to external services", ("integration", "outcome")
+)
+
+DB_POOL_CHECKOUT_WAIT = registry.histogram(
+    "db_pool_checkout_seconds",
+    "Time to get a connection from the pool, including waiting for one to be returned",
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+)
+DB_POOL_TIMEOUTS = registry.counter("db_pool_timeouts_total", "Checkouts that gave up waiting for a connection")
+DB_REPLICA_FALLBACKS = registry.counter(
+    "db_replica_fallbacks_total", "Replica reads sent to the primary because no replica was within the lag budget"
+)
+
+
+def watch_pool(get_engine: Callable[[], object]):
+    """Expose pool occupancy for the engine returned by get_engine (read at scrape time)"""
+
+    def reader(method: str):
+        def read():
+            engine = get_engine()
+            pool = getattr(getattr(engine, "sync_engine", engine), "pool", None)
+            reading = getattr(pool, method, None)
+            return reading() if callable(reading) else None
+        return read
+
+    registry.gauge("db_pool_size", "Configured pool size", callback=reader("size"))
+    registry.gauge("db_pool_checked_out", "Connections currently checked out", callback=reader("checkedout"))
+    registry.gauge("db_pool_checked_in", "Idle connections in the pool", callback=reader("checkedin"))
+    registry.gauge("db_pool_overflow", "Connections opened beyond pool_size", callback=reader("overflow"))
+
+
+def watch_replicas(get_router: Callable[[], object]):
+    """Expose how many read replicas are in rotation (read at scrape time)"""
+
+    def available():
+        router = get_router()
+        return sum(replica.available for replica in router.replicas) if router else None
+
+    registry.gauge("db_replicas_available", "Read replicas within the lag budget", callback=available)
+
+
+class OutboundCall:
+    __slots__ = ("outcome",)
+
+    def __init__(self):
+        self.outcome = "ok"
+
+
+@contextmanager
+def track_outbound(integration: str):
+    """Time a call to an external service; set `call.outcome` to override "ok"/"error" """
+    call = OutboundCall()
+    started = time.perf_counter()
+    try:
+        yield call
+    except BaseException:
+        call.outcome = "error"
+        raise
+    finally:
+        OUTBOUND_LATENCY.observe(time.perf_counter() - started, integration, call.outcome)
+
+
+class TelemetryMiddleware:
+    """
+    Pure ASGI middleware (BaseHTTPMiddleware would add a task and a stream per
+    request). Routes are labelled by their template, e.g. /permits/{id}, so
+    label cardinality stays bounded; paths no route matched share one label.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        IN_FLIGHT.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            IN_FLIGHT.dec()
+            route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+            method = scope["method"]
+            REQUEST_LATENCY.observe(elapsed, method, route)
+            REQUESTS.inc(method, route, str(status_code))
+
+
+async def metrics_endpoint(request: Request) -> Response:
+    """Scrape target; requires `Authorization: Bearer <TELEMETRY_TOKEN>` when a token is set"""
+    if settings.TELEMETRY_TOKEN:
+        supplied = request.headers.get("authorization", "").removeprefix("Bearer ").strip()
+        if not hmac.compare_digest(supplied, settings.TELEMETRY_TOKEN):
+            return PlainTextResponse("Forbidden", status_code=403)
+    return Response(registry.render(), media_type=CONTENT_TYPE)
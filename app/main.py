@@ -2,7 +2,10 @@ from fastapi import FastAPI, Depends, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
-from app.core.database import session_manager, aget_db
+from app.core.database import session_manager, aget_read_db
+from app.core.http import http_clients
+from app.core.telemetry import TelemetryMiddleware, metrics_endpoint
+from app.core.query_stats import QueryStatsMiddleware
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.api.v1.routers.auth import router as auth_router
 from app.api.v1.routers.documents import router as document_router
@@ -12,6 +15,7 @@ from app.api.v1.routers.payments import router as payment_router
 from app.api.v1.routers.reviews import router as review_router
 from app.api.v1.routers.users import router as users_router
 from app.api.v1.routers.uploads import router as upload_router
+from app.api.v1.routers.files import router as files_router
 from app.api.v1.routers.onboarding import router as onboarding_router
 from app.api.v1.routers.mmdas import router as mmdas_router
 from app.api.v1.routers.payments import router as payment_router
@@ -25,16 +29,19 @@ from sqlalchemy import text
 import logging
 from contextlib import asynccontextmanager
 from app.core.config import settings
-from scripts.seed_db import seed_all, needs_seeding
+from scripts.init_db import run_init
+from app.services.reference_cache import reference_cache
+from app.services.location_resolver import location_resolver
+from app.services.outbox import get_outbox_worker
+from app.core.logging import configure_logging
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+configure_logging()
 logger = logging.getLogger(__name__)
 limiter = Limiter(key_func=get_remote_address)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Async context manager for app lifespan events with integrated seeding"""
+    """Async context manager for app lifespan events; workers only connect and check readiness"""
     # Startup
     try:
         logger.info("🚀 Starting application initialization...")
@@ -42,26 +49,44 @@ async def lifespan(app: FastAPI):
         # 1. Initialize database connection pool
         logger.info("🔌 Initializing database connection pool...")
         await session_manager.init()
-        logger.info("✅ Database connection pool ready")
+
+        # 1b. Open pooled clients for outbound integrations
+        await http_clients.init()
         
-        # 2. Conditionally seed database
+        # 2. Schema and seeding are `python -m scripts.init_db`; in-process only for single-worker setups
         if settings.SEED_ON_STARTUP:
-            logger.info("🌱 Checking database seeding requirements...")
-            async with session_manager.session() as db:
-                try:
-                    if await needs_seeding(db) or settings.FORCE_SEED:
-                        logger.info("🛠 Starting database seeding...")
-                        await seed_all(db)
-                        logger.info("🎉 Database seeding completed successfully")
-                    else:
-                        logger.info("⏩ Database already seeded, skipping")
-                except Exception as e:
-                    logger.error(f"❌ Database seeding failed: {str(e)}")
-                    if settings.REQUIRE_SEED:
-                        raise RuntimeError("Critical seeding failed") from e
-                    logger.warning("⚠️ Continuing with potentially incomplete data")
-        else:
-            logger.info("⏭ Database seeding disabled (SEED_ON_STARTUP=False)")
+            logger.info("🌱 Running database init in-process (SEED_ON_STARTUP=True)...")
+            try:
+                await run_init()
+            except Exception as e:
+                logger.error(f"❌ Database init failed: {str(e)}")
+                if settings.REQUIRE_SEED:
+                    raise RuntimeError("Critical seeding failed") from e
+                logger.warning("⚠️ Continuing with potentially incomplete data")
+
+        # 3. Readiness: the database answers and has been initialized
+        await session_manager.check_ready()
+        logger.info("✅ Database connection pool ready")
+
+        # 3a. Measure replica lag once up front so the first dashboard reads can use them
+        if session_manager.replica_router:
+            await session_manager.replica_router.refresh(force=True)
+
+        # 3b. Lookup lists served from memory, refreshed when the reference data version moves
+        try:
+            await reference_cache.preload(session_manager.get_read_session)
+        except Exception as e:
+            logger.warning(f"⚠️ Reference data preload failed, lists will load on first request: {e}")
+
+        # 3c. In-memory fallback for location lookups, used if PostGIS queries fail
+        try:
+            await location_resolver.warm(session_manager.get_read_session)
+        except Exception as e:
+            logger.warning(f"⚠️ Location index preload failed, lookups have no fallback until it loads: {e}")
+
+        # 4. Deliver queued OTP emails/SMS in the background
+        if settings.OUTBOX_ENABLED:
+            get_outbox_worker(session_manager.get_session).start()
             
     except Exception as e:
         logger.critical(f"🔥 Application startup failed: {str(e)}")
@@ -75,9 +100,13 @@ async def lifespan(app: FastAPI):
         # Shutdown
         try:
             logger.info("🛑 Beginning application shutdown...")
+            worker = get_outbox_worker()
+            if worker:
+                await worker.stop()
             logger.info("🔌 Closing database connections...")
             await session_manager.close()
             logger.info("✅ Database connections closed cleanly")
+            await http_clients.close()
         except Exception as e:
             logger.error(f"⚠️ Error during shutdown: {str(e)}")
             raise
@@ -89,7 +118,6 @@ app = FastAPI(
     title="DigiPermit GH",
     description="API for DigiPermit GH, a digital permit management system",
     lifespan=lifespan,
-    dependencies=[Depends(aget_db)]  # Auto-inject db session to all routes
 )
 
 # configure Limiter
@@ -105,6 +133,14 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if settings.QUERY_STATS_ENABLED:
+    app.add_middleware(QueryStatsMiddleware)
+
+# Outermost, so latency includes CORS and every other middleware
+if settings.TELEMETRY_ENABLED:
+    app.add_middleware(TelemetryMiddleware)
+    app.add_route(settings.TELEMETRY_PATH, metrics_endpoint, methods=["GET"], include_in_schema=False)
+
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     logging.error(f"Validation Error: {exc.errors()}")
@@ -115,7 +151,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
 
 # Health check endpoint
 @app.get("/", tags=["Health Check"])
-async def health_check(db: AsyncSession = Depends(aget_db)):
+async def health_check(db: AsyncSession = Depends(aget_read_db)):
     try:
         # Verify database connection
         await db.execute(text("SELECT 1"))
@@ -141,6 +177,7 @@ app.include_router(review_router, tags=["reviews"])
 app.include_router(users_router, tags=["users"])
 app.include_router(onboarding_router, tags=["onboarding"])
 app.include_router(upload_router, tags=["uploads"])
+app.include_router(files_router, tags=["files"])
 app.include_router(mmdas_router, tags=["mmdas"])
 app.include_router(payment_router, tags=["payments"])
 app.include_router(exceptions_router, tags=["exceptions"])
@@ -1,7 +1,7 @@
 from datetime import datetime, timezone
 from enum import Enum
 from geoalchemy2 import Geometry
-from sqlalchemy import Column, Index, Integer, String, Text, Float, DateTime, ForeignKey, Enum as SQLEnum, select
+from sqlalchemy import Column, Index, Integer, String, Text, Float, DateTime, ForeignKey, UniqueConstraint, Enum as SQLEnum, select
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship, validates
 from sqlalchemy.sql import func
@@ -112,6 +112,7 @@ class PermitApplication(Base):
     __table_args__ = (
         Index('ix_permit_applications_applicant', 'applicant_id'),
         Index('ix_permit_applications_created', 'created_at'),
+        Index('ix_permit_applications_queue', 'mmda_id', 'department_id', 'status'),
     )
     
     @validates('estimated_cost')
@@ -216,4 +217,32 @@ class ApplicationStatusHistory(Base):
     changed_at = Column(DateTime, server_default=func.now())
     
     application = relationship("PermitApplication", back_populates="status_history")
-    changed_by = relationship("User")
\ No newline at end of file
+    changed_by = relationship("User")
+
+class ApplicationStatusRollup(Base):
+    """
+    Application counts per MMDA / department / committee / status.
+
+    Maintained incrementally on every status transition (see
+    app.services.status_rollup) so dashboards read O(#departments) rows instead
+    of scanning permit_applications. Unassigned department/committee is stored
+    as 0 so the scope stays usable in a unique constraint.
+    """
+    __tablename__ = 'application_status_rollup'
+
+    id = Column(Integer, primary_key=True)
+    mmda_id = Column(Integer, ForeignKey('mmdas.id', ondelete="CASCADE"), nullable=False)
+    department_id = Column(Integer, nullable=False, default=0)
+    committee_id = Column(Integer, nullable=False, default=0)
+    status = Column(SQLEnum(ApplicationStatus), nullable=False)
+    count = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        UniqueConstraint(
+            'mmda_id', 'department_id', 'committee_id', 'status',
+            name='uq_application_status_rollup_scope'
+        ),
+    )
+
+    def __repr__(self):
+        return f"<ApplicationStatusRollup mmda={self.mmda_id} dept={self.department_id} {self.status}={self.count}>"
@@ -1,7 +1,9 @@
-from sqlalchemy import Column, Enum, Integer, ForeignKey, String, Text, Boolean, DateTime
+from datetime import datetime
+from sqlalchemy import Column, Enum, Index, Integer, ForeignKey, String, Text, Boolean, DateTime
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from app.models.base import Base, TimestampMixin
-from app.core.constants import NotificationType
+from app.core.constants import NotificationType, OutboxStatus
 
 class Notification(Base, TimestampMixin):
     __tablename__ = 'notifications'
@@ -23,4 +25,29 @@ class Notification(Base, TimestampMixin):
     related_application = relationship("PermitApplication")
     
     def __repr__(self):
-        return f"<Notification to User {self.recipient_id}: {self.title}>"
\ No newline at end of file
+        return f"<Notification to User {self.recipient_id}: {self.title}>"
+
+
+class OutboxMessage(Base, TimestampMixin):
+    """Outgoing email/SMS, committed with the change that caused it and delivered by the outbox worker"""
+    __tablename__ = 'outbox_messages'
+
+    id = Column(Integer, primary_key=True)
+    channel = Column(String(20), nullable=False)  # "email" or "sms"
+    recipient = Column(String(255), nullable=False)
+    kind = Column(String(50), nullable=False)  # e.g. "otp"
+    payload = Column(JSONB, nullable=False, default=dict)
+    status = Column(Enum(OutboxStatus), nullable=False, default=OutboxStatus.PENDING)
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    locked_until = Column(DateTime)
+    last_error = Column(Text)
+    sent_at = Column(DateTime)
+    expires_at = Column(DateTime)  # Not worth delivering after this (e.g. the OTP has expired)
+
+    __table_args__ = (
+        Index('ix_outbox_messages_due', 'status', 'next_attempt_at'),
+    )
+
+    def __repr__(self):
+        return f"<OutboxMessage {self.id} {self.channel}:{self.kind} {self.status}>"
@@ -0,0 +1,26 @@
+from datetime import datetime
+from sqlalchemy import Column, DateTime, Integer, String
+from app.models.base import Base
+
+class SeedVersion(Base):
+    """Content hash of the reference data last seeded, so unchanged data is skipped at startup"""
+    __tablename__ = 'seed_versions'
+
+    name = Column(String(50), primary_key=True)  # e.g. "reference_data"
+    content_hash = Column(String(64), nullable=False)
+    applied_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<SeedVersion {self.name}: {self.content_hash[:12]}>"
+
+
+class ReferenceDataVersion(Base):
+    """Bumped whenever reference data changes; API workers drop their cached copies when it moves"""
+    __tablename__ = 'reference_data_versions'
+
+    name = Column(String(50), primary_key=True)  # e.g. "reference_data"
+    version = Column(Integer, nullable=False, default=1)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<ReferenceDataVersion {self.name}: {self.version}>"
@@ -1,5 +1,6 @@
 from sqlalchemy import JSON, Column, String, Integer, Enum, Boolean, ForeignKey, DateTime, Text, UniqueConstraint
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
+from geoalchemy2 import Geometry
 from app.models.base import Base, TimestampMixin
 from app.core.constants import ReviewStatus, UserRole, VerificationStage
 import enum
@@ -139,6 +140,14 @@ class MMDA(Base, TimestampMixin):
     contact_email = Column(String(255))
     contact_phone = Column(String(20))
     jurisdiction_boundaries = Column(JSON)  # GeoJSON polygon coordinates
+
+    # PostGIS copies of the boundary, filled from jurisdiction_boundaries
+    # (see MMDABoundaryService). Simplified versions serve zoomed-out maps.
+    # Deferred so loading an MMDA never pulls polygons it doesn't ask for.
+    boundary_geom = deferred(Column(Geometry('MULTIPOLYGON', srid=4326)))
+    boundary_high = deferred(Column(Geometry('MULTIPOLYGON', srid=4326, spatial_index=False)))
+    boundary_medium = deferred(Column(Geometry('MULTIPOLYGON', srid=4326, spatial_index=False)))
+    boundary_low = deferred(Column(Geometry('MULTIPOLYGON', srid=4326, spatial_index=False)))
     
     # Relationships
     departments = relationship("Department", back_populates="mmda")
@@ -76,19 +76,15 @@ class PermitApplicationCreate(BaseModel):
     @field_validator("expected_start_date", "expected_end_date", mode="before")
     @classmethod
     def parse_datetime(cls, v):
-        print("🕵️ Received datetime value:", v)
-
         if isinstance(v, str):
             try:
                 # Replace 'Z' (Zulu time) with '+00:00' for ISO 8601 compliance
                 v = datetime.fromisoformat(v.replace("Z", "+00:00"))
             except Exception as e:
-                print("❌ Error parsing datetime:", e)
                 raise ValueError("Invalid datetime format")
 
         if isinstance(v, datetime):
             if v.tzinfo is None:
-                print("🕐 Making datetime timezone-aware (UTC)")
                 return v.replace(tzinfo=timezone.utc)
             else:
                 # Normalize to UTC if it has tzinfo
@@ -0,0 +1,37 @@
+from typing import Dict, Literal, Optional
+from pydantic import BaseModel, Field
+
+UploadPurpose = Literal["user_document", "application_document", "inspection_photo"]
+
+
+class PresignUploadRequest(BaseModel):
+    purpose: UploadPurpose
+    filename: str = Field(..., min_length=1, max_length=255)
+    content_type: str
+    size: int = Field(..., gt=0)
+    method: Literal["PUT", "POST"] = "PUT"
+
+
+class PresignUploadResponse(BaseModel):
+    key: str
+    method: str
+    upload_url: str
+    # PUT: headers the client must send. POST: form fields to send before the file.
+    headers: Dict[str, str] = {}
+    fields: Dict[str, str] = {}
+    expires_in: int
+
+
+class CompleteUploadRequest(BaseModel):
+    purpose: UploadPurpose
+    key: str
+    size: Optional[int] = None
+    application_id: Optional[int] = None
+    document_type_id: Optional[int] = None
+    inspection_id: Optional[int] = None
+    caption: Optional[str] = None
+
+
+class CompleteUploadResponse(BaseModel):
+    file_url: str
+    record_id: Optional[int] = None
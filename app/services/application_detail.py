@@ -0,0 +1,92 @@
+import logging
+from typing import Dict, FrozenSet, Iterable, List, Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, noload, selectinload
+from app.models.application import PermitApplication
+from app.models.document import ApplicationDocument
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+# Collections that can be requested with ?include=. Each is fetched with its own
+# SELECT ... WHERE application_id IN (...) instead of multiplying the joined rows.
+SECTION_LOADERS = {
+    "documents": lambda: selectinload(PermitApplication.documents).joinedload(ApplicationDocument.document_type),
+    "reviews": lambda: selectinload(PermitApplication.reviews),
+    "inspections": lambda: selectinload(PermitApplication.inspections),
+    "payments": lambda: selectinload(PermitApplication.payments),
+    "site_conditions": lambda: selectinload(PermitApplication.site_conditions),
+}
+SECTION_ATTRIBUTES = {
+    "documents": PermitApplication.documents,
+    "reviews": PermitApplication.reviews,
+    "inspections": PermitApplication.inspections,
+    "payments": PermitApplication.payments,
+    "site_conditions": PermitApplication.site_conditions,
+}
+ALL_SECTIONS: FrozenSet[str] = frozenset(SECTION_LOADERS)
+APPLICANT_SECTIONS: FrozenSet[str] = frozenset({"documents", "payments", "site_conditions"})
+
+
+class ApplicationDetailService:
+    """
+    Loads one application for the detail views. To-one relationships are joined
+    into the main query; each requested collection is a separate selectin query,
+    so the row count is the sum of the collections rather than their product.
+    """
+
+    @staticmethod
+    def parse_include(include: Optional[str], default: FrozenSet[str] = ALL_SECTIONS) -> FrozenSet[str]:
+        """Turn "documents,payments" into a section set; raises ValueError on unknown names"""
+        if include is None or not include.strip():
+            return default
+        sections = {name.strip() for name in include.split(",") if name.strip()}
+        unknown = sections - ALL_SECTIONS
+        if unknown:
+            raise ValueError(
+                f"Unknown section(s): {', '.join(sorted(unknown))}. "
+                f"Choose from: {', '.join(sorted(ALL_SECTIONS))}"
+            )
+        return frozenset(sections)
+
+    @staticmethod
+    def options(sections: Iterable[str]) -> List:
+        sections = set(sections)
+        options = [
+            joinedload(PermitApplication.applicant).joinedload(User.profile),
+            joinedload(PermitApplication.architect),
+            joinedload(PermitApplication.mmda),
+            joinedload(PermitApplication.permit_type),
+            joinedload(PermitApplication.zoning_district),
+            joinedload(PermitApplication.zoning_use),
+            joinedload(PermitApplication.drainage_type),
+            joinedload(PermitApplication.previous_land_use),
+        ]
+        for name in ALL_SECTIONS:
+            # Sections not asked for are left empty rather than lazy loaded on access
+            options.append(SECTION_LOADERS[name]() if name in sections else noload(SECTION_ATTRIBUTES[name]))
+        return options
+
+    @classmethod
+    async def load(
+        cls,
+        db: AsyncSession,
+        application_id: int,
+        sections: Iterable[str] = ALL_SECTIONS,
+        mmda_id: Optional[int] = None,
+    ) -> Optional[PermitApplication]:
+        """The application with the requested sections, or None (also when outside mmda_id)"""
+        stmt = select(PermitApplication).options(*cls.options(sections)).where(PermitApplication.id == application_id)
+        if mmda_id is not None:
+            stmt = stmt.where(PermitApplication.mmda_id == mmda_id)
+        return (await db.execute(stmt)).scalar_one_or_none()
+
+    @staticmethod
+    def serialize(application: PermitApplication, schema, sections: Iterable[str] = ALL_SECTIONS) -> Dict:
+        """Dump through `schema`; sections that weren't loaded come back as None, not []"""
+        data = schema.model_validate(application).model_dump()
+        for name in ALL_SECTIONS - set(sections):
+            if name in data:
+                data[name] = None
+        return data
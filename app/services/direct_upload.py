@@ -0,0 +1,116 @@
+import logging
+import uuid
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Optional
+from slugify import slugify
+from app.services.storage import get_storage
+from app.services.storage.base import PRESIGN_EXPIRES_SECONDS
+
+logger = logging.getLogger(__name__)
+
+MiB = 1024 * 1024
+DOCUMENT_TYPES = frozenset({"application/pdf", "image/jpeg", "image/png"})
+PHOTO_TYPES = frozenset({"image/jpeg", "image/png", "image/webp", "image/heic"})
+
+
+@dataclass(frozen=True)
+class UploadPolicy:
+    folder: str
+    content_types: FrozenSet[str]
+    max_size: int
+
+
+# Same folders the proxied /uploads endpoints write to
+UPLOAD_POLICIES: Dict[str, UploadPolicy] = {
+    "user_document": UploadPolicy("uploads/user_documents/ghanacards", DOCUMENT_TYPES, 10 * MiB),
+    "application_document": UploadPolicy("uploads/application_documents", DOCUMENT_TYPES, 50 * MiB),
+    "inspection_photo": UploadPolicy("uploads/inspection_photos", PHOTO_TYPES, 20 * MiB),
+}
+
+
+class DirectUploadService:
+    """
+    Presigned uploads straight from the browser to the storage backend.
+
+    The API only signs a request for a key under the caller's own prefix and,
+    once the client reports completion, checks the stored object's metadata
+    before anything is recorded. File bytes never pass through here.
+    """
+
+    @staticmethod
+    def user_prefix(purpose: str, user_id: int) -> str:
+        return f"{UPLOAD_POLICIES[purpose].folder}/user-{user_id}/"
+
+    @classmethod
+    def build_key(cls, purpose: str, user_id: int, filename: str) -> str:
+        base_name, _, file_ext = filename.rpartition(".")
+        if not base_name:
+            base_name, file_ext = file_ext, "bin"
+        safe_name = slugify(base_name) or "file"
+        return f"{cls.user_prefix(purpose, user_id)}{safe_name}-{uuid.uuid4()}.{slugify(file_ext) or 'bin'}"
+
+    @classmethod
+    def owns_key(cls, purpose: str, user_id: int, key: str) -> bool:
+        prefix = cls.user_prefix(purpose, user_id)
+        remainder = key[len(prefix):]
+        return key.startswith(prefix) and bool(remainder) and "/" not in remainder and ".." not in remainder
+
+    @staticmethod
+    def validate_request(purpose: str, content_type: str, size: int):
+        """Raise ValueError if the declared file is not allowed for the purpose"""
+        policy = UPLOAD_POLICIES[purpose]
+        if content_type not in policy.content_types:
+            raise ValueError(f"Content type {content_type} is not allowed. Allowed: {sorted(policy.content_types)}")
+        if size > policy.max_size:
+            raise ValueError(f"File is too large. Maximum size is {policy.max_size // MiB} MB")
+
+    @classmethod
+    async def presign(
+        cls,
+        purpose: str,
+        user_id: int,
+        filename: str,
+        content_type: str,
+        size: int,
+        method: str = "PUT",
+        expires_in: int = PRESIGN_EXPIRES_SECONDS,
+    ) -> Dict:
+        cls.validate_request(purpose, content_type, size)
+        key = cls.build_key(purpose, user_id, filename)
+        presigned = await get_storage().presign(
+            key, content_type, UPLOAD_POLICIES[purpose].max_size, method=method, expires_in=expires_in
+        )
+        return {"key": key, "expires_in": expires_in, **presigned}
+
+    @classmethod
+    async def verify_object(cls, purpose: str, key: str, expected_size: Optional[int] = None) -> Dict:
+        """
+        Check the uploaded object against the purpose's policy and return its
+        {"size", "content_type"} metadata. Objects that fail the check are deleted so a
+        rejected upload doesn't linger in the bucket. Raises ValueError.
+        """
+        storage = get_storage()
+        head = await storage.head(key)
+        if head is None:
+            raise ValueError("Uploaded file not found")
+
+        policy = UPLOAD_POLICIES[purpose]
+        size = head["size"]
+        content_type = (head["content_type"] or "").split(";")[0].strip()
+        problem = None
+        if content_type not in policy.content_types:
+            problem = f"Content type {content_type or 'unknown'} is not allowed"
+        elif not 0 < size <= policy.max_size:
+            problem = "Uploaded file size is not allowed"
+        elif expected_size is not None and size != expected_size:
+            problem = "Uploaded file size does not match"
+
+        if problem:
+            logger.warning(f"⚠️ Rejecting direct upload {key}: {problem}")
+            await storage.delete(key)
+            raise ValueError(problem)
+        return head
+
+    @staticmethod
+    def file_url(key: str) -> str:
+        return get_storage().url(key)
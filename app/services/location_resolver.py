@@ -0,0 +1,185 @@
+import asyncio
+import logging
+import time
+from typing import Dict, List, Optional
+from geoalchemy2.shape import to_shape
+from shapely import STRtree
+from shapely.geometry import Point, shape
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.user import MMDA
+from app.models.zoning import ZoningDistrict
+
+logger = logging.getLogger(__name__)
+
+INDEX_TTL_SECONDS = 300
+
+
+def _mmda_payload(mmda_id, name, region, mmda_type) -> Dict:
+    return {"id": mmda_id, "name": name, "region": region, "type": mmda_type}
+
+
+def _zoning_payload(district_id, code, name) -> Dict:
+    return {"id": district_id, "code": code.value if hasattr(code, "value") else code, "name": name}
+
+
+class _PolygonIndex:
+    """STRtree over polygons with a payload per polygon"""
+
+    def __init__(self, geometries: List, payloads: List[Dict]):
+        self.geometries = geometries
+        self.payloads = payloads
+        self.tree = STRtree(geometries) if geometries else None
+
+    def locate(self, point: Point) -> Optional[Dict]:
+        if self.tree is None:
+            return None
+        # Bounding-box hits from the tree, then an exact test on each candidate
+        for idx in self.tree.query(point):
+            if self.geometries[idx].covers(point):
+                return self.payloads[idx]
+        return None
+
+
+class LocationResolver:
+    """
+    Resolve which MMDA and zoning district contain a lat/lng.
+
+    Lookups go to PostGIS, where the GiST indexes on mmdas.boundary_geom and
+    zoning_districts.spatial_data keep each one an index probe. An in-process
+    STRtree, loaded at startup and rebuilt in the background every
+    INDEX_TTL_SECONDS, answers only when that query fails. Writes (application
+    submission) call locate_in_db directly so they never use the fallback.
+    """
+
+    def __init__(self, ttl_seconds: int = INDEX_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._mmdas: Optional[_PolygonIndex] = None
+        self._zoning: Optional[_PolygonIndex] = None
+        self._loaded_at = 0.0
+        self._lock = asyncio.Lock()
+        self._session_factory = None
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._refresh_attempted_at: Optional[float] = None
+
+    @property
+    def is_fresh(self) -> bool:
+        return self._mmdas is not None and time.monotonic() - self._loaded_at < self.ttl_seconds
+
+    def load(self, mmda_rows, zoning_rows):
+        """
+        Build the index from (id, name, region, type, geometry, geojson) MMDA rows
+        and (id, code, name, geometry) zoning rows. The PostGIS geometry is
+        preferred since it was made valid on backfill; the raw GeoJSON covers
+        MMDAs that have not been backfilled yet.
+        """
+        mmda_geoms, mmda_payloads = [], []
+        for mmda_id, name, region, mmda_type, geometry, boundary in mmda_rows:
+            try:
+                if geometry is not None:
+                    mmda_geoms.append(to_shape(geometry))
+                elif boundary:
+                    mmda_geoms.append(shape(boundary))
+                else:
+                    continue
+            except (ValueError, TypeError, KeyError, AttributeError):
+                logger.warning(f"⚠️ Skipping MMDA {mmda_id} with an unreadable boundary")
+                continue
+            mmda_payloads.append(_mmda_payload(mmda_id, name, region, mmda_type))
+
+        zoning_geoms, zoning_payloads = [], []
+        for district_id, code, name, geometry in zoning_rows:
+            if geometry is None:
+                continue
+            zoning_geoms.append(to_shape(geometry))
+            zoning_payloads.append(_zoning_payload(district_id, code, name))
+
+        self._mmdas = _PolygonIndex(mmda_geoms, mmda_payloads)
+        self._zoning = _PolygonIndex(zoning_geoms, zoning_payloads)
+        self._loaded_at = time.monotonic()
+        logger.info(f"🗺️ Location index loaded ({len(mmda_geoms)} MMDAs, {len(zoning_geoms)} zoning districts)")
+
+    async def refresh(self, db: AsyncSession):
+        async with self._lock:
+            if self.is_fresh:
+                return
+            mmda_rows = (await db.execute(
+                select(
+                    MMDA.id, MMDA.name, MMDA.region, MMDA.type,
+                    MMDA.boundary_geom, MMDA.jurisdiction_boundaries
+                )
+            )).all()
+            zoning_rows = (await db.execute(
+                select(ZoningDistrict.id, ZoningDistrict.code, ZoningDistrict.name, ZoningDistrict.spatial_data)
+            )).all()
+            self.load(mmda_rows, zoning_rows)
+
+    async def warm(self, session_factory):
+        """Load the fallback index at startup; session_factory also serves the background rebuilds"""
+        self._session_factory = session_factory
+        self._refresh_attempted_at = time.monotonic()
+        async with session_factory() as db:
+            await self.refresh(db)
+
+    async def _refresh_in_background(self):
+        try:
+            async with self._session_factory() as db:
+                await self.refresh(db)
+        except Exception as e:
+            logger.warning(f"⚠️ Location index rebuild failed, keeping the previous one: {e}")
+
+    def _refresh_soon(self):
+        """Rebuild a stale fallback index off the request path, at most once per TTL"""
+        if self.is_fresh or self._session_factory is None:
+            return
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+        now = time.monotonic()
+        if self._refresh_attempted_at is not None and now - self._refresh_attempted_at < self.ttl_seconds:
+            return
+        self._refresh_attempted_at = now
+        self._refresh_task = asyncio.create_task(self._refresh_in_background())
+
+    def invalidate(self):
+        self._loaded_at = 0.0
+
+    def locate_in_memory(self, lat: float, lng: float) -> Dict:
+        point = Point(lng, lat)
+        return {
+            "mmda": self._mmdas.locate(point) if self._mmdas else None,
+            "zoning_district": self._zoning.locate(point) if self._zoning else None,
+        }
+
+    @staticmethod
+    async def locate_in_db(db: AsyncSession, lat: float, lng: float) -> Dict:
+        """Authoritative lookup in PostGIS, served by the GiST indexes"""
+        point = func.ST_SetSRID(func.ST_MakePoint(lng, lat), 4326)
+        mmda = (await db.execute(
+            select(MMDA.id, MMDA.name, MMDA.region, MMDA.type)
+            .where(func.ST_Covers(MMDA.boundary_geom, point))
+            .limit(1)
+        )).first()
+        district = (await db.execute(
+            select(ZoningDistrict.id, ZoningDistrict.code, ZoningDistrict.name)
+            .where(func.ST_Covers(ZoningDistrict.spatial_data, point))
+            .limit(1)
+        )).first()
+        return {
+            "mmda": _mmda_payload(*mmda) if mmda else None,
+            "zoning_district": _zoning_payload(*district) if district else None,
+        }
+
+    async def locate(self, db: AsyncSession, lat: float, lng: float) -> Dict:
+        """PostGIS lookup, or the in-memory index (possibly up to a TTL stale) if that fails"""
+        try:
+            location = await self.locate_in_db(db, lat, lng)
+        except Exception as e:
+            if self._mmdas is None:
+                raise
+            logger.error(f"❌ PostGIS location lookup failed, using the in-memory index: {e}")
+            return self.locate_in_memory(lat, lng)
+        self._refresh_soon()
+        return location
+
+
+location_resolver = LocationResolver()
@@ -0,0 +1,124 @@
+import json
+import logging
+from typing import Iterable, Optional
+from sqlalchemy import Text, cast, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
+from app.models.user import MMDA
+
+logger = logging.getLogger(__name__)
+
+# Simplification tolerance in degrees (~55 m, ~550 m, ~2.2 km at the equator)
+BOUNDARY_TOLERANCES = {
+    "high": 0.0005,
+    "medium": 0.005,
+    "low": 0.02,
+}
+
+# Coordinate precision to emit for each level; more digits than the tolerance is wasted payload
+BOUNDARY_DECIMALS = {
+    "high": 5,
+    "medium": 4,
+    "low": 3,
+}
+
+BOUNDARY_DETAILS = ("full",) + tuple(BOUNDARY_TOLERANCES)
+
+
+class MMDABoundaryService:
+    """Precomputed, simplified MMDA jurisdiction boundaries"""
+
+    @staticmethod
+    def resolve_detail(detail: Optional[str] = None, zoom: Optional[int] = None) -> str:
+        """Pick a boundary detail level from an explicit detail or a web-map zoom level"""
+        if detail:
+            if detail not in BOUNDARY_DETAILS:
+                raise ValueError(f"Invalid detail. Must be one of: {list(BOUNDARY_DETAILS)}")
+            return detail
+        if zoom is None:
+            return "full"
+        if zoom <= 7:
+            return "low"
+        if zoom <= 10:
+            return "medium"
+        if zoom <= 13:
+            return "high"
+        return "full"
+
+    @staticmethod
+    def boundary_expression(detail: str):
+        if detail == "full":
+            return MMDA.jurisdiction_boundaries
+        column = getattr(MMDA, f"boundary_{detail}")
+        # Fall back to the stored GeoJSON for rows that have not been backfilled yet
+        return func.coalesce(
+            func.ST_AsGeoJSON(column, BOUNDARY_DECIMALS[detail]),
+            cast(MMDA.jurisdiction_boundaries, Text)
+        )
+
+    @staticmethod
+    def parse_boundary(value):
+        if isinstance(value, str):
+            return json.loads(value)
+        return value
+
+    @classmethod
+    def mmda_query(cls, detail: str = "full"):
+        """Select (MMDA, boundary) rows with the boundary at the requested detail"""
+        query = select(MMDA, cls.boundary_expression(detail).label("boundary"))
+        if detail != "full":
+            # Don't ship the raw polygons from the database when they won't be used
+            query = query.options(defer(MMDA.jurisdiction_boundaries))
+        return query
+
+    @classmethod
+    async def fetch_mmdas(cls, db: AsyncSession, mmda_ids: Iterable[int], detail: str = "full"):
+        """Return [(MMDA, boundary GeoJSON dict)] for the given MMDA ids"""
+        result = await db.execute(cls.mmda_query(detail).where(MMDA.id.in_(list(mmda_ids))))
+        return [(mmda, cls.parse_boundary(boundary)) for mmda, boundary in result.all()]
+
+    @staticmethod
+    async def backfill(db: AsyncSession) -> int:
+        """
+        Fill boundary_geom and the simplified levels from jurisdiction_boundaries.
+
+        Only rows missing a geometry are touched, so this is cheap to call on
+        every seed. Returns the number of MMDAs that got a new geometry.
+        """
+        result = await db.execute(
+            update(MMDA)
+            .where(MMDA.boundary_geom.is_(None), MMDA.jurisdiction_boundaries.isnot(None))
+            .values(
+                # MakeValid can return a collection; keep only its polygons
+                boundary_geom=func.ST_Multi(
+                    func.ST_CollectionExtract(
+                        func.ST_MakeValid(
+                            func.ST_SetSRID(
+                                func.ST_GeomFromGeoJSON(cast(MMDA.jurisdiction_boundaries, Text)),
+                                4326
+                            )
+                        ),
+                        3
+                    )
+                )
+            )
+            .execution_options(synchronize_session=False)
+        )
+        filled = result.rowcount or 0
+
+        for detail, tolerance in BOUNDARY_TOLERANCES.items():
+            column = getattr(MMDA, f"boundary_{detail}")
+            await db.execute(
+                update(MMDA)
+                .where(column.is_(None), MMDA.boundary_geom.isnot(None))
+                .values({
+                    column: func.ST_Multi(
+                        func.ST_SimplifyPreserveTopology(MMDA.boundary_geom, tolerance)
+                    )
+                })
+                .execution_options(synchronize_session=False)
+            )
+
+        if filled:
+            logger.info(f"🗺️ Backfilled boundary geometries for {filled} MMDAs")
+        return filled
@@ -1,3 +1,4 @@
+import logging
 from datetime import datetime, timedelta
 from app.models.user import User
 from app.core.constants import UserRole, VerificationStage
@@ -6,11 +7,12 @@ import secrets
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update
 from app.models.user import UnverifiedUser
-from app.services.sendEmailOtp import send_email_otp
-from app.services.sendSmsOtp import send_sms_otp
+from app.services.outbox import OutboxService, get_outbox_worker
 from enum import Enum
 from app.core.security import create_jwt_token
 
+logger = logging.getLogger(__name__)
+
 MAX_ATTEMPTS = 5
 LOCK_DURATION_MINUTES = 15
 OTP_EXPIRY_MINUTES = 5
@@ -25,7 +27,7 @@ class OTPVerificationStatus(str, Enum):
 
 
 class OtpService:
-    async def generate_otp(self, email_or_phone: str, db: AsyncSession) -> str:
+    async def generate_otp(self, email_or_phone: str, db: AsyncSession, commit: bool = True) -> str:
         otp = str(secrets.randbelow(900000) + 100000)
         expires_at = datetime.utcnow() + timedelta(minutes=OTP_EXPIRY_MINUTES)
 
@@ -38,7 +40,7 @@ class OtpService:
             )
             user = result.scalar_one_or_none()
         except Exception as e:
-            print(f"Query failed: {type(e).__name__}: {e}")
+            logger.error(f"❌ OTP lookup failed: {type(e).__name__}: {e}")
             raise
 
         now = datetime.utcnow()
@@ -69,7 +71,8 @@ class OtpService:
             )
             db.add(user)
 
-        await db.commit()
+        if commit:
+            await db.commit()
         return otp
 
     
@@ -78,14 +81,19 @@ class OtpService:
             raise ValueError("Invalid channel")
         # generate the otp
         try:
-            otp = await self.generate_otp(contact, db)
+            otp = await self.generate_otp(contact, db, commit=False)
         except ValueError as e:
             raise ValueError("User is temporarily locked due to too many failed attempts. Please try again later.")
-        
-        if channel == "email":
-            await send_email_otp(contact, otp)
-        else:
-            await send_sms_otp(contact, otp)
+
+        # The OTP and its delivery are committed together; the outbox worker sends it
+        # A retry that would land after the code expires is not worth sending
+        expires_at = datetime.utcnow() + timedelta(minutes=OTP_EXPIRY_MINUTES)
+        OutboxService.enqueue(db, channel, contact, "otp", {"code": otp}, expires_at=expires_at)
+        await db.commit()
+
+        worker = get_outbox_worker()
+        if worker:
+            worker.notify()
 
     async def verify_otp(self, email_or_phone: str, input_code: str, remember: bool, db: AsyncSession) -> OTPVerificationStatus:
         result = await db.execute(
@@ -0,0 +1,327 @@
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, List, Optional
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.core.constants import OutboxStatus
+from app.models.notification import OutboxMessage
+
+logger = logging.getLogger(__name__)
+
+BASE_BACKOFF_SECONDS = 5
+MAX_BACKOFF_SECONDS = 15 * 60
+# A claimed message is retried by another worker if not settled within this window
+CLAIM_LEASE_SECONDS = 120
+PURGE_INTERVAL_SECONDS = 60 * 60
+FINISHED = (OutboxStatus.SENT, OutboxStatus.FAILED)
+EXPIRED_ERROR = "Expired before delivery"
+
+# (recipient, kind, payload) -> None; raise to have the message retried
+Provider = Callable[[str, str, Dict], Awaitable[None]]
+
+
+@dataclass
+class ClaimedMessage:
+    id: int
+    channel: str
+    recipient: str
+    kind: str
+    payload: Dict
+    attempts: int
+    expires_at: Optional[datetime] = None
+
+
+@dataclass
+class DeliveryOutcome:
+    message: ClaimedMessage
+    error: Optional[str] = None
+
+    @property
+    def delivered(self) -> bool:
+        return self.error is None
+
+
+class OutboxService:
+    """Queue outgoing messages in the same transaction as the change that caused them"""
+
+    @staticmethod
+    def enqueue(
+        db: AsyncSession,
+        channel: str,
+        recipient: str,
+        kind: str,
+        payload: Dict,
+        expires_at: Optional[datetime] = None,
+    ) -> OutboxMessage:
+        """
+        Add a message to the session; it is delivered once the caller commits.
+        A message still undelivered at expires_at is failed instead of retried.
+        """
+        message = OutboxMessage(
+            channel=channel,
+            recipient=recipient,
+            kind=kind,
+            payload=payload,
+            status=OutboxStatus.PENDING,
+            attempts=0,
+            next_attempt_at=datetime.utcnow(),
+            expires_at=expires_at,
+        )
+        db.add(message)
+        return message
+
+    @staticmethod
+    def backoff_seconds(attempts: int) -> float:
+        """Exponential backoff with jitter for the given number of failed attempts"""
+        delay = min(BASE_BACKOFF_SECONDS * (2 ** max(attempts - 1, 0)), MAX_BACKOFF_SECONDS)
+        return delay * random.uniform(0.8, 1.2)
+
+    @staticmethod
+    async def claim_batch(db: AsyncSession, limit: int, lease_seconds: int = CLAIM_LEASE_SECONDS) -> List[ClaimedMessage]:
+        """
+        Lease up to `limit` due messages to this worker. SKIP LOCKED lets several
+        workers (or processes) poll the table without handing out the same row;
+        an expired lease makes a message claimable again if its worker died.
+        Messages past their expires_at are failed here rather than handed out.
+        """
+        now = datetime.utcnow()
+        await db.execute(
+            update(OutboxMessage)
+            .where(
+                OutboxMessage.status.in_([OutboxStatus.PENDING, OutboxStatus.SENDING]),
+                OutboxMessage.expires_at <= now,
+                (OutboxMessage.status == OutboxStatus.PENDING) | (OutboxMessage.locked_until < now),
+            )
+            .values(status=OutboxStatus.FAILED, locked_until=None, last_error=EXPIRED_ERROR, payload={})
+            .execution_options(synchronize_session=False)
+        )
+        due = (
+            select(OutboxMessage.id)
+            .where(
+                (
+                    (OutboxMessage.status == OutboxStatus.PENDING)
+                    & (OutboxMessage.next_attempt_at <= now)
+                ) | (
+                    (OutboxMessage.status == OutboxStatus.SENDING)
+                    & (OutboxMessage.locked_until < now)
+                )
+            )
+            .order_by(OutboxMessage.next_attempt_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        result = await db.execute(
+            update(OutboxMessage)
+            .where(OutboxMessage.id.in_(due))
+            .values(status=OutboxStatus.SENDING, locked_until=now + timedelta(seconds=lease_seconds))
+            .returning(
+                OutboxMessage.id,
+                OutboxMessage.channel,
+                OutboxMessage.recipient,
+                OutboxMessage.kind,
+                OutboxMessage.payload,
+                OutboxMessage.attempts,
+                OutboxMessage.expires_at,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        claimed = [ClaimedMessage(*row) for row in result.all()]
+        await db.commit()
+        return claimed
+
+    @classmethod
+    async def record_outcomes(cls, db: AsyncSession, outcomes: List[DeliveryOutcome], max_attempts: int):
+        now = datetime.utcnow()
+        for outcome in outcomes:
+            message = outcome.message
+            attempts = message.attempts + 1
+            retry_at = now + timedelta(seconds=cls.backoff_seconds(attempts))
+            # Finished messages keep no payload: for OTPs it is the login code
+            if outcome.delivered:
+                values = dict(status=OutboxStatus.SENT, attempts=attempts, sent_at=now, locked_until=None, last_error=None, payload={})
+            elif attempts >= max_attempts:
+                logger.error(f"❌ Giving up on outbox message {message.id} after {attempts} attempts: {outcome.error}")
+                values = dict(status=OutboxStatus.FAILED, attempts=attempts, locked_until=None, last_error=outcome.error, payload={})
+            elif message.expires_at is not None and retry_at >= message.expires_at:
+                logger.warning(f"⌛ Outbox message {message.id} expires before it could be retried: {outcome.error}")
+                values = dict(
+                    status=OutboxStatus.FAILED,
+                    attempts=attempts,
+                    locked_until=None,
+                    last_error=f"{EXPIRED_ERROR} ({outcome.error})",
+                    payload={},
+                )
+            else:
+                values = dict(
+                    status=OutboxStatus.PENDING,
+                    attempts=attempts,
+                    locked_until=None,
+                    last_error=outcome.error,
+                    next_attempt_at=retry_at,
+                )
+            await db.execute(
+                update(OutboxMessage)
+                .where(OutboxMessage.id == message.id)
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            )
+        await db.commit()
+
+    @staticmethod
+    async def purge_finished(db: AsyncSession, retention_days: int) -> int:
+        """Delete sent and failed messages last touched more than retention_days ago"""
+        cutoff = datetime.utcnow() - timedelta(days=retention_days)
+        result = await db.execute(
+            delete(OutboxMessage)
+            .where(OutboxMessage.status.in_(FINISHED), OutboxMessage.updated_at < cutoff)
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+        return result.rowcount or 0
+
+
+class OutboxWorker:
+    """
+    Polls the outbox and delivers messages through per-channel providers.
+
+    Each channel has its own semaphore so a slow SMS gateway cannot use up the
+    slots email needs. notify() wakes the worker right after a commit, so OTPs
+    normally go out without waiting for the next poll. Finished messages older
+    than OUTBOX_RETENTION_DAYS are purged at most once per PURGE_INTERVAL_SECONDS.
+    """
+
+    def __init__(
+        self,
+        session_factory,
+        providers: Dict[str, Provider],
+        concurrency: Optional[Dict[str, int]] = None,
+        poll_seconds: Optional[float] = None,
+        batch_size: Optional[int] = None,
+        max_attempts: Optional[int] = None,
+    ):
+        self.session_factory = session_factory
+        self.providers = providers
+        concurrency = concurrency or {}
+        self._limits = {channel: asyncio.Semaphore(concurrency.get(channel, 4)) for channel in providers}
+        self.poll_seconds = poll_seconds if poll_seconds is not None else settings.OUTBOX_POLL_SECONDS
+        self.batch_size = batch_size or settings.OUTBOX_BATCH_SIZE
+        self.max_attempts = max_attempts or settings.OUTBOX_MAX_ATTEMPTS
+        self.retention_days = settings.OUTBOX_RETENTION_DAYS
+        self._purged_at: Optional[float] = None
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def notify(self):
+        self._wakeup.set()
+
+    async def _deliver(self, message: ClaimedMessage) -> DeliveryOutcome:
+        provider = self.providers.get(message.channel)
+        if provider is None:
+            return DeliveryOutcome(message, f"No provider for channel {message.channel!r}")
+        if message.expires_at is not None and message.expires_at <= datetime.utcnow():
+            return DeliveryOutcome(message, EXPIRED_ERROR)
+        async with self._limits[message.channel]:
+            try:
+                await provider(message.recipient, message.kind, message.payload)
+                return DeliveryOutcome(message)
+            except Exception as e:
+                logger.warning(f"⚠️ Outbox message {message.id} ({message.channel}) failed: {e}")
+                return DeliveryOutcome(message, f"{type(e).__name__}: {e}")
+
+    async def deliver_batch(self, messages: List[ClaimedMessage]) -> List[DeliveryOutcome]:
+        return list(await asyncio.gather(*(self._deliver(message) for message in messages)))
+
+    async def run_once(self) -> int:
+        """Claim, deliver and settle one batch. Returns the number of messages handled"""
+        async with self.session_factory() as db:
+            messages = await OutboxService.claim_batch(db, self.batch_size)
+        if not messages:
+            return 0
+        outcomes = await self.deliver_batch(messages)
+        async with self.session_factory() as db:
+            await OutboxService.record_outcomes(db, outcomes, self.max_attempts)
+        return len(messages)
+
+    async def purge_if_due(self) -> int:
+        now = time.monotonic()
+        if self._purged_at is not None and now - self._purged_at < PURGE_INTERVAL_SECONDS:
+            return 0
+        self._purged_at = now
+        async with self.session_factory() as db:
+            purged = await OutboxService.purge_finished(db, self.retention_days)
+        if purged:
+            logger.info(f"🧹 Purged {purged} finished outbox messages older than {self.retention_days} days")
+        return purged
+
+    async def _run(self):
+        while True:
+            try:
+                await self.purge_if_due()
+                handled = await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"❌ Outbox worker error: {str(e)}")
+                handled = 0
+            if handled >= self.batch_size:
+                continue  # More may be waiting
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="outbox-worker")
+            logger.info("📬 Outbox worker started")
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        logger.info("📭 Outbox worker stopped")
+
+
+def default_providers() -> Dict[str, Provider]:
+    # Imported here so the outbox can be used without the provider SDKs configured
+    from app.services.sendEmailOtp import send_email_otp
+    from app.services.sendSmsOtp import send_sms_otp
+
+    async def email(recipient: str, kind: str, payload: Dict):
+        if kind != "otp":
+            raise ValueError(f"Unsupported email kind {kind!r}")
+        await send_email_otp(recipient, payload["code"])
+
+    async def sms(recipient: str, kind: str, payload: Dict):
+        if kind != "otp":
+            raise ValueError(f"Unsupported SMS kind {kind!r}")
+        await send_sms_otp(recipient, payload["code"])
+
+    return {"email": email, "sms": sms}
+
+
+_worker: Optional[OutboxWorker] = None
+
+
+def get_outbox_worker(session_factory=None) -> Optional[OutboxWorker]:
+    """The process-wide worker, built on first call with a session factory"""
+    global _worker
+    if _worker is None and session_factory is not None:
+        _worker = OutboxWorker(
+            session_factory,
+            default_providers(),
+            concurrency={"email": settings.OUTBOX_EMAIL_CONCURRENCY, "sms": settings.OUTBOX_SMS_CONCURRENCY},
+        )
+    return _worker
@@ -0,0 +1,168 @@
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import JSON, Text, and_, case, cast, exists, func, literal_column, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.constants import ApplicationStatus, InspectionOutcome, InspectionStatus, InspectionType
+from app.core.responses import RawJSON
+from app.models.application import PermitApplication
+from app.models.document import ApplicationDocument, DocumentTypeModel, PermitTypeModel
+from app.models.inspection import Inspection
+from app.models.user import MMDA, User
+
+EMPTY_JSON_ARRAY = literal_column("'[]'::json")
+NEEDS_INSPECTION_STATUSES = (ApplicationStatus.APPROVED, ApplicationStatus.UNDER_REVIEW)
+
+
+def enum_value(column, enum_cls):
+    """Enum columns store member names; the API speaks in values"""
+    return case(*[(column == member, member.value) for member in enum_cls])
+
+
+class PermitProjectionService:
+    """
+    Read-only projections for the list and map endpoints. Rows come straight
+    from SQL as tuples (or as JSON built by Postgres) instead of ORM objects
+    that are then re-validated through pydantic.
+    """
+
+    @staticmethod
+    def map_permit_fields() -> Dict:
+        """The per-permit fields every dashboard map returns, in response order"""
+        return {
+            "id": PermitApplication.id,
+            "project_name": PermitApplication.project_name,
+            "status": enum_value(PermitApplication.status, ApplicationStatus),
+            "permit_type": case(
+                (PermitTypeModel.id.isnot(None), func.json_build_object("id", PermitTypeModel.id, "name", PermitTypeModel.name))
+            ),
+            "mmda_id": PermitApplication.mmda_id,
+            "parcel_geometry": cast(func.ST_AsGeoJSON(PermitApplication.parcel_geometry), JSON),
+            "latitude": PermitApplication.latitude,
+            "longitude": PermitApplication.longitude,
+        }
+
+    @staticmethod
+    def inspection_fields() -> Dict:
+        """Inspector map extras: the application's inspections as a nested JSON array"""
+        inspections = (
+            select(
+                func.coalesce(
+                    func.json_agg(
+                        func.json_build_object(
+                            "id", Inspection.id,
+                            "status", enum_value(Inspection.status, InspectionStatus),
+                            "scheduled_date", Inspection.scheduled_date,
+                            "actual_date", Inspection.actual_date,
+                            "inspection_type", enum_value(Inspection.inspection_type, InspectionType),
+                            "outcome", enum_value(Inspection.outcome, InspectionOutcome),
+                            "officer_id", Inspection.inspection_officer_id,
+                        )
+                    ),
+                    EMPTY_JSON_ARRAY,
+                )
+            )
+            .where(Inspection.application_id == PermitApplication.id)
+            .scalar_subquery()
+        )
+        return {
+            "inspections": inspections,
+            "needs_inspection": and_(
+                PermitApplication.status.in_(NEEDS_INSPECTION_STATUSES),
+                ~exists().where(Inspection.application_id == PermitApplication.id),
+            ),
+        }
+
+    @staticmethod
+    def build_map_permits_query(where, fields: Dict, join_applicant: bool = False):
+        """One row: the permits as a JSON array (text, so the driver doesn't decode it) and their MMDA ids"""
+        pairs = []
+        for name, expression in fields.items():
+            pairs.extend((name, expression))
+        permits = func.coalesce(func.json_agg(func.json_build_object(*pairs)), EMPTY_JSON_ARRAY)
+
+        query = (
+            select(cast(permits, Text), func.array_agg(func.distinct(PermitApplication.mmda_id)))
+            .select_from(PermitApplication)
+            .outerjoin(PermitTypeModel, PermitTypeModel.id == PermitApplication.permit_type_id)
+            .where(where)
+        )
+        if join_applicant:
+            query = query.outerjoin(User, User.id == PermitApplication.applicant_id)
+        return query
+
+    @classmethod
+    async def map_permits(
+        cls,
+        db: AsyncSession,
+        where,
+        extra_fields: Optional[Dict] = None,
+        join_applicant: bool = False,
+    ) -> Tuple[RawJSON, List[int]]:
+        """(permits JSON array, distinct MMDA ids) for a dashboard map, in one round trip"""
+        fields = {**cls.map_permit_fields(), **(extra_fields or {})}
+        permits, mmda_ids = (await db.execute(cls.build_map_permits_query(where, fields, join_applicant))).one()
+        return RawJSON(permits), [mmda_id for mmda_id in (mmda_ids or []) if mmda_id is not None]
+
+    @staticmethod
+    def applicant_name():
+        """Admin map label; needs join_applicant=True"""
+        return case(
+            (User.id.is_(None), "Unknown"),
+            else_=func.concat(User.first_name, " ", User.last_name),
+        )
+
+    @staticmethod
+    async def applicant_applications(db: AsyncSession, applicant_id: int) -> List[Dict]:
+        """The applicant's applications in the ApplicationOut shape: two tuple queries, no ORM objects"""
+        rows = (await db.execute(
+            select(
+                PermitApplication.id,
+                PermitApplication.application_number,
+                PermitApplication.project_name,
+                PermitApplication.status,
+                PermitApplication.created_at,
+                PermitTypeModel.id,
+                PermitTypeModel.name,
+                MMDA.id,
+                MMDA.name,
+            )
+            .outerjoin(PermitTypeModel, PermitTypeModel.id == PermitApplication.permit_type_id)
+            .outerjoin(MMDA, MMDA.id == PermitApplication.mmda_id)
+            .where(PermitApplication.applicant_id == applicant_id)
+            .order_by(PermitApplication.created_at.desc())
+        )).all()
+        if not rows:
+            return []
+
+        documents: Dict[int, List[Dict]] = {row[0]: [] for row in rows}
+        document_rows = await db.execute(
+            select(
+                ApplicationDocument.application_id,
+                DocumentTypeModel.id,
+                DocumentTypeModel.name,
+                ApplicationDocument.file_path,
+                ApplicationDocument.status,
+            )
+            .join(DocumentTypeModel, DocumentTypeModel.id == ApplicationDocument.document_type_id)
+            .where(ApplicationDocument.application_id.in_(list(documents)))
+            .order_by(ApplicationDocument.id)
+        )
+        for application_id, type_id, type_name, file_path, status in document_rows.all():
+            documents[application_id].append({
+                "document_type": {"id": type_id, "name": type_name},
+                "file_path": file_path,
+                "status": status,
+            })
+
+        return [
+            {
+                "id": app_id,
+                "application_number": number,
+                "project_name": project_name,
+                "status": status,
+                "created_at": created_at,
+                "permit_type": {"id": type_id, "name": type_name} if type_id is not None else None,
+                "mmda": {"id": mmda_id, "name": mmda_name} if mmda_id is not None else None,
+                "documents": documents[app_id],
+            }
+            for app_id, number, project_name, status, created_at, type_id, type_name, mmda_id, mmda_name in rows
+        ]
@@ -0,0 +1,113 @@
+import hashlib
+from typing import Optional
+from sqlalchemy import and_, case, func, literal, literal_column, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.constants import ApplicationStatus
+from app.models.application import PermitApplication
+
+TILE_EXTENT = 4096
+TILE_BUFFER = 64
+MAX_ZOOM = 22
+MVT_MEDIA_TYPE = "application/vnd.mapbox-vector-tile"
+
+
+class PermitTileService:
+    """Mapbox Vector Tiles of permit geometries rendered by PostGIS"""
+
+    @staticmethod
+    def is_valid_tile(z: int, x: int, y: int) -> bool:
+        if z < 0 or z > MAX_ZOOM:
+            return False
+        size = 1 << z
+        return 0 <= x < size and 0 <= y < size
+
+    @staticmethod
+    def _geometry():
+        # Parcel outline where we have one, otherwise the project pin
+        return func.coalesce(PermitApplication.parcel_geometry, PermitApplication.project_location)
+
+    @classmethod
+    def _tile_filter(cls, z: int, x: int, y: int):
+        # Same rows as _geometry() && envelope, but each branch tests a bare
+        # column in its stored SRID so the GiST index on that column is usable
+        envelope = func.ST_Transform(func.ST_TileEnvelope(z, x, y), 4326)
+        return or_(
+            PermitApplication.parcel_geometry.op("&&")(envelope),
+            and_(
+                PermitApplication.parcel_geometry.is_(None),
+                PermitApplication.project_location.op("&&")(envelope),
+            ),
+        )
+
+    @classmethod
+    def build_version_query(cls, scope_filter, z: int, x: int, y: int):
+        """Cheap fingerprint of the rows inside a tile, used for the ETag"""
+        return (
+            select(func.count(PermitApplication.id), func.max(PermitApplication.updated_at))
+            .where(scope_filter, cls._tile_filter(z, x, y))
+        )
+
+    @classmethod
+    def build_tile_query(cls, scope_filter, layer: str, z: int, x: int, y: int, user_id: int):
+        envelope = func.ST_TileEnvelope(z, x, y)
+        status_value = case(
+            *[(PermitApplication.status == status, status.value) for status in ApplicationStatus]
+        )
+
+        features = (
+            select(
+                PermitApplication.id,
+                PermitApplication.application_number,
+                PermitApplication.project_name,
+                status_value.label("status"),
+                PermitApplication.permit_type_id,
+                PermitApplication.mmda_id,
+                PermitApplication.department_id,
+                (PermitApplication.applicant_id == user_id).label("is_personal"),
+                func.ST_AsMVTGeom(
+                    func.ST_Transform(cls._geometry(), 3857),
+                    envelope,
+                    TILE_EXTENT,
+                    TILE_BUFFER,
+                    True
+                ).label("geom"),
+            )
+            .where(scope_filter, cls._tile_filter(z, x, y))
+            .subquery("features")
+        )
+
+        return select(
+            func.ST_AsMVT(literal_column("features"), literal(layer), TILE_EXTENT, literal("geom"))
+        ).select_from(features)
+
+    @staticmethod
+    def etag_for(layer: str, z: int, x: int, y: int, user_id: int, count: int, last_updated) -> str:
+        version = f"{layer}/{z}/{x}/{y}:{user_id}:{count}:{last_updated.isoformat() if last_updated else ''}"
+        return f'W/"{hashlib.sha1(version.encode()).hexdigest()}"'
+
+    @classmethod
+    async def render(
+        cls,
+        db: AsyncSession,
+        scope_filter,
+        layer: str,
+        z: int,
+        x: int,
+        y: int,
+        user_id: int,
+        if_none_match: Optional[str] = None,
+    ):
+        """
+        Return (etag, tile bytes). Tile bytes are None when if_none_match already
+        matches the current data version, so the caller can answer 304 without
+        PostGIS encoding the tile.
+        """
+        count, last_updated = (await db.execute(cls.build_version_query(scope_filter, z, x, y))).one()
+        etag = cls.etag_for(layer, z, x, y, user_id, count, last_updated)
+        if if_none_match and etag in [tag.strip() for tag in if_none_match.split(",")]:
+            return etag, None
+        if not count:
+            return etag, b""
+
+        tile = await db.scalar(cls.build_tile_query(scope_filter, layer, z, x, y, user_id))
+        return etag, bytes(tile or b"")
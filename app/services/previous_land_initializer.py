@@ -1,7 +1,7 @@
-from app.core.constants import PREVIOUS_LAND_USES
+from app.core import constants
 from app.models.zoning import PreviousLandUse
+from app.services.seeding import SeedingService
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
 import logging
 
 logger = logging.getLogger(__name__)
@@ -11,15 +11,7 @@ class PreviousLandUseSeeder:
     async def seed(db: AsyncSession):
         logger.info("🌱 Seeding Previous Land Uses...")
 
-        for item in PREVIOUS_LAND_USES:
-            existing = await db.execute(
-                select(PreviousLandUse).where(PreviousLandUse.id == item["id"])
-            )
-            if existing.scalar_one_or_none():
-                logger.debug(f"⏩ Skipping existing land use: {item['id']}")
-                continue
+        rows = [{"id": item["id"], "name": item["name"]} for item in constants.PREVIOUS_LAND_USES]
+        await SeedingService.insert_missing(db, PreviousLandUse, rows, ["id"])
 
-            db.add(PreviousLandUse(id=item["id"], name=item["name"]))
-
-        await db.commit()
         logger.info("✅ Previous Land Uses seeded.")
@@ -0,0 +1,124 @@
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Tuple
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.constants import UserRole
+from app.models.user import Committee, CommitteeMember, Department, DepartmentStaff, User
+
+logger = logging.getLogger(__name__)
+
+SCOPE_TTL_SECONDS = 60
+SCOPE_CACHE_SIZE = 4096
+
+
+@dataclass(frozen=True)
+class Principal:
+    """The authenticated user and, for staff, the department/MMDA/committees they act for"""
+    user_id: int
+    role: Optional[UserRole]
+    staff_id: Optional[int] = None
+    department_id: Optional[int] = None
+    mmda_id: Optional[int] = None
+    is_head: bool = False
+    committee_ids: Tuple[int, ...] = ()
+    committee_mmda_id: Optional[int] = None  # MMDA of the committees the user sits on
+
+    @property
+    def is_staff(self) -> bool:
+        return self.staff_id is not None
+
+
+class PrincipalScopeCache:
+    """
+    Small per-process LRU of Principal by user id. Entries live for a short
+    TTL so staff reassignments made on another worker are picked up quickly;
+    changes made through this process call invalidate() straight away.
+    """
+
+    def __init__(self, ttl_seconds: float = SCOPE_TTL_SECONDS, max_size: int = SCOPE_CACHE_SIZE):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._entries: "OrderedDict[int, Tuple[float, Principal]]" = OrderedDict()
+
+    def get(self, user_id: int) -> Optional[Principal]:
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+        loaded_at, principal = entry
+        if time.monotonic() - loaded_at >= self.ttl_seconds:
+            del self._entries[user_id]
+            return None
+        self._entries.move_to_end(user_id)
+        return principal
+
+    def put(self, principal: Principal):
+        self._entries[principal.user_id] = (time.monotonic(), principal)
+        self._entries.move_to_end(principal.user_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: Optional[int] = None):
+        """Drop one user's scope, or everything when user_id is None"""
+        if user_id is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(user_id, None)
+
+
+principal_cache = PrincipalScopeCache()
+
+
+class PrincipalService:
+    @staticmethod
+    async def load(db: AsyncSession, user_id: int) -> Optional[Principal]:
+        """Resolve a user's role and staff scope; None if the user doesn't exist"""
+        row = (await db.execute(
+            select(
+                User.role,
+                DepartmentStaff.id,
+                DepartmentStaff.department_id,
+                Department.mmda_id,
+                DepartmentStaff.is_head,
+            )
+            .select_from(User)
+            .outerjoin(DepartmentStaff, DepartmentStaff.user_id == User.id)
+            .outerjoin(Department, Department.id == DepartmentStaff.department_id)
+            .where(User.id == user_id)
+            .order_by(DepartmentStaff.id)
+            .limit(1)
+        )).first()
+        if row is None:
+            return None
+
+        role, staff_id, department_id, mmda_id, is_head = row
+        committees = []
+        if staff_id is not None:
+            committees = (await db.execute(
+                select(CommitteeMember.committee_id, Committee.mmda_id)
+                .join(Committee, Committee.id == CommitteeMember.committee_id)
+                .where(CommitteeMember.staff_id == staff_id)
+                .order_by(CommitteeMember.committee_id)
+            )).all()
+
+        return Principal(
+            user_id=user_id,
+            role=role,
+            staff_id=staff_id,
+            department_id=department_id,
+            mmda_id=mmda_id,
+            is_head=bool(is_head),
+            committee_ids=tuple(committee_id for committee_id, _ in committees),
+            committee_mmda_id=committees[0][1] if committees else None,
+        )
+
+    @classmethod
+    async def get(cls, db: AsyncSession, user_id: int) -> Optional[Principal]:
+        principal = principal_cache.get(user_id)
+        if principal is None:
+            principal = await cls.load(db, user_id)
+            if principal is not None:
+                principal_cache.put(principal)
+        return principal
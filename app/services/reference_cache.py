@@ -0,0 +1,209 @@
+import asyncio
+import hashlib
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+from fastapi import Request, Response
+from pydantic import TypeAdapter
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from app.core.config import settings
+from app.models.document import PermitDocumentRequirement, PermitTypeModel
+from app.models.seed import ReferenceDataVersion
+from app.models.user import ApplicantType
+from app.models.zoning import DrainageType, PreviousLandUse, SiteCondition, ZoningDistrict, ZoningPermittedUse, ZoningUseDocumentRequirement
+from app.schemas.PermitSchemas import DrainageTypeOut, PermitTypeOut, PermitTypeWithRequirements, PreviousLandUseOut, SiteConditionOut, ZoningDistrictOut, ZoningPermittedUseOut
+from app.schemas.User import ApplicantTypeOut
+from app.schemas.mmda import MMDABase
+from app.services.mmda_boundaries import MMDABoundaryService
+
+logger = logging.getLogger(__name__)
+
+VERSION_NAME = "reference_data"
+CACHE_CONTROL = "public, max-age=0, must-revalidate"
+
+
+@dataclass(frozen=True)
+class CachedBody:
+    body: bytes
+    etag: str
+    count: int
+
+
+async def _permit_types_with_requirements(db: AsyncSession, _=None):
+    result = await db.execute(
+        select(PermitTypeModel)
+        .options(
+            selectinload(PermitTypeModel.required_documents)
+            .selectinload(PermitDocumentRequirement.document_type)
+        )
+        .order_by(PermitTypeModel.name)
+    )
+    permit_types = result.scalars().all()
+    # Mandatory requirements first
+    for permit_type in permit_types:
+        permit_type.required_documents.sort(key=lambda x: (not x.is_mandatory, x.document_type.name))
+    return permit_types
+
+
+async def _active_permit_types(db: AsyncSession, _=None):
+    return (await db.execute(select(PermitTypeModel).where(PermitTypeModel.is_active == True))).scalars().all()
+
+
+async def _zoning_uses(db: AsyncSession, zoning_district_id: Optional[int] = None):
+    query = select(ZoningPermittedUse).options(
+        selectinload(ZoningPermittedUse.required_documents)
+        .selectinload(ZoningUseDocumentRequirement.document_type)
+    )
+    if zoning_district_id:
+        query = query.where(ZoningPermittedUse.zoning_district_id == zoning_district_id)
+    return (await db.execute(query)).scalars().all()
+
+
+async def _zoning_district_ids(db: AsyncSession, _=None):
+    return (await db.execute(select(ZoningDistrict.id))).scalars().all()
+
+
+def _ordered(model):
+    async def load(db: AsyncSession, _=None):
+        return (await db.execute(select(model).order_by(model.name))).scalars().all()
+    return load
+
+
+async def _mmdas(db: AsyncSession, detail: str):
+    result = await db.execute(MMDABoundaryService.mmda_query(detail))
+    return [
+        MMDABase(
+            id=mmda.id,
+            name=mmda.name,
+            type=mmda.type,
+            region=mmda.region,
+            contact_email=mmda.contact_email,
+            contact_phone=mmda.contact_phone,
+            jurisdiction_boundaries=MMDABoundaryService.parse_boundary(boundary),
+        )
+        for mmda, boundary in result.all()
+    ]
+
+
+# name -> (response schema, loader(db, param) returning ORM rows or schema objects)
+DATASETS: Dict[str, Tuple[Any, Callable[..., Awaitable[List]]]] = {
+    "permit_types_with_requirements": (PermitTypeWithRequirements, _permit_types_with_requirements),
+    "permit_types": (PermitTypeOut, _active_permit_types),
+    "zoning_districts": (ZoningDistrictOut, _ordered(ZoningDistrict)),
+    "zoning_uses": (ZoningPermittedUseOut, _zoning_uses),
+    "drainage_types": (DrainageTypeOut, _ordered(DrainageType)),
+    "site_conditions": (SiteConditionOut, _ordered(SiteCondition)),
+    "previous_land_uses": (PreviousLandUseOut, _ordered(PreviousLandUse)),
+    "applicant_types": (ApplicantTypeOut, _ordered(ApplicantType)),
+    "mmdas": (MMDABase, _mmdas),
+}
+# name -> loader of the params that get their own entry. The param comes from the
+# client, so any other value is answered from one shared empty entry instead of
+# growing the cache
+KNOWN_PARAMS: Dict[str, Callable[..., Awaitable[List]]] = {
+    "zoning_uses": _zoning_district_ids,
+}
+UNKNOWN = object()
+# Loaded at startup; other keys (zoning uses per district, simplified MMDA boundaries) on first use
+PRELOAD_KEYS = [(name, None) for name in DATASETS if name != "mmdas"] + [("mmdas", "full")]
+
+
+class ReferenceDataCache:
+    """
+    Per-process cache of the static lookup lists, kept as the JSON bytes the
+    endpoints return, so a hit costs neither a query nor pydantic validation.
+
+    Consistency across workers comes from the reference_data_versions row: a
+    worker re-reads it at most every REFERENCE_CACHE_CHECK_SECONDS and drops
+    everything when it has moved. Anything that changes reference data calls
+    bump() in the same transaction.
+    """
+
+    def __init__(self):
+        self._entries: Dict[Hashable, CachedBody] = {}
+        self._adapters: Dict[Any, TypeAdapter] = {}
+        self._known_params: Dict[str, frozenset] = {}
+        self._version: Optional[int] = None
+        self._checked_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+    @staticmethod
+    async def bump(db: AsyncSession):
+        """Invalidate every worker's cache once the caller's transaction commits"""
+        stmt = insert(ReferenceDataVersion).values(name=VERSION_NAME, version=1)
+        await db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[ReferenceDataVersion.name],
+                set_={"version": ReferenceDataVersion.version + 1, "updated_at": stmt.excluded.updated_at},
+            )
+        )
+
+    def serialize(self, schema, items) -> CachedBody:
+        adapter = self._adapters.get(schema)
+        if adapter is None:
+            adapter = self._adapters[schema] = TypeAdapter(List[schema])
+        # by_alias matches what FastAPI's response_model serialization emits
+        body = adapter.dump_json(adapter.validate_python(items, from_attributes=True), by_alias=True)
+        return CachedBody(body=body, etag=f'"{hashlib.sha1(body).hexdigest()}"', count=len(items))
+
+    async def _sync_version(self, db: AsyncSession):
+        now = time.monotonic()
+        if self._checked_at is not None and now - self._checked_at < settings.REFERENCE_CACHE_CHECK_SECONDS:
+            return
+        version = await db.scalar(select(ReferenceDataVersion.version).where(ReferenceDataVersion.name == VERSION_NAME))
+        self._checked_at = now
+        if version != self._version:
+            if self._entries:
+                logger.info(f"🔄 Reference data version {self._version} -> {version}, dropping {len(self._entries)} cached lists")
+            self._entries.clear()
+            self._known_params.clear()
+            self._version = version
+
+    async def get(self, db: AsyncSession, name: str, param: Hashable = None) -> CachedBody:
+        await self._sync_version(db)
+        key = (name, param)
+        entry = self._entries.get(key)
+        if entry is not None:
+            return entry
+        async with self._lock:
+            if param is not None and name in KNOWN_PARAMS:
+                if name not in self._known_params:
+                    self._known_params[name] = frozenset(await KNOWN_PARAMS[name](db))
+                if param not in self._known_params[name]:
+                    key = (name, UNKNOWN)
+            entry = self._entries.get(key)
+            if entry is None:
+                schema, loader = DATASETS[name]
+                items = [] if key[1] is UNKNOWN else await loader(db, param)
+                entry = self._entries[key] = self.serialize(schema, items)
+        return entry
+
+    async def preload(self, session_factory):
+        """Fill the common lists before the first request; session_factory is e.g. session_manager.get_session"""
+        started = time.perf_counter()
+        async with session_factory() as db:
+            for name, param in PRELOAD_KEYS:
+                await self.get(db, name, param)
+        logger.info(f"📚 Reference data cached ({len(self._entries)} lists, {(time.perf_counter() - started) * 1000:.0f} ms)")
+
+    def clear(self):
+        self._entries.clear()
+        self._known_params.clear()
+        self._version = None
+        self._checked_at = None
+
+    @staticmethod
+    def respond(request: Request, entry: CachedBody) -> Response:
+        """200 with the cached body, or 304 when If-None-Match already has it"""
+        headers = {"ETag": entry.etag, "Cache-Control": CACHE_CONTROL}
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and entry.etag in [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]:
+            return Response(status_code=304, headers=headers)
+        return Response(content=entry.body, media_type="application/json", headers=headers)
+
+
+reference_cache = ReferenceDataCache()
@@ -0,0 +1,137 @@
+from datetime import datetime
+from typing import Dict, Optional
+from sqlalchemy import Integer, and_, case, cast, func, literal, or_, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.constants import ApplicationStatus
+from app.models.application import PermitApplication
+from app.models.document import PermitTypeModel
+from app.models.user import Committee, Department, User
+from app.utils.pagination import decode_cursor, encode_cursor
+
+SECONDS_PER_DAY = 86400
+DEFAULT_STANDARD_DURATION_DAYS = 30
+
+PRIORITY_HIGH = 0
+PRIORITY_MEDIUM = 1
+PRIORITY_LOW = 2
+PRIORITY_LABELS = {PRIORITY_HIGH: "high", PRIORITY_MEDIUM: "medium", PRIORITY_LOW: "low"}
+
+CURSOR_FIELDS = {"as_of": datetime, "priority": int, "queued_at": datetime, "id": int}
+
+
+class ReviewerQueueService:
+    """Priority-ordered reviewer queue with keyset pagination done in SQL"""
+
+    @staticmethod
+    def priority_columns(now: datetime):
+        """Return (queued_at, days_in_queue, priority tier) expressions evaluated at `now`"""
+        queued_at = func.coalesce(PermitApplication.submitted_at, PermitApplication.created_at)
+        days_in_queue = cast(
+            func.floor(func.extract("epoch", literal(now) - queued_at) / SECONDS_PER_DAY),
+            Integer
+        )
+        standard_duration = func.coalesce(
+            PermitTypeModel.standard_duration_days, DEFAULT_STANDARD_DURATION_DAYS
+        )
+        status = PermitApplication.status
+
+        # Same tiers the endpoint used to compute per row in Python
+        priority = case(
+            (and_(status == ApplicationStatus.SUBMITTED, days_in_queue > 2), PRIORITY_HIGH),
+            (and_(status == ApplicationStatus.UNDER_REVIEW, days_in_queue > standard_duration / 2.0), PRIORITY_HIGH),
+            (days_in_queue > standard_duration, PRIORITY_HIGH),
+            (and_(status == ApplicationStatus.UNDER_REVIEW, days_in_queue > standard_duration / 4.0), PRIORITY_MEDIUM),
+            else_=PRIORITY_LOW,
+        )
+        return queued_at, days_in_queue, priority
+
+    @classmethod
+    def build_queue_query(
+        cls,
+        scope_filter,
+        now: datetime,
+        limit: int,
+        after: Optional[Dict] = None,
+    ):
+        """
+        Select one page of the queue ordered by (priority, queued_at, id).
+
+        Oldest first within a tier is the same as most days in queue first; the id
+        breaks ties so the keyset is unique.
+        """
+        queued_at, days_in_queue, priority = cls.priority_columns(now)
+
+        query = (
+            select(
+                PermitApplication.id,
+                PermitApplication.application_number,
+                PermitTypeModel.name.label("permit_type"),
+                User.first_name,
+                User.last_name,
+                queued_at.label("queued_at"),
+                days_in_queue.label("days_in_queue"),
+                priority.label("priority"),
+                Department.name.label("department_name"),
+                Committee.name.label("committee_name")
+            )
+            .join(PermitTypeModel, PermitApplication.permit_type_id == PermitTypeModel.id)
+            .join(User, PermitApplication.applicant_id == User.id)
+            .join(Department, PermitApplication.department_id == Department.id)
+            .join(Committee, PermitApplication.committee_id == Committee.id)
+            .where(scope_filter)
+        )
+
+        if after:
+            query = query.where(
+                tuple_(priority, queued_at, PermitApplication.id)
+                > tuple_(literal(after["priority"]), literal(after["queued_at"]), literal(after["id"]))
+            )
+
+        return query.order_by(priority, queued_at, PermitApplication.id).limit(limit + 1)
+
+    @classmethod
+    async def get_queue_page(
+        cls,
+        db: AsyncSession,
+        scope_filter,
+        limit: int,
+        cursor: Optional[str] = None,
+    ) -> Dict:
+        """
+        Return {"items": [...], "next_cursor": str | None}.
+
+        The cursor pins the reference time of the first page so priority tiers,
+        and therefore the ordering, stay stable while a client pages through.
+        """
+        after = decode_cursor(cursor, CURSOR_FIELDS) if cursor else None
+        now = after["as_of"] if after else datetime.now()
+
+        result = await db.execute(cls.build_queue_query(scope_filter, now, limit, after))
+        rows = result.all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_cursor({
+                "as_of": now,
+                "priority": last.priority,
+                "queued_at": last.queued_at,
+                "id": last.id,
+            })
+
+        return {
+            "items": [
+                {
+                    "permit_no": row.application_number,
+                    "type": row.permit_type,
+                    "applicant": f"{row.first_name} {row.last_name}",
+                    "days_in_queue": row.days_in_queue,
+                    "priority": PRIORITY_LABELS[row.priority],
+                    "permit_id": row.id,
+                    "has_submission_date": row.queued_at.isoformat(),
+                }
+                for row in rows
+            ],
+            "next_cursor": next_cursor,
+        }
@@ -0,0 +1,97 @@
+import hashlib
+import json
+import logging
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.seed import SeedVersion
+
+logger = logging.getLogger(__name__)
+
+
+def _canonical(value: Any) -> Any:
+    """JSON-safe, order-independent form of the seed constants (enum keys included)"""
+    if isinstance(value, Enum):
+        return _canonical(value.value)
+    if isinstance(value, dict):
+        return {str(_canonical(k)): _canonical(v) for k, v in sorted(value.items(), key=lambda kv: str(_canonical(kv[0])))}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    return value
+
+
+class SeedingService:
+    """
+    Set-based helpers for the reference data seeders. Each table is seeded with
+    one SELECT of the natural keys already present and one batched
+    INSERT ... ON CONFLICT DO NOTHING for the rows that are missing.
+    """
+
+    @staticmethod
+    def content_hash(sources: Dict[str, Any], files: Iterable[Path] = ()) -> str:
+        """sha256 over the seed constants and the data files they are read from"""
+        digest = hashlib.sha256()
+        digest.update(json.dumps(_canonical(sources), sort_keys=True, default=str).encode())
+        for path in files:
+            path = Path(path)
+            digest.update(str(path).encode())
+            # A missing file still hashes, so adding it later triggers a reseed
+            digest.update(path.read_bytes() if path.exists() else b"<missing>")
+        return digest.hexdigest()
+
+    @staticmethod
+    async def applied_hash(db: AsyncSession, name: str) -> Optional[str]:
+        return await db.scalar(select(SeedVersion.content_hash).where(SeedVersion.name == name))
+
+    @staticmethod
+    async def mark_applied(db: AsyncSession, name: str, content_hash: str):
+        stmt = insert(SeedVersion).values(name=name, content_hash=content_hash)
+        await db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[SeedVersion.name],
+                set_={"content_hash": stmt.excluded.content_hash, "applied_at": stmt.excluded.applied_at},
+            )
+        )
+
+    @staticmethod
+    async def existing_keys(db: AsyncSession, model, keys: Sequence[str]) -> set:
+        columns = [getattr(model, key) for key in keys]
+        result = await db.execute(select(*columns))
+        return {tuple(row) for row in result.all()}
+
+    @staticmethod
+    async def insert_missing(db: AsyncSession, model, rows: List[Dict], keys: Sequence[str]) -> int:
+        """
+        Insert the rows whose `keys` aren't in the table yet. ON CONFLICT DO NOTHING
+        covers a concurrent seeder where the keys have a unique constraint; the key
+        lookup keeps tables without one (e.g. committees) from getting duplicates.
+        Returns the number of rows sent.
+        """
+        if not rows:
+            return 0
+        present = await SeedingService.existing_keys(db, model, keys)
+        missing, seen = [], set()
+        for row in rows:
+            key = tuple(row[k] for k in keys)
+            if key in present or key in seen:
+                continue
+            seen.add(key)
+            missing.append(row)
+
+        if missing:
+            # executemany; SQLAlchemy batches these into multi-row VALUES statements
+            await db.execute(insert(model).on_conflict_do_nothing(), missing)
+        logger.debug(f"🌱 {model.__tablename__}: {len(missing)} new of {len(rows)}")
+        return len(missing)
+
+    @staticmethod
+    async def id_map(db: AsyncSession, model, keys: Sequence[str]) -> Dict:
+        """{natural key: id} for a seeded table, for wiring up child rows"""
+        result = await db.execute(select(*[getattr(model, key) for key in keys], model.id))
+        return {
+            (row[0] if len(keys) == 1 else tuple(row[:-1])): row[-1]
+            for row in result.all()
+        }
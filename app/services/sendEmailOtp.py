@@ -1,8 +1,14 @@
 # services/email_service.py
 
+import logging
+import asyncio
 import os
+from functools import lru_cache
 from postmarker.core import PostmarkClient
 from dotenv import load_dotenv
+from app.core.telemetry import track_outbound
+
+logger = logging.getLogger(__name__)
 
 load_dotenv()
 
@@ -15,6 +21,11 @@ if not POSTMARK_API_TOKEN or not SENDER_EMAIL:
     raise ValueError("POSTMARK_API_TOKEN or POSTMARK_SENDER_EMAIL is not set")
 
 
+@lru_cache(maxsize=1)
+def get_postmark_client() -> PostmarkClient:
+    return PostmarkClient(server_token=POSTMARK_API_TOKEN)
+
+
 async def send_email_otp(email: str, code: str):
     html_content = f"""
     <div style="font-family: Arial, sans-serif; max-width: 600px; margin: auto; padding: 20px; border: 1px solid #eee; border-radius: 10px;">
@@ -48,14 +59,16 @@ async def send_email_otp(email: str, code: str):
     """
 
     try:
-        client = PostmarkClient(server_token=POSTMARK_API_TOKEN)
-        response = client.emails.send(
-            From=SENDER_EMAIL,
-            To=email,
-            Subject="Digi-Permit OTP Code / Nhyehyɛe Kɔd",
-            HtmlBody=html_content
-        )
-        print(f"[EMAIL] Sent OTP {code} to {email}, status: {response['Message']}")
+        # The Postmark SDK is synchronous; keep it off the event loop
+        with track_outbound("postmark"):
+            response = await asyncio.to_thread(
+                get_postmark_client().emails.send,
+                From=SENDER_EMAIL,
+                To=email,
+                Subject="Digi-Permit OTP Code / Nhyehyɛe Kɔd",
+                HtmlBody=html_content
+            )
+        logger.info(f"📧 OTP email sent: {response['Message']}")
     except Exception as e:
-        print(f"[EMAIL ERROR] Failed to send OTP to {email}: {e}")
+        logger.error(f"❌ Failed to send OTP email: {e}")
         raise
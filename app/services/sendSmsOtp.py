@@ -1,7 +1,10 @@
+import logging
 import os
 import httpx
-from urllib.parse import quote_plus
 from dotenv import load_dotenv
+from app.core.http import http_clients
+
+logger = logging.getLogger(__name__)
 
 load_dotenv()
 
@@ -24,22 +27,19 @@ async def send_sms_otp(contact: str, otp: str):
         f"This code expires in 5 minutes.\n\n"
         f"Akan: Wo nhyehyɛe kɔd ne {otp}. Ebɛyɛ adwuma mmerɛ 5 pɛ."
     )
-    encoded_message = quote_plus(message_body)
-
-    url = (
-        f"https://sms.arkesel.com/sms/api"
-        f"?action=send-sms"
-        f"&api_key={ARKESEL_API_KEY}"
-        f"&to={formatted_contact}"
-        f"&from={ARKESEL_SENDER_ID}"
-        f"&sms={encoded_message}"
-    )
+    params = {
+        "action": "send-sms",
+        "api_key": ARKESEL_API_KEY,
+        "to": formatted_contact,
+        "from": ARKESEL_SENDER_ID,
+        "sms": message_body,
+    }
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url)
-            response.raise_for_status()
-            print(f"[SMS] OTP sent to {formatted_contact}: {response.text}")
+        client = http_clients.get("arkesel")
+        response = await client.get("/sms/api", params=params)
+        response.raise_for_status()
+        logger.info("📱 OTP SMS sent")
     except httpx.HTTPError as e:
-        print(f"[SMS ERROR] Failed to send OTP to {formatted_contact}: {e}")
+        logger.error(f"❌ Failed to send OTP SMS: {e}")
         raise
@@ -0,0 +1,181 @@
+import logging
+from collections import defaultdict
+from typing import Dict, Iterable, Optional
+from sqlalchemy import delete, func, literal, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.constants import ApplicationStatus
+from app.models.application import ApplicationStatusRollup, PermitApplication
+
+logger = logging.getLogger(__name__)
+
+UNASSIGNED = 0
+
+
+def _status_key(status) -> str:
+    return status.value if hasattr(status, "value") else status
+
+
+class StatusRollupService:
+    """Incrementally maintained application counts per MMDA/department/committee/status"""
+
+    @staticmethod
+    def scope_for(application: PermitApplication) -> tuple:
+        return (
+            application.mmda_id,
+            application.department_id or UNASSIGNED,
+            application.committee_id or UNASSIGNED,
+        )
+
+    @staticmethod
+    async def adjust(db: AsyncSession, scope: tuple, status: ApplicationStatus, delta: int):
+        """Atomically add delta to one rollup bucket, creating it if missing"""
+        mmda_id, department_id, committee_id = scope
+        stmt = insert(ApplicationStatusRollup).values(
+            mmda_id=mmda_id,
+            department_id=department_id,
+            committee_id=committee_id,
+            status=status,
+            count=delta,
+        )
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_application_status_rollup_scope",
+            set_={"count": ApplicationStatusRollup.count + stmt.excluded.count},
+        )
+        await db.execute(stmt)
+
+    @staticmethod
+    async def lock_status(db: AsyncSession, application_id: int) -> Optional[ApplicationStatus]:
+        """
+        Row-lock an application and return its current status, to pass as
+        from_status. Call before changing the status in the session, so a
+        concurrent transition can't read the same old status and move the same
+        application out of a bucket twice.
+        """
+        return await db.scalar(
+            select(PermitApplication.status)
+            .where(PermitApplication.id == application_id)
+            .with_for_update()
+        )
+
+    @classmethod
+    async def record_transition(
+        cls,
+        db: AsyncSession,
+        application: PermitApplication,
+        from_status: Optional[ApplicationStatus],
+        to_status: ApplicationStatus,
+    ):
+        """
+        Move one application between status buckets in the caller's transaction.
+
+        Pass from_status=None for a newly created application; otherwise read it
+        under a row lock (lock_status or a FOR UPDATE load). Buckets are touched
+        in a fixed order so concurrent transitions cannot deadlock on each other.
+        """
+        if from_status == to_status:
+            return
+
+        scope = cls.scope_for(application)
+        deltas = {to_status: 1}
+        if from_status is not None:
+            deltas[from_status] = -1
+
+        for status in sorted(deltas, key=_status_key):
+            await cls.adjust(db, scope, status, deltas[status])
+
+    @staticmethod
+    async def reconcile(db: AsyncSession) -> int:
+        """Rebuild the rollup from permit_applications. Returns the number of buckets"""
+        # Block concurrent incremental updates while the table is rebuilt
+        await db.execute(text("LOCK TABLE application_status_rollup IN EXCLUSIVE MODE"))
+        await db.execute(delete(ApplicationStatusRollup))
+
+        department_id = func.coalesce(PermitApplication.department_id, literal(UNASSIGNED))
+        committee_id = func.coalesce(PermitApplication.committee_id, literal(UNASSIGNED))
+        counts = (
+            select(
+                PermitApplication.mmda_id,
+                department_id,
+                committee_id,
+                PermitApplication.status,
+                func.count(PermitApplication.id),
+            )
+            .group_by(PermitApplication.mmda_id, department_id, committee_id, PermitApplication.status)
+        )
+        result = await db.execute(
+            insert(ApplicationStatusRollup)
+            .from_select(["mmda_id", "department_id", "committee_id", "status", "count"], counts)
+            .returning(ApplicationStatusRollup.id)
+        )
+        buckets = len(result.all())
+        logger.info(f"✅ Rebuilt application status rollup ({buckets} buckets)")
+        return buckets
+
+    @classmethod
+    async def reconcile_if_empty(cls, db: AsyncSession) -> bool:
+        """Build the rollup for databases that have applications but no rollup yet"""
+        has_rollup = await db.scalar(select(ApplicationStatusRollup.id).limit(1))
+        has_applications = await db.scalar(select(PermitApplication.id).limit(1))
+        if has_rollup is not None or has_applications is None:
+            return False
+        await cls.reconcile(db)
+        return True
+
+    @staticmethod
+    async def counts_by_mmda(
+        db: AsyncSession,
+        mmda_ids: Iterable[int],
+        department_filter: Optional[Dict[int, int]] = None,
+    ) -> Dict[int, Dict[str, int]]:
+        """
+        Status counts per MMDA.
+
+        department_filter maps an MMDA id to the only department counted for it
+        (used for a reviewer's own MMDA); other MMDAs are counted in full.
+        """
+        department_filter = department_filter or {}
+        mmda_ids = list(mmda_ids)
+        result = await db.execute(
+            select(
+                ApplicationStatusRollup.mmda_id,
+                ApplicationStatusRollup.department_id,
+                ApplicationStatusRollup.status,
+                func.sum(ApplicationStatusRollup.count),
+            )
+            .where(ApplicationStatusRollup.mmda_id.in_(mmda_ids))
+            .group_by(
+                ApplicationStatusRollup.mmda_id,
+                ApplicationStatusRollup.department_id,
+                ApplicationStatusRollup.status,
+            )
+        )
+
+        counts = defaultdict(lambda: defaultdict(int))
+        for mmda_id, department_id, status, count in result:
+            if not count:
+                continue
+            if mmda_id in department_filter and department_filter[mmda_id] != department_id:
+                continue
+            counts[mmda_id][_status_key(status)] += int(count or 0)
+        return {mmda_id: dict(counts[mmda_id]) for mmda_id in mmda_ids}
+
+    @staticmethod
+    async def counts_by_department(db: AsyncSession, mmda_id: int) -> Dict[int, Dict[str, int]]:
+        """Status counts for every department of an MMDA, keyed by department id"""
+        result = await db.execute(
+            select(
+                ApplicationStatusRollup.department_id,
+                ApplicationStatusRollup.status,
+                func.sum(ApplicationStatusRollup.count),
+            )
+            .where(ApplicationStatusRollup.mmda_id == mmda_id)
+            .group_by(ApplicationStatusRollup.department_id, ApplicationStatusRollup.status)
+        )
+
+        counts = defaultdict(lambda: defaultdict(int))
+        for department_id, status, count in result:
+            if not count:
+                continue
+            counts[department_id][_status_key(status)] += int(count or 0)
+        return {department_id: dict(status_counts) for department_id, status_counts in counts.items()}
@@ -0,0 +1,27 @@
+from functools import lru_cache
+from app.core.config import settings
+from app.services.storage.base import StorageBackend, build_object_key, run_blocking
+
+STORAGE_BACKENDS = ("s3", "local")
+
+
+@lru_cache(maxsize=1)
+def get_storage() -> StorageBackend:
+    """Build the configured storage backend on first use"""
+    backend = (settings.STORAGE_BACKEND or "s3").lower()
+    if backend == "local":
+        from app.services.storage.local import LocalStorageBackend
+        return LocalStorageBackend()
+    if backend == "s3":
+        missing = [
+            name for name in ("AWS_REGION", "AWS_S3_BUCKET", "AWS_S3_BASE_URL")
+            if not getattr(settings, name)
+        ]
+        if missing:
+            raise RuntimeError(f"STORAGE_BACKEND=s3 requires {', '.join(missing)}")
+        from app.services.storage.s3 import S3StorageBackend
+        return S3StorageBackend()
+    raise RuntimeError(f"Unknown STORAGE_BACKEND {backend!r}. Must be one of: {list(STORAGE_BACKENDS)}")
+
+
+__all__ = ["StorageBackend", "build_object_key", "get_storage", "run_blocking"]
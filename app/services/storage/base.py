@@ -0,0 +1,90 @@
+import asyncio
+import uuid
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Optional
+from fastapi import UploadFile
+from slugify import slugify
+from app.core.config import settings
+
+PRESIGN_EXPIRES_SECONDS = 900
+
+
+@lru_cache(maxsize=1)
+def get_upload_executor() -> ThreadPoolExecutor:
+    """Bounded pool for blocking storage calls, shared by every upload on this worker"""
+    return ThreadPoolExecutor(
+        max_workers=settings.S3_UPLOAD_MAX_WORKERS,
+        thread_name_prefix="storage-io",
+    )
+
+
+async def run_blocking(fn, *args, **kwargs):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_upload_executor(), lambda: fn(*args, **kwargs))
+
+
+def build_object_key(filename: str, folder: str = "uploads", username: Optional[str] = None) -> str:
+    file_ext = filename.split(".")[-1]
+    base_name = ".".join(filename.split(".")[:-1])
+    safe_name = slugify(base_name)
+
+    # Add username or default fallback
+    user_segment = slugify(username) if username else "anonymous"
+
+    return f"{folder}/{user_segment}/{safe_name}-{uuid.uuid4()}.{file_ext}"
+
+
+class StorageBackend(ABC):
+    """
+    Where uploaded files live. Keys are slash-separated paths such as
+    "uploads/application_documents/ama/plan-<uuid>.pdf"; url() turns a key
+    into the public URL that gets stored on the database rows.
+    """
+
+    name: str = ""
+
+    @abstractmethod
+    def url(self, key: str) -> str:
+        ...
+
+    @abstractmethod
+    async def put(self, key: str, data: bytes, content_type: Optional[str] = None) -> None:
+        ...
+
+    @abstractmethod
+    async def stream(self, file: UploadFile, key: str) -> None:
+        """Store an UploadFile without holding it all in memory"""
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]:
+        ...
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        ...
+
+    @abstractmethod
+    async def head(self, key: str) -> Optional[Dict]:
+        """Return {"size", "content_type"} for a stored object, or None if it doesn't exist"""
+
+    @abstractmethod
+    async def presign(
+        self,
+        key: str,
+        content_type: str,
+        max_size: int,
+        method: str = "PUT",
+        expires_in: int = PRESIGN_EXPIRES_SECONDS,
+    ) -> Dict:
+        """
+        Return {"method", "upload_url", "headers", "fields"} that let a client
+        upload the object directly. Backends may answer with a different method
+        than requested; clients must follow the returned one.
+        """
+
+    async def upload(self, file: UploadFile, folder: str = "uploads", username: Optional[str] = None) -> str:
+        key = build_object_key(file.filename, folder, username)
+        await self.stream(file, key)
+        return self.url(key)
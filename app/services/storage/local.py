@@ -0,0 +1,125 @@
+import hashlib
+import hmac
+import mimetypes
+import os
+import time
+import uuid
+from pathlib import Path
+from typing import AsyncIterator, Dict, Optional
+from urllib.parse import urlencode
+from fastapi import UploadFile
+from app.core.config import settings
+from app.services.storage.base import PRESIGN_EXPIRES_SECONDS, StorageBackend, run_blocking
+
+CHUNK_SIZE = 1024 * 1024
+
+
+class LocalStorageBackend(StorageBackend):
+    """
+    Files on local disk under settings.LOCAL_STORAGE_ROOT, for development,
+    tests and offline benchmarks. Files are served by the /files route, which
+    hands the path to the ASGI server so reads can use sendfile where
+    supported. Presigned uploads are HMAC-signed PUTs to that same route.
+    Content types are derived from the file extension.
+    """
+
+    name = "local"
+
+    def __init__(self, root: Optional[str] = None, base_url: Optional[str] = None):
+        self.root = Path(root or settings.LOCAL_STORAGE_ROOT).resolve()
+        self.base_url = base_url or settings.LOCAL_STORAGE_BASE_URL
+
+    def path_for(self, key: str) -> Path:
+        path = (self.root / key).resolve()
+        if path == self.root or self.root not in path.parents:
+            raise ValueError("Invalid storage key")
+        return path
+
+    def url(self, key: str) -> str:
+        return f"{self.base_url}{key}"
+
+    async def write_chunks(self, key: str, chunks: AsyncIterator[bytes], max_size: Optional[int] = None) -> int:
+        """
+        Write chunks to a temporary file and move it into place, so readers
+        never see a partial file. Raises ValueError past max_size bytes.
+        """
+        path = self.path_for(key)
+        await run_blocking(path.parent.mkdir, parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.part")
+        handle = await run_blocking(open, tmp_path, "wb")
+        written = 0
+        try:
+            async for chunk in chunks:
+                written += len(chunk)
+                if max_size is not None and written > max_size:
+                    raise ValueError("File is too large")
+                await run_blocking(handle.write, chunk)
+            await run_blocking(handle.close)
+            await run_blocking(os.replace, tmp_path, path)
+        except BaseException:
+            handle.close()
+            tmp_path.unlink(missing_ok=True)
+            raise
+        return written
+
+    async def put(self, key: str, data: bytes, content_type: Optional[str] = None) -> None:
+        async def chunks():
+            yield data
+        await self.write_chunks(key, chunks())
+
+    async def stream(self, file: UploadFile, key: str) -> None:
+        async def chunks():
+            while chunk := await file.read(CHUNK_SIZE):
+                yield chunk
+        await self.write_chunks(key, chunks())
+
+    async def get(self, key: str) -> Optional[bytes]:
+        path = self.path_for(key)
+        try:
+            return await run_blocking(path.read_bytes)
+        except FileNotFoundError:
+            return None
+
+    async def delete(self, key: str) -> None:
+        await run_blocking(self.path_for(key).unlink, missing_ok=True)
+
+    async def head(self, key: str) -> Optional[Dict]:
+        path = self.path_for(key)
+        try:
+            stat = await run_blocking(path.stat)
+        except FileNotFoundError:
+            return None
+        return {"size": stat.st_size, "content_type": mimetypes.guess_type(path.name)[0]}
+
+    @staticmethod
+    def sign(key: str, content_type: str, max_size: int, expires: int) -> str:
+        message = f"{key}\n{content_type}\n{max_size}\n{expires}".encode()
+        return hmac.new(settings.SECRET_KEY.encode(), message, hashlib.sha256).hexdigest()
+
+    def verify_signature(self, key: str, content_type: str, max_size: int, expires: int, signature: str) -> bool:
+        if expires < time.time():
+            return False
+        return hmac.compare_digest(self.sign(key, content_type, max_size, expires), signature)
+
+    async def presign(
+        self,
+        key: str,
+        content_type: str,
+        max_size: int,
+        method: str = "PUT",
+        expires_in: int = PRESIGN_EXPIRES_SECONDS,
+    ) -> Dict:
+        # Only signed PUTs are implemented locally, whatever the caller asked for
+        self.path_for(key)
+        expires = int(time.time()) + expires_in
+        query = urlencode({
+            "expires": expires,
+            "max_size": max_size,
+            "signature": self.sign(key, content_type, max_size, expires),
+        })
+        return {
+            "method": "PUT",
+            "upload_url": f"{self.url(key)}?{query}",
+            "headers": {"Content-Type": content_type},
+            "fields": {},
+        }
@@ -0,0 +1,192 @@
+import asyncio
+import logging
+import time
+from functools import lru_cache
+from typing import Dict, Optional
+import boto3
+from botocore.exceptions import ClientError
+from fastapi import UploadFile
+from app.core.config import settings
+from app.core.telemetry import OUTBOUND_LATENCY
+from app.services.storage.base import PRESIGN_EXPIRES_SECONDS, StorageBackend, run_blocking
+
+logger = logging.getLogger(__name__)
+
+# S3 rejects multipart parts smaller than 5 MiB (except the last one)
+MIN_PART_SIZE = 5 * 1024 * 1024
+
+
+def _start_timer(context, **kwargs):
+    context["telemetry_started"] = time.perf_counter()
+
+
+def _record_call(context, outcome: str):
+    started = context.pop("telemetry_started", None)
+    if started is not None:
+        OUTBOUND_LATENCY.observe(time.perf_counter() - started, "s3", outcome)
+
+
+def _after_call(http_response, context, **kwargs):
+    _record_call(context, "error" if http_response.status_code >= 500 else "ok")
+
+
+def _after_call_error(context, **kwargs):
+    _record_call(context, "error")
+
+
+@lru_cache(maxsize=1)
+def get_s3_client():
+    """boto3 clients are thread-safe; build one lazily and share it"""
+    client = boto3.client(
+        "s3",
+        region_name=settings.AWS_REGION,
+        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+    )
+    # Time every API call, including each multipart part, for the telemetry endpoint
+    client.meta.events.register("before-call.s3", _start_timer)
+    client.meta.events.register("after-call.s3", _after_call)
+    client.meta.events.register("after-call-error.s3", _after_call_error)
+    return client
+
+
+async def stream_upload_to_s3(
+    file: UploadFile,
+    key: str,
+    part_size: Optional[int] = None,
+    concurrency: Optional[int] = None,
+) -> None:
+    """
+    Stream an UploadFile to S3 without blocking the event loop.
+
+    Small files go up in a single PutObject. Larger files are read one part at a
+    time and sent as a multipart upload with at most `concurrency` parts in
+    flight, so memory per upload stays around part_size * concurrency.
+    """
+    client = get_s3_client()
+    bucket = settings.AWS_S3_BUCKET
+    part_size = max(part_size or settings.S3_UPLOAD_PART_SIZE, MIN_PART_SIZE)
+    concurrency = concurrency or settings.S3_UPLOAD_CONCURRENCY
+    extra = {"ContentType": file.content_type} if file.content_type else {}
+
+    first_chunk = await file.read(part_size)
+    next_chunk = await file.read(part_size) if len(first_chunk) == part_size else b""
+    if not next_chunk:
+        await run_blocking(client.put_object, Bucket=bucket, Key=key, Body=first_chunk, **extra)
+        return
+
+    upload = await run_blocking(client.create_multipart_upload, Bucket=bucket, Key=key, **extra)
+    upload_id = upload["UploadId"]
+    slots = asyncio.Semaphore(concurrency)
+    tasks = []
+
+    async def send_part(part_number: int, body: bytes):
+        try:
+            response = await run_blocking(
+                client.upload_part,
+                Bucket=bucket, Key=key, UploadId=upload_id,
+                PartNumber=part_number, Body=body,
+            )
+            return {"PartNumber": part_number, "ETag": response["ETag"]}
+        finally:
+            slots.release()
+
+    try:
+        part_number = 1
+        chunk = first_chunk
+        while chunk:
+            # Wait for a free slot before reading more, so reads can't outrun uploads
+            await slots.acquire()
+            tasks.append(asyncio.create_task(send_part(part_number, chunk)))
+            part_number += 1
+            if next_chunk:
+                chunk, next_chunk = next_chunk, b""
+            else:
+                chunk = await file.read(part_size)
+
+        parts = await asyncio.gather(*tasks)
+        await run_blocking(
+            client.complete_multipart_upload,
+            Bucket=bucket, Key=key, UploadId=upload_id,
+            MultipartUpload={"Parts": list(parts)},
+        )
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        logger.error(f"❌ Multipart upload of {key} failed, aborting")
+        await run_blocking(client.abort_multipart_upload, Bucket=bucket, Key=key, UploadId=upload_id)
+        raise
+
+
+class S3StorageBackend(StorageBackend):
+    """Objects in settings.AWS_S3_BUCKET, served from settings.AWS_S3_BASE_URL"""
+
+    name = "s3"
+
+    @property
+    def bucket(self) -> str:
+        return settings.AWS_S3_BUCKET
+
+    def url(self, key: str) -> str:
+        return f"{settings.AWS_S3_BASE_URL}{key}"
+
+    async def put(self, key: str, data: bytes, content_type: Optional[str] = None) -> None:
+        extra = {"ContentType": content_type} if content_type else {}
+        await run_blocking(get_s3_client().put_object, Bucket=self.bucket, Key=key, Body=data, **extra)
+
+    async def stream(self, file: UploadFile, key: str) -> None:
+        await stream_upload_to_s3(file, key)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        try:
+            response = await run_blocking(get_s3_client().get_object, Bucket=self.bucket, Key=key)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return None
+            raise
+        return await run_blocking(response["Body"].read)
+
+    async def delete(self, key: str) -> None:
+        await run_blocking(get_s3_client().delete_object, Bucket=self.bucket, Key=key)
+
+    async def head(self, key: str) -> Optional[Dict]:
+        try:
+            response = await run_blocking(get_s3_client().head_object, Bucket=self.bucket, Key=key)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return None
+            raise
+        return {"size": response.get("ContentLength", 0), "content_type": response.get("ContentType")}
+
+    async def presign(
+        self,
+        key: str,
+        content_type: str,
+        max_size: int,
+        method: str = "PUT",
+        expires_in: int = PRESIGN_EXPIRES_SECONDS,
+    ) -> Dict:
+        client = get_s3_client()
+        if method == "POST":
+            # S3 enforces the size limit itself for POST policies
+            presigned = await run_blocking(
+                client.generate_presigned_post,
+                Bucket=self.bucket,
+                Key=key,
+                Fields={"Content-Type": content_type},
+                Conditions=[
+                    {"Content-Type": content_type},
+                    ["content-length-range", 1, max_size],
+                ],
+                ExpiresIn=expires_in,
+            )
+            return {"method": "POST", "upload_url": presigned["url"], "headers": {}, "fields": presigned["fields"]}
+
+        url = await run_blocking(
+            client.generate_presigned_url,
+            "put_object",
+            Params={"Bucket": self.bucket, "Key": key, "ContentType": content_type},
+            ExpiresIn=expires_in,
+        )
+        return {"method": "PUT", "upload_url": url, "headers": {"Content-Type": content_type}, "fields": {}}
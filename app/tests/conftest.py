@@ -0,0 +1,26 @@
+from contextlib import contextmanager
+from importlib import import_module
+import pytest
+from app.core.config import settings
+from app.core.query_stats import track_queries
+
+# Register every mapper so relationships resolve in tests that build models or statements
+for model in settings.DB_MODELS:
+    import_module(model)
+
+
+@pytest.fixture
+def assert_max_queries():
+    """
+    Fail if the block runs more SQL statements than allowed:
+
+        with assert_max_queries(3):
+            client.get("/permits/reviewer-map")
+    """
+    @contextmanager
+    def check(limit: int):
+        with track_queries() as stats:
+            yield stats
+        assert stats.count <= limit, f"Expected at most {limit} statements, got {stats.summary()}"
+
+    return check
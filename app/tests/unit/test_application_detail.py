@@ -0,0 +1,41 @@
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from app.models.application import PermitApplication
+from app.services.application_detail import ALL_SECTIONS, ApplicationDetailService
+
+
+def compiled(sections) -> str:
+    stmt = select(PermitApplication).options(*ApplicationDetailService.options(sections))
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def test_parse_include():
+    assert ApplicationDetailService.parse_include(None) == ALL_SECTIONS
+    assert ApplicationDetailService.parse_include(" documents, payments ,") == {"documents", "payments"}
+    with pytest.raises(ValueError, match="status_history"):
+        ApplicationDetailService.parse_include("documents,status_history")
+
+
+def test_collections_are_not_joined_into_the_main_query():
+    sql = compiled(ALL_SECTIONS)
+    # To-one relationships are joined...
+    assert "JOIN mmdas" in sql
+    assert "JOIN users" in sql
+    # ...collections come from their own selectin queries
+    for table in ("application_documents", "application_reviews", "inspections", "payments", "application_status_history"):
+        assert f"JOIN {table}" not in sql
+
+
+def test_serialize_marks_skipped_sections_as_missing():
+    class Schema:
+        @staticmethod
+        def model_validate(application):
+            return Schema
+
+        @staticmethod
+        def model_dump():
+            return {"id": 1, "documents": [], "payments": [{"amount": 5}], "reviews": []}
+
+    data = ApplicationDetailService.serialize(object(), Schema, {"payments"})
+    assert data == {"id": 1, "documents": None, "payments": [{"amount": 5}], "reviews": None}
@@ -0,0 +1,116 @@
+import csv
+import io
+import json
+from contextlib import asynccontextmanager
+from datetime import date, datetime
+from unittest.mock import MagicMock
+import pytest
+from sqlalchemy.dialects import postgresql
+import app.main  # noqa: F401 - configures the mappers
+from fastapi import HTTPException
+from app.api.v1.routers.documents import build_export_filter, export_applications
+from app.core.constants import ApplicationStatus, UserRole
+from app.services.application_export import ApplicationExportService
+from app.services.principal import Principal
+
+NAMES = list(ApplicationExportService.export_columns())
+
+
+def row(app_id):
+    values = dict.fromkeys(NAMES)
+    values.update(id=app_id, application_number=f"APP-{app_id}", status="submitted", created_at=datetime(2025, 3, 1, 9, 30))
+    return tuple(values[name] for name in NAMES)
+
+
+def session_factory(partitions):
+    result = MagicMock()
+
+    async def iterate():
+        for partition in partitions:
+            yield partition
+
+    result.partitions = iterate
+    db = MagicMock()
+
+    async def stream(query):
+        db.query = query
+        return result
+
+    db.stream = stream
+
+    @asynccontextmanager
+    async def factory():
+        yield db
+
+    return factory, db
+
+
+def compile_sql(query):
+    return str(query.compile(dialect=postgresql.dialect()))
+
+
+def test_export_query_streams_tuples_in_id_order():
+    query = ApplicationExportService.build_export_query(build_export_filter("admin", Principal(user_id=1, role=UserRole.ADMIN, staff_id=1, mmda_id=4)), batch_size=500)
+
+    assert query.get_execution_options()["yield_per"] == 500
+    assert compile_sql(query).rstrip().endswith("ORDER BY permit_applications.id")
+
+
+def test_reviewer_scope_and_filters():
+    staff = Principal(user_id=1, role=UserRole.ADMIN, staff_id=1, department_id=2, mmda_id=4, committee_ids=(9,))
+    where = build_export_filter("reviewer", staff, [ApplicationStatus.APPROVED], date(2024, 1, 1), date(2024, 12, 31))
+    sql = compile_sql(where)
+
+    assert "permit_applications.department_id" in sql
+    assert "permit_applications.committee_id IN" in sql
+    assert "permit_applications.status IN" in sql
+    assert where.compile(dialect=postgresql.dialect()).params["created_at_2"] == date(2025, 1, 1)
+
+
+@pytest.mark.asyncio
+async def test_stream_encodes_one_chunk_per_partition():
+    factory, db = session_factory([[row(1), row(2)], [row(3)]])
+
+    chunks = [chunk async for chunk in ApplicationExportService.stream(factory, True, "ndjson")]
+
+    assert len(chunks) == 2
+    lines = b"".join(chunks).splitlines()
+    assert [json.loads(line)["id"] for line in lines] == [1, 2, 3]
+    assert json.loads(lines[0])["created_at"] == "2025-03-01T09:30:00"
+
+
+@pytest.mark.asyncio
+async def test_csv_starts_with_header_and_blanks_nulls():
+    factory, _ = session_factory([[row(1)]])
+
+    body = b"".join([chunk async for chunk in ApplicationExportService.stream(factory, True, "csv")]).decode()
+    header, first = body.splitlines()
+
+    assert header.split(",") == NAMES
+    assert first.startswith("1,APP-1,,submitted,")
+    assert "2025-03-01T09:30:00" in first
+
+
+def test_csv_neutralizes_formula_cells():
+    body = ApplicationExportService.encode_csv([
+        ("=HYPERLINK(\"http://x\")", "+233 Main St", "-1+1", "@SUM(A1)", "Ama's Villa", -5, date(2025, 3, 1)),
+    ]).decode()
+
+    assert next(csv.reader(io.StringIO(body))) == [
+        "'=HYPERLINK(\"http://x\")", "'+233 Main St", "'-1+1", "'@SUM(A1)", "Ama's Villa", "-5", "2025-03-01",
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("role", [UserRole.REVIEW_OFFICER, UserRole.INSPECTION_OFFICER])
+async def test_admin_scope_export_is_admin_only(role):
+    staff = Principal(user_id=2, role=role, staff_id=5, mmda_id=4)
+
+    with pytest.raises(HTTPException) as exc:
+        await export_applications(staff=staff, format="csv", scope="admin", status=None)
+    assert exc.value.status_code == 403
+
+    # Their own reviewer scope is still allowed
+    response = await export_applications(staff=staff, format="csv", scope="reviewer", status=None)
+    assert response.status_code == 200
+    assert response.headers["content-disposition"].endswith('-reviewer.csv"')
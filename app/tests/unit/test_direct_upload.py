@@ -0,0 +1,86 @@
+import pytest
+from app.core.config import settings
+from app.services.storage import s3
+from app.services.direct_upload import DirectUploadService
+from app.services.storage import get_storage
+
+moto = pytest.importorskip("moto")
+
+BUCKET = "digi-permit-test"
+
+
+@pytest.fixture
+def s3_bucket(monkeypatch):
+    monkeypatch.setattr(settings, "AWS_S3_BUCKET", BUCKET)
+    monkeypatch.setattr(settings, "AWS_REGION", "us-east-1")
+    monkeypatch.setattr(settings, "AWS_S3_BASE_URL", f"https://{BUCKET}.s3.amazonaws.com/")
+    monkeypatch.setattr(settings, "STORAGE_BACKEND", "s3")
+    get_storage.cache_clear()
+    with moto.mock_aws():
+        s3.get_s3_client.cache_clear()
+        client = s3.get_s3_client()
+        client.create_bucket(Bucket=BUCKET)
+        yield client
+    s3.get_s3_client.cache_clear()
+    get_storage.cache_clear()
+
+
+def test_keys_are_scoped_to_the_caller():
+    key = DirectUploadService.build_key("application_document", 7, "Site Plan.PDF")
+
+    assert key.startswith("uploads/application_documents/user-7/site-plan-")
+    assert key.endswith(".pdf")
+    assert DirectUploadService.owns_key("application_document", 7, key)
+    assert not DirectUploadService.owns_key("application_document", 8, key)
+    assert not DirectUploadService.owns_key("inspection_photo", 7, key)
+    assert not DirectUploadService.owns_key("application_document", 7, "uploads/application_documents/user-7/../user-8/x.pdf")
+
+
+@pytest.mark.asyncio
+async def test_presign_rejects_disallowed_files(s3_bucket):
+    with pytest.raises(ValueError):
+        await DirectUploadService.presign("inspection_photo", 1, "notes.pdf", "application/pdf", 100)
+    with pytest.raises(ValueError):
+        await DirectUploadService.presign("user_document", 1, "card.png", "image/png", 500 * 1024 * 1024)
+
+
+@pytest.mark.asyncio
+async def test_presigned_put_then_verify(s3_bucket):
+    data = b"%PDF-1.4 direct"
+    presigned = await DirectUploadService.presign(
+        "application_document", 3, "plan.pdf", "application/pdf", len(data)
+    )
+    assert presigned["method"] == "PUT"
+    assert presigned["key"] in presigned["upload_url"]
+    assert "X-Amz-Signature" in presigned["upload_url"] or "Signature=" in presigned["upload_url"]
+
+    # Stand-in for the browser's PUT to the signed URL
+    s3_bucket.put_object(Bucket=BUCKET, Key=presigned["key"], Body=data, ContentType="application/pdf")
+
+    head = await DirectUploadService.verify_object("application_document", presigned["key"], len(data))
+    assert head["size"] == len(data)
+
+
+@pytest.mark.asyncio
+async def test_verify_rejects_missing_and_mismatched_objects(s3_bucket):
+    key = DirectUploadService.build_key("inspection_photo", 3, "crack.jpg")
+    with pytest.raises(ValueError, match="not found"):
+        await DirectUploadService.verify_object("inspection_photo", key)
+
+    s3_bucket.put_object(Bucket=BUCKET, Key=key, Body=b"not an image", ContentType="text/plain")
+    with pytest.raises(ValueError, match="Content type"):
+        await DirectUploadService.verify_object("inspection_photo", key)
+    # Rejected objects are removed from the bucket
+    assert await get_storage().head(key) is None
+
+
+@pytest.mark.asyncio
+async def test_presigned_post_enforces_size_range(s3_bucket):
+    presigned = await DirectUploadService.presign(
+        "user_document", 5, "card.jpg", "image/jpeg", 2048, method="POST"
+    )
+
+    assert presigned["method"] == "POST"
+    assert presigned["fields"]["key"] == presigned["key"]
+    assert presigned["fields"]["Content-Type"] == "image/jpeg"
+    assert "policy" in presigned["fields"]
@@ -0,0 +1,56 @@
+import httpx
+import pytest
+from app.core.http import HTTPClientRegistry, IntegrationConfig, http_clients
+from app.core.config import settings
+from app.core.constants import PaymentPurpose
+from app.schemas.payment import PaymentInitRequest
+from app.services.PaystackServices import PaystackService
+
+
+@pytest.mark.asyncio
+async def test_registry_reuses_one_client_per_integration():
+    registry = HTTPClientRegistry({"svc": IntegrationConfig(base_url="https://svc.test", read_timeout=3.0)})
+    await registry.init()
+
+    client = registry.get("svc")
+    assert registry.get("svc") is client
+    assert client.timeout.read == 3.0
+    assert str(client.base_url) == "https://svc.test"
+    with pytest.raises(KeyError):
+        registry.get("missing")
+
+    await registry.close()
+    assert client.is_closed
+    # Usable again after close, e.g. from a script outside the lifespan
+    assert not registry.get("svc").is_closed
+    await registry.close()
+
+
+@pytest.mark.asyncio
+async def test_paystack_uses_the_shared_client(monkeypatch):
+    seen = []
+
+    def handler(request: httpx.Request):
+        seen.append(request)
+        return httpx.Response(200, json={
+            "status": True,
+            "data": {"authorization_url": "https://checkout.test/abc", "reference": "REF-1", "access_code": "abc"},
+        })
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setitem(http_clients._clients, "paystack", client)
+    monkeypatch.setattr(settings, "PAYSTACK_SECRET_KEY", "sk_test")
+
+    response = await PaystackService.initialize_payment(PaymentInitRequest(
+        email="ama@example.com",
+        amount=150.5,
+        callback_url="https://app.test/callback",
+        reference="REF-1",
+        purpose=list(PaymentPurpose)[0],
+        user_id=1,
+    ))
+
+    assert response.reference == "REF-1"
+    assert seen[0].url == "https://api.paystack.co/transaction/initialize"
+    assert seen[0].headers["Authorization"] == "Bearer sk_test"
+    await client.aclose()
@@ -0,0 +1,43 @@
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock
+import pytest
+from scripts import init_db
+
+
+@pytest.mark.asyncio
+async def test_schema_and_seeding_happen_under_the_init_lock(monkeypatch):
+    calls = []
+    manager = init_db.session_manager
+
+    @asynccontextmanager
+    async def advisory_lock(key):
+        calls.append(("lock", key))
+        yield
+        calls.append(("unlock", key))
+
+    @asynccontextmanager
+    async def get_session():
+        yield AsyncMock()
+
+    async def record(name, result=None):
+        calls.append(name)
+        return result
+
+    monkeypatch.setattr(manager, "ensure_database", lambda: record("ensure_database"))
+    monkeypatch.setattr(manager, "setup_schema", lambda: record("setup_schema"))
+    monkeypatch.setattr(manager, "advisory_lock", advisory_lock)
+    monkeypatch.setattr(manager, "get_session", get_session)
+    monkeypatch.setattr(init_db, "seed_all", lambda db, force: record("seed_all", True))
+    monkeypatch.setattr(init_db.StatusRollupService, "reconcile_if_empty", lambda db: record("reconcile"))
+    monkeypatch.setattr(init_db.MMDABoundaryService, "backfill", lambda db: record("backfill"))
+
+    assert await init_db.run_init() is True
+    assert calls == [
+        "ensure_database",
+        ("lock", init_db.INIT_LOCK_KEY),
+        "setup_schema",
+        "seed_all",
+        "reconcile",
+        "backfill",
+        ("unlock", init_db.INIT_LOCK_KEY),
+    ]
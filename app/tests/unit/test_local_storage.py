@@ -0,0 +1,70 @@
+import io
+import pytest
+from fastapi import UploadFile
+from starlette.datastructures import Headers
+from app.core.config import settings
+from app.services.storage import get_storage
+from app.services.storage.local import LocalStorageBackend
+
+
+@pytest.fixture
+def storage(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "STORAGE_BACKEND", "local")
+    monkeypatch.setattr(settings, "LOCAL_STORAGE_ROOT", str(tmp_path))
+    monkeypatch.setattr(settings, "LOCAL_STORAGE_BASE_URL", "http://testserver/files/")
+    get_storage.cache_clear()
+    yield get_storage()
+    get_storage.cache_clear()
+
+
+def test_backend_follows_settings(storage):
+    assert isinstance(storage, LocalStorageBackend)
+
+
+@pytest.mark.asyncio
+async def test_stream_put_get_head_delete(storage):
+    upload = UploadFile(
+        file=io.BytesIO(b"%PDF-1.4 local"),
+        filename="site plan.pdf",
+        headers=Headers({"content-type": "application/pdf"}),
+    )
+    url = await storage.upload(upload, folder="uploads/test", username="Ama")
+
+    key = url.removeprefix("http://testserver/files/")
+    assert key.startswith("uploads/test/ama/site-plan-")
+    assert await storage.get(key) == b"%PDF-1.4 local"
+    assert await storage.head(key) == {"size": 14, "content_type": "application/pdf"}
+
+    await storage.delete(key)
+    assert await storage.get(key) is None
+    assert await storage.head(key) is None
+
+
+@pytest.mark.asyncio
+async def test_keys_cannot_escape_the_root(storage):
+    with pytest.raises(ValueError):
+        await storage.put("../outside.txt", b"nope")
+
+
+@pytest.mark.asyncio
+async def test_write_chunks_enforces_max_size(storage):
+    async def chunks():
+        yield b"x" * 10
+        yield b"x" * 10
+
+    with pytest.raises(ValueError):
+        await storage.write_chunks("uploads/big.bin", chunks(), max_size=15)
+    assert list(storage.root.rglob("*.part")) == []
+
+
+@pytest.mark.asyncio
+async def test_presigned_put_signature(storage):
+    presigned = await storage.presign("uploads/a.png", "image/png", 1024, method="POST")
+
+    assert presigned["method"] == "PUT"
+    query = dict(part.split("=") for part in presigned["upload_url"].split("?")[1].split("&"))
+    expires, signature = int(query["expires"]), query["signature"]
+    assert storage.verify_signature("uploads/a.png", "image/png", 1024, expires, signature)
+    assert not storage.verify_signature("uploads/a.png", "image/jpeg", 1024, expires, signature)
+    assert not storage.verify_signature("uploads/a.png", "image/png", 4096, expires, signature)
+    assert not storage.verify_signature("uploads/a.png", "image/png", 1024, 0, signature)
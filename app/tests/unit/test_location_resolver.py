@@ -0,0 +1,89 @@
+import time
+from unittest.mock import AsyncMock, MagicMock
+import pytest
+from geoalchemy2.shape import from_shape
+from shapely.geometry import Polygon, box, mapping
+from app.services.location_resolver import LocationResolver
+
+
+def build_resolver():
+    resolver = LocationResolver()
+    # A 20x13 grid of square "districts" over Ghana's rough extent
+    mmda_rows = []
+    for i in range(20):
+        for j in range(13):
+            cell = box(-3.25 + i * 0.2, 4.7 + j * 0.5, -3.05 + i * 0.2, 5.2 + j * 0.5)
+            mmda_rows.append((i * 13 + j + 1, f"District {i}-{j}", "Region", "district", None, mapping(cell)))
+    zoning_rows = [
+        (1, "R1", "Low Density Residential", from_shape(Polygon([(-0.3, 5.5), (-0.1, 5.5), (-0.1, 5.7), (-0.3, 5.7)]), srid=4326)),
+    ]
+    resolver.load(mmda_rows, zoning_rows)
+    return resolver
+
+
+def test_point_resolves_to_containing_mmda_and_district():
+    resolver = build_resolver()
+    result = resolver.locate_in_memory(5.6, -0.2)
+
+    assert result["mmda"]["name"] == "District 15-1"
+    assert result["zoning_district"] == {"id": 1, "code": "R1", "name": "Low Density Residential"}
+
+
+def test_point_outside_every_polygon_resolves_to_none():
+    resolver = build_resolver()
+    assert resolver.locate_in_memory(0.0, 0.0) == {"mmda": None, "zoning_district": None}
+
+
+def test_in_memory_lookup_is_fast():
+    resolver = build_resolver()
+    timings = []
+    for k in range(1000):
+        started = time.perf_counter()
+        resolver.locate_in_memory(4.8 + (k % 60) * 0.1, -3.2 + (k % 40) * 0.1)
+        timings.append(time.perf_counter() - started)
+
+    timings.sort()
+    assert timings[int(len(timings) * 0.99)] < 0.005
+
+
+def db_returning(mmda, district):
+    results = [MagicMock(), MagicMock()]
+    results[0].first.return_value = mmda
+    results[1].first.return_value = district
+    db = AsyncMock()
+    db.execute.side_effect = results
+    return db
+
+
+@pytest.mark.asyncio
+async def test_locate_answers_from_postgis_first():
+    resolver = build_resolver()
+    db = db_returning((99, "From PostGIS", "Greater Accra", "metropolitan"), None)
+
+    result = await resolver.locate(db, 5.6, -0.2)
+
+    assert result == {
+        "mmda": {"id": 99, "name": "From PostGIS", "region": "Greater Accra", "type": "metropolitan"},
+        "zoning_district": None,
+    }
+    assert db.execute.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_locate_falls_back_to_the_tree_when_postgis_fails():
+    resolver = build_resolver()
+    db = AsyncMock()
+    db.execute.side_effect = ConnectionError("database unavailable")
+
+    result = await resolver.locate(db, 5.6, -0.2)
+
+    assert result["mmda"]["name"] == "District 15-1"
+
+
+@pytest.mark.asyncio
+async def test_locate_without_a_loaded_tree_raises_the_database_error():
+    db = AsyncMock()
+    db.execute.side_effect = ConnectionError("database unavailable")
+
+    with pytest.raises(ConnectionError):
+        await LocationResolver().locate(db, 5.6, -0.2)
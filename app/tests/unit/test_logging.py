@@ -0,0 +1,50 @@
+import io
+import json
+import logging
+import pytest
+from app.core.logging import SamplingFilter, configure_logging, parse_levels, shutdown_logging
+
+
+@pytest.fixture
+def restore_logging():
+    root = logging.getLogger()
+    handlers, level = list(root.handlers), root.level
+    yield
+    shutdown_logging()
+    root.handlers[:] = handlers
+    root.setLevel(level)
+    for name in ("app.test", "sqlalchemy.engine"):
+        logging.getLogger(name).setLevel(logging.NOTSET)
+
+
+def test_parse_levels_ignores_bad_entries():
+    assert parse_levels("app.services=debug, httpx=WARNING,broken,nope=LOUD,") == {
+        "app.services": logging.DEBUG,
+        "httpx": logging.WARNING,
+    }
+    assert parse_levels(None) == {}
+
+
+def test_sampling_filter_always_keeps_warnings():
+    drop_all = SamplingFilter(0.0)
+    info = logging.LogRecord("x", logging.INFO, __file__, 1, "hi", None, None)
+    warning = logging.LogRecord("x", logging.WARNING, __file__, 1, "careful", None, None)
+    assert not drop_all.filter(info)
+    assert drop_all.filter(warning)
+    assert SamplingFilter(1.0).filter(info)
+
+
+def test_json_output_with_module_levels(restore_logging):
+    stream = io.StringIO()
+    configure_logging(level="WARNING", fmt="json", levels="app.test=DEBUG", sample_rate=1.0, stream=stream)
+
+    logging.getLogger("app.test").debug("loaded %s rows", 3, extra={"user_id": 7})
+    logging.getLogger("app.other").info("hidden")
+    assert logging.getLogger("sqlalchemy.engine").level == logging.WARNING
+    shutdown_logging()
+
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert len(lines) == 1
+    assert lines[0]["logger"] == "app.test"
+    assert lines[0]["message"] == "loaded 3 rows"
+    assert lines[0]["user_id"] == 7
@@ -0,0 +1,32 @@
+import pytest
+from sqlalchemy.dialects import postgresql
+from app.services.mmda_boundaries import MMDABoundaryService
+
+
+@pytest.mark.parametrize("zoom,expected", [
+    (None, "full"),
+    (5, "low"),
+    (9, "medium"),
+    (12, "high"),
+    (16, "full"),
+])
+def test_zoom_selects_detail_level(zoom, expected):
+    assert MMDABoundaryService.resolve_detail(zoom=zoom) == expected
+
+
+def test_explicit_detail_wins_over_zoom():
+    assert MMDABoundaryService.resolve_detail("medium", zoom=16) == "medium"
+
+
+def test_unknown_detail_is_rejected():
+    with pytest.raises(ValueError):
+        MMDABoundaryService.resolve_detail("tiny")
+
+
+def test_simplified_query_skips_raw_polygons():
+    sql = str(MMDABoundaryService.mmda_query("low").compile(dialect=postgresql.dialect()))
+
+    assert "ST_AsGeoJSON(mmdas.boundary_low" in sql
+    # The raw JSON column is only read as the fallback inside coalesce
+    assert "mmdas.jurisdiction_boundaries," not in sql
+    assert "ST_AsEWKB" not in sql
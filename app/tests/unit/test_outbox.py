@@ -0,0 +1,195 @@
+import asyncio
+from datetime import datetime, timedelta
+from contextlib import asynccontextmanager
+import pytest
+from sqlalchemy.dialects import postgresql
+from unittest.mock import AsyncMock, MagicMock
+from app.core.constants import OutboxStatus
+from app.models.notification import OutboxMessage
+from app.services.otpService import OTP_EXPIRY_MINUTES, OtpService
+from app.services.outbox import (
+    MAX_BACKOFF_SECONDS,
+    ClaimedMessage,
+    DeliveryOutcome,
+    OutboxService,
+    OutboxWorker,
+)
+
+
+class FakeProvider:
+    """Records deliveries; fails the first `failures` calls per recipient"""
+
+    def __init__(self, failures: int = 0, delay: float = 0):
+        self.failures = failures
+        self.delay = delay
+        self.sent = []
+        self.calls = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, recipient, kind, payload):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            self.calls[recipient] = self.calls.get(recipient, 0) + 1
+            if self.calls[recipient] <= self.failures:
+                raise ConnectionError("provider unavailable")
+            self.sent.append((recipient, kind, payload))
+        finally:
+            self.in_flight -= 1
+
+
+def claimed(message_id, channel="sms", attempts=0, expires_at=None):
+    return ClaimedMessage(message_id, channel, f"+23320000000{message_id}", "otp", {"code": "123456"}, attempts, expires_at)
+
+
+@pytest.mark.asyncio
+async def test_send_otp_only_queues_the_message():
+    db = AsyncMock()
+    db.add = MagicMock()
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = None
+    db.execute.return_value = result
+
+    await OtpService().send_otp("ama@example.com", "email", db)
+
+    added = [call.args[0] for call in db.add.call_args_list]
+    outbox = [obj for obj in added if isinstance(obj, OutboxMessage)]
+    assert len(outbox) == 1
+    assert outbox[0].channel == "email"
+    assert outbox[0].recipient == "ama@example.com"
+    assert len(outbox[0].payload["code"]) == 6
+    assert outbox[0].expires_at - datetime.utcnow() <= timedelta(minutes=OTP_EXPIRY_MINUTES)
+    # The OTP row and the outbox entry go out in one commit
+    db.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_worker_limits_concurrency_per_channel():
+    sms = FakeProvider(delay=0.01)
+    email = FakeProvider(delay=0.01)
+    worker = OutboxWorker(None, {"sms": sms, "email": email}, concurrency={"sms": 2, "email": 5}, poll_seconds=0)
+
+    messages = [claimed(i, "sms") for i in range(6)] + [claimed(i, "email") for i in range(6, 11)]
+    outcomes = await worker.deliver_batch(messages)
+
+    assert all(outcome.delivered for outcome in outcomes)
+    assert sms.max_in_flight == 2
+    assert email.max_in_flight == 5
+
+
+@pytest.mark.asyncio
+async def test_failed_delivery_is_reported_not_raised():
+    worker = OutboxWorker(None, {"sms": FakeProvider(failures=1)}, poll_seconds=0)
+
+    first, unknown = await worker.deliver_batch([claimed(1), claimed(2, channel="pigeon")])
+
+    assert not first.delivered and "provider unavailable" in first.error
+    assert not unknown.delivered and "pigeon" in unknown.error
+    (retry,) = await worker.deliver_batch([claimed(1, attempts=1)])
+    assert retry.delivered
+
+
+def test_backoff_grows_and_is_capped():
+    delays = [OutboxService.backoff_seconds(attempts) for attempts in range(1, 15)]
+    assert delays[0] < delays[3] < delays[6]
+    assert max(delays) <= MAX_BACKOFF_SECONDS * 1.2
+
+
+@pytest.mark.asyncio
+async def test_record_outcomes_retries_then_gives_up():
+    db = AsyncMock()
+
+    await OutboxService.record_outcomes(db, [
+        DeliveryOutcome(claimed(1)),
+        DeliveryOutcome(claimed(2, attempts=1), "ConnectionError: down"),
+        DeliveryOutcome(claimed(3, attempts=2), "ConnectionError: down"),
+    ], max_attempts=3)
+
+    params = [call.args[0].compile().params for call in db.execute.await_args_list]
+    assert [p["status"] for p in params] == [OutboxStatus.SENT, OutboxStatus.PENDING, OutboxStatus.FAILED]
+    # The code is dropped once the message is finished, kept while it may be retried
+    assert [p.get("payload") for p in params] == [{}, None, {}]
+    db.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_purge_deletes_only_old_finished_messages():
+    db = AsyncMock()
+    db.execute.return_value = MagicMock(rowcount=3)
+
+    assert await OutboxService.purge_finished(db, retention_days=7) == 3
+
+    sql = str(db.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+    assert sql.startswith("DELETE FROM outbox_messages")
+    assert "outbox_messages.status IN" in sql
+    assert "outbox_messages.updated_at <" in sql
+    db.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_worker_purges_at_most_once_per_interval():
+    db = AsyncMock()
+    db.execute.return_value = MagicMock(rowcount=0)
+
+    @asynccontextmanager
+    async def session_factory():
+        yield db
+
+    worker = OutboxWorker(session_factory, {}, poll_seconds=0)
+    await worker.purge_if_due()
+    await worker.purge_if_due()
+
+    assert db.execute.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_otp_is_not_retried_after_it_expires():
+    provider = FakeProvider(failures=1)
+    worker = OutboxWorker(None, {"sms": provider}, poll_seconds=0)
+    db = AsyncMock()
+
+    # First attempt fails while the code is still valid, but the retry would land after it expires
+    message = claimed(1, expires_at=datetime.utcnow() + timedelta(seconds=1))
+    await OutboxService.record_outcomes(db, await worker.deliver_batch([message]), max_attempts=6)
+
+    params = db.execute.await_args.args[0].compile().params
+    assert params["status"] == OutboxStatus.FAILED
+    assert params["last_error"] == "Expired before delivery (ConnectionError: provider unavailable)"
+    assert params["payload"] == {}
+
+    # A retry that only runs once the code has expired never reaches the provider
+    stale = claimed(1, attempts=1, expires_at=datetime.utcnow() - timedelta(seconds=1))
+    (outcome,) = await worker.deliver_batch([stale])
+    assert outcome.error == "Expired before delivery"
+    assert provider.calls == {stale.recipient: 1} and provider.sent == []
+    await OutboxService.record_outcomes(db, [outcome], max_attempts=6)
+    assert db.execute.await_args.args[0].compile().params["status"] == OutboxStatus.FAILED
+
+
+@pytest.mark.asyncio
+async def test_failed_otp_is_retried_while_it_is_valid():
+    worker = OutboxWorker(None, {"sms": FakeProvider(failures=1)}, poll_seconds=0)
+    db = AsyncMock()
+    message = claimed(1, expires_at=datetime.utcnow() + timedelta(minutes=OTP_EXPIRY_MINUTES))
+
+    await OutboxService.record_outcomes(db, await worker.deliver_batch([message]), max_attempts=6)
+
+    params = db.execute.await_args.args[0].compile().params
+    assert params["status"] == OutboxStatus.PENDING
+    assert params["next_attempt_at"] < message.expires_at
+
+
+@pytest.mark.asyncio
+async def test_claim_fails_expired_messages_instead_of_handing_them_out():
+    db = AsyncMock()
+    db.execute.return_value = MagicMock(all=MagicMock(return_value=[]))
+
+    assert await OutboxService.claim_batch(db, 10) == []
+
+    expire, claim = [call.args[0] for call in db.execute.await_args_list]
+    sql = str(expire.compile(dialect=postgresql.dialect()))
+    assert "outbox_messages.expires_at <=" in sql
+    assert expire.compile().params["status"] == OutboxStatus.FAILED
+    assert "outbox_messages.expires_at" in str(claim.compile(dialect=postgresql.dialect()))
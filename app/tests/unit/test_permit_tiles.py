@@ -0,0 +1,44 @@
+import pytest
+from datetime import datetime
+from sqlalchemy.dialects import postgresql
+from app.models.application import PermitApplication
+from app.services.permit_tiles import PermitTileService
+
+
+@pytest.mark.parametrize("z,x,y,valid", [
+    (0, 0, 0, True),
+    (12, 4095, 4095, True),
+    (12, 4096, 0, False),
+    (-1, 0, 0, False),
+    (23, 0, 0, False),
+])
+def test_tile_coordinate_validation(z, x, y, valid):
+    assert PermitTileService.is_valid_tile(z, x, y) is valid
+
+
+def test_etag_changes_with_data_version():
+    updated = datetime(2025, 1, 15, 9, 30)
+    etag = PermitTileService.etag_for("admin", 12, 1, 2, 7, 10, updated)
+
+    assert etag == PermitTileService.etag_for("admin", 12, 1, 2, 7, 10, updated)
+    assert etag != PermitTileService.etag_for("admin", 12, 1, 2, 7, 11, updated)
+    assert etag != PermitTileService.etag_for("admin", 12, 1, 3, 7, 10, updated)
+
+
+def test_tile_query_is_encoded_by_postgis():
+    stmt = PermitTileService.build_tile_query(PermitApplication.mmda_id == 1, "admin", 12, 1, 2, 7)
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+
+    assert "ST_AsMVT(features" in sql
+    assert "ST_AsMVTGeom" in sql
+    assert "ST_TileEnvelope" in sql
+
+
+def test_tile_filter_compares_bare_indexed_columns():
+    stmt = PermitTileService.build_version_query(PermitApplication.mmda_id == 1, 12, 1, 2)
+    where = str(stmt.compile(dialect=postgresql.dialect())).split("WHERE", 1)[1]
+
+    assert "coalesce" not in where
+    assert "permit_applications.parcel_geometry && ST_Transform" in where
+    assert "permit_applications.parcel_geometry IS NULL" in where
+    assert "permit_applications.project_location && ST_Transform" in where
@@ -0,0 +1,114 @@
+import pytest
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+from fastapi import HTTPException
+from starlette.requests import Request
+from app.api import dependencies
+from app.api.dependencies import current_principal, current_staff
+from app.core.constants import UserRole
+from app.core.security import create_jwt_token
+from app.services.principal import Principal, PrincipalScopeCache, principal_cache
+
+
+def make_request(token=None) -> Request:
+    headers = [(b"cookie", f"auth_token={token}".encode())] if token else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+def make_db(staff_row, committees=()):
+    """Session whose first query returns the user/staff row and the second the committees"""
+    user_result = MagicMock()
+    user_result.first.return_value = staff_row
+    committee_result = MagicMock()
+    committee_result.all.return_value = list(committees)
+    db = AsyncMock()
+    db.execute.side_effect = [user_result, committee_result]
+    return db
+
+
+@pytest.fixture
+def use_db(monkeypatch):
+    """Point current_principal's read session at a mock, recording each open/close"""
+    sessions = []
+
+    def use(db):
+        @asynccontextmanager
+        async def get_read_session():
+            sessions.append("open")
+            yield db
+            sessions.append("closed")
+
+        monkeypatch.setattr(dependencies.session_manager, "get_read_session", get_read_session)
+        return sessions
+
+    return use
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    principal_cache.invalidate()
+    yield
+    principal_cache.invalidate()
+
+
+@pytest.mark.asyncio
+async def test_principal_is_resolved_once_and_cached(use_db):
+    token = create_jwt_token({"sub": "7"})
+    db = make_db((UserRole.REVIEW_OFFICER, 3, 11, 2, False), [(40, 2), (41, 2)])
+    sessions = use_db(db)
+
+    request = make_request(token)
+    principal = await current_principal(request)
+    assert principal == Principal(
+        user_id=7, role=UserRole.REVIEW_OFFICER, staff_id=3, department_id=11,
+        mmda_id=2, is_head=False, committee_ids=(40, 41), committee_mmda_id=2,
+    )
+    assert db.execute.await_count == 2
+    # The session is closed before the route runs, not held for the request
+    assert sessions == ["open", "closed"]
+
+    # Same request: memoized on request.state. Next request: served from the cache
+    assert await current_principal(request) is principal
+    assert await current_principal(make_request(token)) is principal
+    assert db.execute.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_non_staff_skip_the_committee_query_and_are_rejected_by_current_staff(use_db):
+    db = make_db((UserRole.APPLICANT, None, None, None, None))
+    use_db(db)
+
+    principal = await current_principal(make_request(create_jwt_token({"sub": "9"})))
+
+    assert not principal.is_staff
+    assert db.execute.await_count == 1
+    with pytest.raises(HTTPException) as exc:
+        await current_staff(principal)
+    assert exc.value.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_missing_or_bad_token_is_401():
+    for request in (make_request(), make_request("not-a-jwt")):
+        with pytest.raises(HTTPException) as exc:
+            await current_principal(request)
+        assert exc.value.status_code == 401
+
+
+def test_cache_expires_evicts_and_invalidates(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr("app.services.principal.time.monotonic", lambda: clock[0])
+    cache = PrincipalScopeCache(ttl_seconds=60, max_size=2)
+
+    for user_id in (1, 2):
+        cache.put(Principal(user_id=user_id, role=None))
+    cache.get(1)  # 1 is now most recently used
+    cache.put(Principal(user_id=3, role=None))
+    assert cache.get(2) is None
+    assert cache.get(1) is not None
+
+    cache.invalidate(1)
+    assert cache.get(1) is None
+
+    clock[0] += 61
+    assert cache.get(3) is None
@@ -0,0 +1,93 @@
+import logging
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from app.api.v1.routers import documents
+from app.core.config import settings
+from app.core.query_stats import QueryStatsMiddleware, track_queries
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    yield engine
+    engine.dispose()
+
+
+def run_lookups(engine, times: int):
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        for i in range(times):
+            conn.execute(text("SELECT :id"), {"id": i})
+
+
+def test_counts_statements_and_flags_repeated_shapes(engine):
+    with track_queries() as outer:
+        run_lookups(engine, 2)
+        with track_queries() as inner:
+            run_lookups(engine, 6)
+
+    assert inner.count == 7
+    assert outer.count == 10
+    assert outer.duration > 0
+    assert inner.repeated(5) == [("SELECT ?", 6)]
+    assert outer.repeated(10) == []
+
+    run_lookups(engine, 3)  # Untracked
+    assert outer.count == 10
+
+
+def test_assert_max_queries_fixture(engine, assert_max_queries):
+    with assert_max_queries(3) as stats:
+        run_lookups(engine, 2)
+    assert stats.count == 3
+
+    with pytest.raises(AssertionError, match="at most 2"):
+        with assert_max_queries(2):
+            run_lookups(engine, 2)
+
+
+def test_middleware_reports_headers_in_debug_and_warns(engine, monkeypatch, caplog):
+    app = FastAPI()
+    app.add_middleware(QueryStatsMiddleware)
+
+    @app.get("/loop")
+    async def loop():
+        run_lookups(engine, 6)
+        return {}
+
+    client = TestClient(app)
+    monkeypatch.setattr(settings, "DEBUG", True)
+    with caplog.at_level(logging.WARNING, logger="app.core.query_stats"):
+        response = client.get("/loop")
+    assert response.headers["x-db-query-count"] == "7"
+    assert response.headers["x-db-repeated-statements"] == "1"
+    assert "Probable N+1 on GET /loop" in caplog.text
+
+    monkeypatch.setattr(settings, "DEBUG", False)
+    assert "x-db-query-count" not in client.get("/loop").headers
+
+
+@pytest.mark.asyncio
+async def test_inspection_counts_do_not_scale_with_mmdas(monkeypatch):
+    mmdas = [(SimpleNamespace(id=i, name=f"MMDA {i}", region="R", type="municipal"), None) for i in (1, 2, 3)]
+    monkeypatch.setattr(documents.MMDABoundaryService, "fetch_mmdas", AsyncMock(return_value=mmdas))
+
+    grouped = MagicMock()
+    grouped.all.return_value = [(1, "scheduled", 2), (3, "inspected", 4)]
+    backlog = MagicMock()
+    backlog.scalar_one.return_value = 5
+    db = AsyncMock()
+    db.execute.side_effect = [grouped, backlog]
+
+    data = await documents.process_inspection_mmda_data(db, {1, 2, 3}, work_mmda_id=1)
+
+    assert db.execute.await_count == 2
+    by_id = {mmda["id"]: mmda["status_counts"] for mmda in data}
+    assert by_id[1]["scheduled"] == 2
+    assert by_id[1]["awaiting_inspection"] == 5
+    assert by_id[2] == {key: 0 for key in by_id[2]}
+    assert by_id[3]["completed"] == 4
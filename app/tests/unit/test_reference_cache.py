@@ -0,0 +1,92 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+from app.core.config import settings
+from app.services import reference_cache as module
+from app.services.reference_cache import ReferenceDataCache
+
+
+class ItemOut(BaseModel):
+    id: int
+    name: str
+
+
+@pytest.fixture
+def dataset(monkeypatch):
+    calls = []
+
+    async def load(db, param=None):
+        calls.append(param)
+        return [SimpleNamespace(id=1, name="Septic Tank"), SimpleNamespace(id=2, name=f"Soakaway {len(calls)}")]
+
+    monkeypatch.setitem(module.DATASETS, "items", (ItemOut, load))
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_serves_cached_bytes_until_the_version_moves(dataset, monkeypatch):
+    cache = ReferenceDataCache()
+    db = AsyncMock()
+    db.scalar.side_effect = [1, 1, 2]
+    monkeypatch.setattr(settings, "REFERENCE_CACHE_CHECK_SECONDS", 0)
+
+    first = await cache.get(db, "items")
+    assert first.body == b'[{"id":1,"name":"Septic Tank"},{"id":2,"name":"Soakaway 1"}]'
+    assert await cache.get(db, "items") is first
+    assert dataset == [None]
+
+    refreshed = await cache.get(db, "items")  # Version bumped by another process
+    assert dataset == [None, None]
+    assert refreshed.etag != first.etag
+
+    monkeypatch.setattr(settings, "REFERENCE_CACHE_CHECK_SECONDS", 60)
+    await cache.get(db, "items", 7)
+    await cache.get(db, "items", 7)
+    assert db.scalar.await_count == 3  # Within the check interval the version isn't re-read
+    assert dataset == [None, None, 7]
+
+
+def test_respond_honours_if_none_match(dataset):
+    cache = ReferenceDataCache()
+    entry = cache.serialize(ItemOut, [SimpleNamespace(id=1, name="Septic Tank")])
+    app = FastAPI()
+
+    @app.get("/items")
+    async def items(request: Request):
+        return cache.respond(request, entry)
+
+    client = TestClient(app)
+    response = client.get("/items")
+    assert response.status_code == 200
+    assert response.json() == [{"id": 1, "name": "Septic Tank"}]
+    assert response.headers["etag"] == entry.etag
+
+    assert client.get("/items", headers={"If-None-Match": entry.etag}).status_code == 304
+    assert client.get("/items", headers={"If-None-Match": f'"other", W/{entry.etag}'}).status_code == 304
+    assert client.get("/items", headers={"If-None-Match": '"other"'}).status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_unknown_params_share_one_empty_entry(dataset, monkeypatch):
+    cache = ReferenceDataCache()
+    db = AsyncMock()
+    db.scalar.return_value = 1
+    known = []
+
+    async def known_ids(db, _=None):
+        known.append(True)
+        return [7]
+
+    monkeypatch.setitem(module.KNOWN_PARAMS, "items", known_ids)
+    monkeypatch.setattr(settings, "REFERENCE_CACHE_CHECK_SECONDS", 60)
+
+    await cache.get(db, "items", 7)
+    missing = await cache.get(db, "items", 8)
+    assert missing.body == b"[]"
+    assert await cache.get(db, "items", 9) is missing
+    assert dataset == [7]  # Unknown ids never reach the loader
+    assert known == [True]
+    assert len(cache._entries) == 2
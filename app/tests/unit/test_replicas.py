@@ -0,0 +1,93 @@
+from unittest.mock import AsyncMock, MagicMock
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+from app.core import database
+from app.core.config import settings
+from app.core.database import READ_ONLY_KEY, DatabaseSessionManager
+from app.core.replicas import ReplicaRouter, replica_urls
+
+
+def engine(host):
+    return create_async_engine(f"postgresql+asyncpg://user:secret@{host}:5432/permits")
+
+
+def router_with_lags(monkeypatch, lags, **config):
+    """Router over one replica per host; lags maps host to seconds behind or an exception"""
+    router = ReplicaRouter([engine(host) for host in lags], settings.model_copy(update=config))
+    calls = []
+
+    async def lag(replica):
+        host = replica.engine.url.host
+        calls.append(host)
+        if isinstance(lags[host], Exception):
+            raise lags[host]
+        return lags[host]
+
+    monkeypatch.setattr(router, "_lag", lag)
+    return router, calls
+
+
+def test_replica_urls_from_comma_separated_setting():
+    assert replica_urls(" postgresql://a/db , ,postgresql://b/db") == ["postgresql://a/db", "postgresql://b/db"]
+    assert replica_urls("") == []
+
+
+@pytest.mark.asyncio
+async def test_round_robin_over_replicas_within_lag_budget(monkeypatch):
+    router, _ = router_with_lags(
+        monkeypatch, {"r1": 0.5, "r2": 60.0, "r3": OSError("connection refused")}, REPLICA_MAX_LAG_SECONDS=10
+    )
+
+    picked = [(await router.pick()).engine.url.host for _ in range(2)]
+
+    assert picked == ["r1", "r1"]
+    assert [replica.available for replica in router.replicas] == [True, False, False]
+    assert router.replicas[0].name == "r1:5432/permits"
+
+
+@pytest.mark.asyncio
+async def test_lag_is_checked_once_per_interval(monkeypatch):
+    router, calls = router_with_lags(monkeypatch, {"r1": 0.0, "r2": 0.0}, REPLICA_LAG_CHECK_SECONDS=60)
+
+    hosts = [(await router.pick()).engine.url.host for _ in range(4)]
+
+    assert hosts == ["r1", "r2", "r1", "r2"]
+    assert sorted(calls) == ["r1", "r2"]
+
+
+@pytest.mark.asyncio
+async def test_no_replica_in_budget_means_primary(monkeypatch):
+    router, _ = router_with_lags(monkeypatch, {"r1": 30.0}, REPLICA_MAX_LAG_SECONDS=10)
+
+    assert await router.pick() is None
+
+
+def manager(router):
+    manager = DatabaseSessionManager()
+    session = AsyncMock()
+    session.info = {}
+    session.new = session.dirty = session.deleted = ()
+    manager.session_factory = MagicMock(return_value=session)
+    manager._read_bind = "primary-read-bind"
+    manager.replica_router = router
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_replica_session_binds_replica_or_falls_back(monkeypatch):
+    router, _ = router_with_lags(monkeypatch, {"r1": 0.0})
+    routed = manager(router)
+
+    async with routed.get_replica_session():
+        pass
+    routed.session_factory.assert_called_once_with(bind=router.replicas[0].autocommit, info={READ_ONLY_KEY: True})
+
+    router.replicas[0].available = False
+    monkeypatch.setattr(router, "refresh", AsyncMock())
+    fallbacks = database.DB_REPLICA_FALLBACKS.value()
+    routed.session_factory.reset_mock()
+
+    async with routed.get_replica_session(read_only=False):
+        pass
+    routed.session_factory.assert_called_once_with(info={READ_ONLY_KEY: True})
+    assert database.DB_REPLICA_FALLBACKS.value() == fallbacks + 1
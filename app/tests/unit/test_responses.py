@@ -0,0 +1,35 @@
+import json
+from datetime import datetime
+from decimal import Decimal
+from sqlalchemy.dialects import postgresql
+import app.main  # noqa: F401 - configures the mappers
+from app.core.constants import ApplicationStatus
+from app.core.responses import FastJSONResponse, RawJSON, compose, dumps
+from app.models.application import PermitApplication
+from app.services.permit_projections import PermitProjectionService
+
+
+def test_dumps_handles_enums_decimals_and_datetimes():
+    encoded = dumps({"status": ApplicationStatus.SUBMITTED, "fee": Decimal("12.50"), "at": datetime(2025, 1, 2, 3, 4, 5)})
+
+    assert json.loads(encoded) == {"status": ApplicationStatus.SUBMITTED.value, "fee": 12.5, "at": "2025-01-02T03:04:05"}
+
+
+def test_compose_splices_raw_json_verbatim():
+    body = compose({"permits": RawJSON('[{"id": 1}]'), "mmdas": [{"id": 2}]})
+
+    assert json.loads(body) == {"permits": [{"id": 1}], "mmdas": [{"id": 2}]}
+    assert b'[{"id": 1}]' in body
+    assert FastJSONResponse(RawJSON(body)).body == body
+
+
+def test_map_permits_query_aggregates_in_postgres():
+    fields = {**PermitProjectionService.map_permit_fields(), **PermitProjectionService.inspection_fields()}
+    query = PermitProjectionService.build_map_permits_query(PermitApplication.mmda_id == 1, fields)
+    sql = str(query.compile(dialect=postgresql.dialect()))
+
+    assert sql.count("json_agg") == 2
+    assert "ST_AsGeoJSON" in sql
+    assert "array_agg(distinct(permit_applications.mmda_id))" in sql
+    # Status goes out as the enum value, not the stored member name
+    assert "THEN %(param_" in sql and "CASE WHEN" in sql
@@ -0,0 +1,57 @@
+import pytest
+from datetime import datetime
+from sqlalchemy.dialects import postgresql
+from app.models.application import PermitApplication
+from app.services.reviewer_queue import CURSOR_FIELDS, ReviewerQueueService
+from app.utils.pagination import decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip_preserves_datetimes():
+    values = {"as_of": datetime(2025, 1, 15, 9, 30), "priority": 0, "queued_at": datetime(2025, 1, 2, 8, 0), "id": 42}
+    assert decode_cursor(encode_cursor(values)) == values
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "W10", "!!!"])
+def test_malformed_cursor_raises_value_error(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+def test_queue_query_orders_and_seeks_by_keyset():
+    after = {"priority": 1, "queued_at": datetime(2025, 1, 2, 8, 0), "id": 42}
+    stmt = ReviewerQueueService.build_queue_query(
+        PermitApplication.mmda_id == 1, datetime(2025, 1, 15, 9, 30), 25, after
+    )
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+
+    assert "CASE WHEN" in sql
+    assert ") > (" in sql
+    assert "LIMIT" in sql
+    # One extra row tells us whether another page exists
+    assert stmt._limit == 26
+
+
+def test_cursor_fields_are_parsed_to_their_types():
+    values = {"as_of": datetime(2025, 1, 15, 9, 30), "priority": 0, "queued_at": "2025-01-02T08:00:00", "id": 42}
+    after = decode_cursor(encode_cursor(values), CURSOR_FIELDS)
+    assert after["queued_at"] == datetime(2025, 1, 2, 8, 0)
+
+
+@pytest.mark.parametrize("tampered", [
+    {"queued_at": "yesterday"},
+    {"queued_at": 5},
+    {"as_of": {"dt": "not-a-date"}},
+    {"priority": "0"},
+    {"priority": True},
+    {"id": 4.2},
+    {"id": None},
+])
+def test_tampered_cursor_fields_raise_value_error(tampered):
+    values = {"as_of": datetime(2025, 1, 15, 9, 30), "priority": 0, "queued_at": datetime(2025, 1, 2, 8, 0), "id": 42}
+    with pytest.raises(ValueError):
+        decode_cursor(encode_cursor({**values, **tampered}), CURSOR_FIELDS)
+
+
+def test_cursor_missing_a_field_raises_value_error():
+    with pytest.raises(ValueError):
+        decode_cursor(encode_cursor({"priority": 0, "id": 42}), CURSOR_FIELDS)
@@ -0,0 +1,88 @@
+from datetime import datetime
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+import pytest
+from sqlalchemy.dialects import postgresql
+from app.models.application import PermitApplication
+from app.services.reviewer_stats import ReviewerStatsService
+
+
+def compile_stats_query():
+    base_filter = PermitApplication.mmda_id == 1
+    stmt = ReviewerStatsService.build_stats_query(base_filter, 7, datetime(2025, 1, 15, 9, 30))
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def test_stats_query_uses_filter_aggregates():
+    sql = compile_stats_query()
+    assert sql.count("FILTER (WHERE") == 4
+
+
+def test_stats_query_is_a_single_statement():
+    sql = compile_stats_query()
+    # Reviewer figures are embedded as scalar subqueries, not separate statements
+    assert sql.count("application_reviews") >= 2
+    assert sql.strip().upper().startswith("SELECT")
+
+
+def test_review_subqueries_are_not_correlated():
+    sql = compile_stats_query()
+    # Each review subquery joins its own permit_applications
+    assert sql.count("JOIN permit_applications") == 2
+
+
+def stats_db(**row):
+    result = MagicMock()
+    result.one.return_value = SimpleNamespace(**row)
+    db = AsyncMock()
+    db.execute.return_value = result
+    return db
+
+
+@pytest.mark.asyncio
+async def test_stats_row_maps_to_the_dashboard_payload():
+    db = stats_db(
+        pending_review=5, overdue=2, completed_today=3, completed_today_reviewer=1,
+        avg_review_time=Decimal("4.26"), avg_reviewer_time=Decimal("1.04"),
+    )
+
+    stats = await ReviewerStatsService.get_reviewer_stats(db, PermitApplication.mmda_id == 1, 7)
+
+    assert stats == {
+        "pending_review": 5,
+        "overdue": 2,
+        "completed_today": 3,
+        "completed_today_reviewer": 1,
+        "avg_review_time_days": 4.3,
+        "avg_review_time_days_reviewer": 1.0,
+    }
+    assert isinstance(stats["avg_review_time_days"], float)
+    assert db.execute.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_empty_scope_reports_zeros():
+    # No rows in scope: counts are 0 and averages come back NULL
+    db = stats_db(
+        pending_review=0, overdue=0, completed_today=0, completed_today_reviewer=None,
+        avg_review_time=None, avg_reviewer_time=None,
+    )
+
+    stats = await ReviewerStatsService.get_reviewer_stats(db, PermitApplication.mmda_id == 1, 7)
+
+    assert stats == {
+        "pending_review": 0,
+        "overdue": 0,
+        "completed_today": 0,
+        "completed_today_reviewer": 0,
+        "avg_review_time_days": 0,
+        "avg_review_time_days_reviewer": 0,
+    }
+
+
+def test_applications_without_a_permit_type_are_not_counted():
+    sql = compile_stats_query()
+    # Inner join, as before: a NULL or dangling permit_type_id drops the row
+    assert "FROM permit_applications JOIN permit_types ON" in sql
+    assert "LEFT OUTER JOIN" not in sql
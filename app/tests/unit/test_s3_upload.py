@@ -0,0 +1,73 @@
+import io
+import pytest
+from fastapi import UploadFile
+from starlette.datastructures import Headers
+from app.core.config import settings
+from app.services.storage import s3
+
+moto = pytest.importorskip("moto")
+
+BUCKET = "digi-permit-test"
+MiB = 1024 * 1024
+
+
+@pytest.fixture
+def s3_bucket(monkeypatch):
+    monkeypatch.setattr(settings, "AWS_S3_BUCKET", BUCKET)
+    monkeypatch.setattr(settings, "AWS_REGION", "us-east-1")
+    monkeypatch.setattr(settings, "AWS_S3_BASE_URL", f"https://{BUCKET}.s3.amazonaws.com/")
+    with moto.mock_aws():
+        s3.get_s3_client.cache_clear()
+        client = s3.get_s3_client()
+        client.create_bucket(Bucket=BUCKET)
+        yield client
+    s3.get_s3_client.cache_clear()
+
+
+def make_upload(data: bytes, filename: str = "site plan.pdf") -> UploadFile:
+    return UploadFile(
+        file=io.BytesIO(data),
+        filename=filename,
+        headers=Headers({"content-type": "application/pdf"}),
+    )
+
+
+@pytest.mark.asyncio
+async def test_small_file_is_uploaded_in_one_request(s3_bucket):
+    url = await s3.S3StorageBackend().upload(make_upload(b"%PDF-1.4 tiny"), folder="uploads/test", username="Ama")
+
+    key = url.removeprefix(settings.AWS_S3_BASE_URL)
+    assert key.startswith("uploads/test/ama/site-plan-")
+    obj = s3_bucket.get_object(Bucket=BUCKET, Key=key)
+    assert obj["Body"].read() == b"%PDF-1.4 tiny"
+    assert obj["ContentType"] == "application/pdf"
+
+
+@pytest.mark.asyncio
+async def test_large_file_is_streamed_as_multipart(s3_bucket):
+    data = bytes(range(256)) * (13 * MiB // 256)  # 13 MiB -> three 5 MiB parts
+    key = "uploads/test/drawing.pdf"
+
+    await s3.stream_upload_to_s3(make_upload(data), key, part_size=5 * MiB, concurrency=2)
+
+    obj = s3_bucket.get_object(Bucket=BUCKET, Key=key)
+    assert obj["Body"].read() == data
+    # Multipart ETags carry the part count
+    assert obj["ETag"].strip('"').endswith("-3")
+
+
+@pytest.mark.asyncio
+async def test_failed_part_aborts_the_multipart_upload(s3_bucket, monkeypatch):
+    real_upload_part = s3_bucket.upload_part
+
+    def flaky_upload_part(**kwargs):
+        if kwargs["PartNumber"] == 2:
+            raise RuntimeError("connection reset")
+        return real_upload_part(**kwargs)
+
+    monkeypatch.setattr(s3_bucket, "upload_part", flaky_upload_part)
+
+    with pytest.raises(RuntimeError):
+        await s3.stream_upload_to_s3(make_upload(b"x" * 11 * MiB), "uploads/test/broken.pdf", part_size=5 * MiB)
+
+    assert s3_bucket.list_multipart_uploads(Bucket=BUCKET).get("Uploads", []) == []
@@ -0,0 +1,55 @@
+from unittest.mock import AsyncMock, MagicMock
+import pytest
+from sqlalchemy.dialects import postgresql
+from app.core.constants import ZoneType
+from app.models.user import Committee
+from app.services.seeding import SeedingService
+from scripts import seed_db
+
+
+def result(rows):
+    result = MagicMock()
+    result.all.return_value = rows
+    return result
+
+
+def test_content_hash_tracks_data_and_files(tmp_path):
+    data_file = tmp_path / "uses.json"
+    data_file.write_text('{"a": 1}')
+    sources = {"ZONE_USES": {ZoneType.RURAL_A: {"permitted": ["Farming"]}}}
+
+    first = SeedingService.content_hash(sources, [data_file])
+    assert first == SeedingService.content_hash(dict(sources), [data_file])
+    assert first != SeedingService.content_hash({"ZONE_USES": {ZoneType.RURAL_A: {"permitted": ["Fishing"]}}}, [data_file])
+
+    data_file.write_text('{"a": 2}')
+    assert first != SeedingService.content_hash(sources, [data_file])
+
+
+@pytest.mark.asyncio
+async def test_insert_missing_sends_only_new_rows_in_one_statement():
+    db = AsyncMock()
+    db.execute.side_effect = [result([(1, "Works Sub-Committee")]), None]
+    rows = [
+        {"mmda_id": mmda_id, "name": name}
+        for mmda_id in (1, 2)
+        for name in ("Works Sub-Committee", "Finance Sub-Committee")
+    ]
+
+    added = await SeedingService.insert_missing(db, Committee, rows + rows[:1], ["mmda_id", "name"])
+
+    assert added == 3
+    assert db.execute.await_count == 2
+    stmt, params = db.execute.await_args_list[1].args
+    assert "ON CONFLICT DO NOTHING" in str(stmt.compile(dialect=postgresql.dialect()))
+    assert params == rows[1:]
+
+
+@pytest.mark.asyncio
+async def test_seed_all_is_one_lookup_when_hash_matches(monkeypatch):
+    monkeypatch.setattr(SeedingService, "applied_hash", AsyncMock(return_value=seed_db.seed_content_hash()))
+    db = AsyncMock()
+
+    assert await seed_db.seed_all(db) is False
+    db.execute.assert_not_awaited()
+    db.commit.assert_not_awaited()
@@ -0,0 +1,86 @@
+from unittest.mock import AsyncMock, MagicMock
+import pytest
+from sqlalchemy import Column, Integer, create_engine, insert, select
+from sqlalchemy.orm import Session, declarative_base
+from app.core.database import READ_ONLY_KEY, WRITES_KEY, DatabaseSessionManager, has_writes
+
+LocalBase = declarative_base()
+
+
+class Note(LocalBase):
+    __tablename__ = "notes"
+    id = Column(Integer, primary_key=True)
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    LocalBase.metadata.create_all(engine)
+    return engine
+
+
+def test_reads_leave_no_write_mark(engine):
+    with Session(engine) as session:
+        session.execute(select(Note))
+        assert not has_writes(session)
+
+        session.execute(insert(Note).values(id=1))
+        assert session.info[WRITES_KEY]
+
+
+def test_flush_marks_writes(engine):
+    with Session(engine) as session:
+        session.add(Note(id=2))
+        assert has_writes(session)
+        session.flush()
+        assert session.info[WRITES_KEY]
+
+
+def test_read_only_session_refuses_writes(engine):
+    with Session(engine, info={READ_ONLY_KEY: True}) as session:
+        session.execute(select(Note))
+        with pytest.raises(RuntimeError, match="read-only"):
+            session.execute(insert(Note).values(id=3))
+        session.add(Note(id=4))
+        with pytest.raises(RuntimeError, match="read-only"):
+            session.flush()
+
+
+def manager_with(session):
+    manager = DatabaseSessionManager()
+    manager.session_factory = MagicMock(return_value=session)
+    manager._read_bind = "read-bind"
+    return manager
+
+
+def fake_session(**info):
+    session = AsyncMock()
+    session.info = dict(info)
+    session.new = session.dirty = session.deleted = ()
+    return session
+
+
+@pytest.mark.asyncio
+async def test_get_session_commits_only_after_writes():
+    session = fake_session()
+    async with manager_with(session).get_session():
+        pass
+    session.commit.assert_not_awaited()
+    session.close.assert_awaited_once()
+
+    session = fake_session(**{WRITES_KEY: True})
+    async with manager_with(session).get_session():
+        pass
+    session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_read_session_uses_autocommit_bind():
+    session = fake_session()
+    manager = manager_with(session)
+
+    async with manager.get_read_session():
+        pass
+
+    manager.session_factory.assert_called_once_with(bind="read-bind", info={READ_ONLY_KEY: True})
+    session.commit.assert_not_awaited()
@@ -0,0 +1,64 @@
+import pytest
+from unittest.mock import AsyncMock
+from sqlalchemy.dialects import postgresql
+from app.core.constants import ApplicationStatus
+from app.models.application import PermitApplication
+from app.services.status_rollup import StatusRollupService
+
+
+def executed_buckets(mock_db):
+    buckets = []
+    for call in mock_db.execute.call_args_list:
+        params = call.args[0].compile(dialect=postgresql.dialect()).params
+        buckets.append((params["status"], params["count"], params["department_id"], params["committee_id"]))
+    return buckets
+
+
+@pytest.mark.asyncio
+async def test_new_application_increments_target_bucket():
+    mock_db = AsyncMock()
+    application = PermitApplication(mmda_id=1, department_id=4, committee_id=None)
+
+    await StatusRollupService.record_transition(mock_db, application, None, ApplicationStatus.SUBMITTED)
+
+    assert executed_buckets(mock_db) == [(ApplicationStatus.SUBMITTED, 1, 4, 0)]
+
+
+@pytest.mark.asyncio
+async def test_transition_moves_count_between_buckets():
+    mock_db = AsyncMock()
+    application = PermitApplication(mmda_id=1, department_id=4, committee_id=9)
+
+    await StatusRollupService.record_transition(
+        mock_db, application, ApplicationStatus.UNDER_REVIEW, ApplicationStatus.APPROVED
+    )
+
+    # Buckets are touched in status-value order to avoid lock-order deadlocks
+    assert executed_buckets(mock_db) == [
+        (ApplicationStatus.APPROVED, 1, 4, 9),
+        (ApplicationStatus.UNDER_REVIEW, -1, 4, 9),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_same_status_is_a_no_op():
+    mock_db = AsyncMock()
+    application = PermitApplication(mmda_id=1, department_id=4, committee_id=9)
+
+    await StatusRollupService.record_transition(
+        mock_db, application, ApplicationStatus.SUBMITTED, ApplicationStatus.SUBMITTED
+    )
+
+    mock_db.execute.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_lock_status_reads_the_status_for_update():
+    mock_db = AsyncMock()
+    mock_db.scalar.return_value = ApplicationStatus.SUBMITTED
+
+    status = await StatusRollupService.lock_status(mock_db, 12)
+
+    sql = str(mock_db.scalar.call_args.args[0].compile(dialect=postgresql.dialect()))
+    assert status == ApplicationStatus.SUBMITTED
+    assert "FOR UPDATE" in sql
@@ -0,0 +1,102 @@
+import httpx
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from app.core.config import settings
+import app.core.database  # noqa: F401 - registers the pool gauges
+from app.core.http import TimedTransport
+from app.core.telemetry import (
+    OUTBOUND_LATENCY,
+    REQUEST_LATENCY,
+    REQUESTS,
+    Metric,
+    MetricsRegistry,
+    TelemetryMiddleware,
+    metrics_endpoint,
+)
+
+
+def make_app():
+    app = FastAPI()
+    app.add_middleware(TelemetryMiddleware)
+    app.add_route("/telemetry", metrics_endpoint, methods=["GET"])
+
+    @app.get("/things/{thing_id}")
+    async def get_thing(thing_id: int):
+        if thing_id == 0:
+            raise HTTPException(status_code=404, detail="Not found")
+        return {"id": thing_id}
+
+    return app
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = MetricsRegistry()
+    latency = registry.histogram("demo_seconds", "Demo", ("route",), buckets=(0.1, 1.0))
+    latency.observe(0.05, "/a")
+    latency.observe(0.5, "/a")
+    latency.observe(3, "/a")
+
+    text = registry.render()
+    assert '# TYPE demo_seconds histogram' in text
+    assert 'demo_seconds_bucket{route="/a",le="0.1"} 1' in text
+    assert 'demo_seconds_bucket{route="/a",le="1"} 2' in text
+    assert 'demo_seconds_bucket{route="/a",le="+Inf"} 3' in text
+    assert 'demo_seconds_count{route="/a"} 3' in text
+    with pytest.raises(ValueError):
+        registry.counter("demo_seconds", "Duplicate")
+
+
+def test_requests_are_labelled_by_route_template(monkeypatch):
+    monkeypatch.setattr(settings, "TELEMETRY_TOKEN", None)
+    client = TestClient(make_app())
+    before_ok = REQUESTS.value("GET", "/things/{thing_id}", "200")
+    before_missing = REQUESTS.value("GET", "/things/{thing_id}", "404")
+    before_count = REQUEST_LATENCY.count("GET", "/things/{thing_id}")
+
+    client.get("/things/1")
+    client.get("/things/2")
+    client.get("/things/0")
+    client.get("/nowhere")
+
+    assert REQUESTS.value("GET", "/things/{thing_id}", "200") == before_ok + 2
+    assert REQUESTS.value("GET", "/things/{thing_id}", "404") == before_missing + 1
+    assert REQUEST_LATENCY.count("GET", "/things/{thing_id}") == before_count + 3
+
+    scrape = client.get("/telemetry")
+    assert scrape.status_code == 200
+    assert scrape.headers["content-type"].startswith("text/plain")
+    assert 'http_requests_total{method="GET",route="<unmatched>",status="404"}' in scrape.text
+    assert "db_pool_checked_out" in scrape.text
+
+
+def test_scrape_requires_token_when_configured(monkeypatch):
+    monkeypatch.setattr(settings, "TELEMETRY_TOKEN", "scrape-secret")
+    client = TestClient(make_app())
+    assert client.get("/telemetry").status_code == 403
+    assert client.get("/telemetry", headers={"Authorization": "Bearer scrape-secret"}).status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_outbound_calls_are_timed_by_integration():
+    def handler(request: httpx.Request):
+        return httpx.Response(503 if request.url.path == "/down" else 200)
+
+    transport = TimedTransport("demo", httpx.MockTransport(handler))
+    before_ok = OUTBOUND_LATENCY.count("demo", "ok")
+    before_error = OUTBOUND_LATENCY.count("demo", "error")
+
+    async with httpx.AsyncClient(base_url="https://demo.test", transport=transport) as client:
+        await client.get("/up")
+        await client.get("/down")
+
+    assert OUTBOUND_LATENCY.count("demo", "ok") == before_ok + 1
+    assert OUTBOUND_LATENCY.count("demo", "error") == before_error + 1
+
+
+def test_metric_without_samples_cannot_be_created():
+    class Incomplete(Metric):
+        kind = "gauge"
+
+    with pytest.raises(TypeError):
+        Incomplete("digi_permit_incomplete", "Forgot samples()")
@@ -0,0 +1,59 @@
+# Opaque keyset-pagination cursors
+import base64
+import json
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+
+def encode_cursor(values: Dict[str, Any]) -> str:
+    """Encode keyset values as a URL-safe opaque cursor"""
+    payload = {
+        key: {"dt": value.isoformat()} if isinstance(value, datetime) else value
+        for key, value in values.items()
+    }
+    raw = json.dumps(payload, separators=(",", ":"), sort_keys=True).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _parse_field(value: Any, field_type: type) -> Any:
+    if field_type is datetime:
+        if isinstance(value, datetime):
+            return value
+        if isinstance(value, str):
+            return datetime.fromisoformat(value)
+    elif field_type is int:
+        # bool is an int subclass, but never a valid keyset value
+        if isinstance(value, int) and not isinstance(value, bool):
+            return value
+    raise ValueError("Invalid cursor")
+
+
+def decode_cursor(cursor: str, fields: Optional[Dict[str, type]] = None) -> Dict[str, Any]:
+    """
+    Decode a cursor produced by encode_cursor. Raises ValueError if it is malformed.
+
+    With `fields` ({name: datetime | int}), every field must be present and of
+    that type, so a tampered cursor can't reach the keyset comparison.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+    if not isinstance(payload, dict):
+        raise ValueError("Invalid cursor")
+
+    try:
+        values = {
+            key: datetime.fromisoformat(value["dt"]) if isinstance(value, dict) and "dt" in value else value
+            for key, value in payload.items()
+        }
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+    if fields is None:
+        return values
+    if not fields.keys() <= values.keys():
+        raise ValueError("Invalid cursor")
+    return {name: _parse_field(values[name], field_type) for name, field_type in fields.items()}
@@ -0,0 +1,195 @@
+"""
+Reviewer application detail: one joinedload-everything query (deduplicated
+with .unique()) vs the detail loader (joins for to-one, selectin per collection).
+
+    python -m scripts.benchmarks.application_detail --documents 60 --history 80
+"""
+import argparse
+import asyncio
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+from sqlalchemy import event, func, insert, select
+from sqlalchemy.orm import joinedload
+
+from scripts.benchmarks.common import (
+    StatementCounter,
+    create_engine_and_sessions,
+    measure,
+    print_report,
+    seed_applications,
+)
+
+BENCHMARK_DOCUMENT_TYPE = "Benchmark Document"
+
+
+class RowCounter:
+    """Rows returned by the driver while active"""
+
+    def __init__(self, engine):
+        self.engine = engine.sync_engine
+        self.count = 0
+
+    def _on_execute(self, conn, cursor, *args):
+        # The asyncpg adapter buffers the full result on the cursor before this event
+        rows = getattr(cursor, "_rows", None)
+        self.count += len(rows) if rows is not None else max(cursor.rowcount, 0)
+
+    @contextmanager
+    def track(self):
+        self.count = 0
+        event.listen(self.engine, "after_cursor_execute", self._on_execute)
+        try:
+            yield self
+        finally:
+            event.remove(self.engine, "after_cursor_execute", self._on_execute)
+
+
+async def seed_detail(db, application_id: int, mmda_id: int, applicant_id: int, documents: int, history: int):
+    """Give one application many documents, history entries, payments and inspections"""
+    from app.core.constants import ApplicationStatus, DocumentStatus, InspectionType, PaymentPurpose, PaymentStatus
+    from app.models.application import ApplicationStatusHistory
+    from app.models.document import ApplicationDocument, DocumentTypeModel
+    from app.models.inspection import Inspection
+    from app.models.payment import Payment
+
+    existing = await db.scalar(
+        select(func.count(ApplicationDocument.id)).where(ApplicationDocument.application_id == application_id)
+    )
+    if existing:
+        return
+
+    document_type_id = await db.scalar(select(DocumentTypeModel.id).where(DocumentTypeModel.name == BENCHMARK_DOCUMENT_TYPE))
+    if document_type_id is None:
+        document_type_id = await db.scalar(
+            insert(DocumentTypeModel).values(name=BENCHMARK_DOCUMENT_TYPE, code="benchmark-doc").returning(DocumentTypeModel.id)
+        )
+
+    now = datetime.now()
+    await db.execute(insert(ApplicationDocument), [
+        {
+            "application_id": application_id,
+            "document_type_id": document_type_id,
+            "file_path": f"benchmark/doc-{i}.pdf",
+            "status": DocumentStatus.PENDING,
+            "uploaded_by_id": applicant_id,
+        }
+        for i in range(documents)
+    ])
+    statuses = list(ApplicationStatus)
+    await db.execute(insert(ApplicationStatusHistory), [
+        {
+            "application_id": application_id,
+            "from_status": statuses[i % len(statuses)],
+            "to_status": statuses[(i + 1) % len(statuses)],
+            "changed_by_id": applicant_id,
+            "notes": f"Benchmark change {i}",
+        }
+        for i in range(history)
+    ])
+    await db.execute(insert(Payment), [
+        {
+            "application_id": application_id,
+            "user_id": applicant_id,
+            "amount": 100,
+            "status": PaymentStatus.COMPLETED,
+            "purpose": PaymentPurpose.APPLICATION_FEE,
+            "transaction_reference": f"BENCH-DETAIL-{application_id}-{i}",
+            "payment_date": now - timedelta(days=i),
+        }
+        for i in range(4)
+    ])
+    await db.execute(insert(Inspection), [
+        {
+            "application_id": application_id,
+            "applicant_id": applicant_id,
+            "mmda_id": mmda_id,
+            "inspection_type": InspectionType.INITIAL,
+            "scheduled_date": now + timedelta(days=i),
+        }
+        for i in range(3)
+    ])
+    await db.commit()
+
+
+async def legacy_detail(db, application_id: int):
+    """The single joined query the detail loader replaced"""
+    from app.models.application import PermitApplication
+    from app.models.document import ApplicationDocument
+    from app.models.user import User
+
+    result = await db.execute(
+        select(PermitApplication)
+        .options(
+            joinedload(PermitApplication.applicant).joinedload(User.profile),
+            joinedload(PermitApplication.architect),
+            joinedload(PermitApplication.mmda),
+            joinedload(PermitApplication.permit_type),
+            joinedload(PermitApplication.documents).joinedload(ApplicationDocument.document_type),
+            joinedload(PermitApplication.reviews),
+            joinedload(PermitApplication.inspections),
+            joinedload(PermitApplication.payments),
+            joinedload(PermitApplication.status_history),
+            joinedload(PermitApplication.zoning_district),
+            joinedload(PermitApplication.zoning_use),
+            joinedload(PermitApplication.drainage_type),
+            joinedload(PermitApplication.previous_land_use),
+            joinedload(PermitApplication.site_conditions),
+        )
+        .where(PermitApplication.id == application_id)
+    )
+    application = result.unique().scalar_one()
+    return len(application.documents), len(application.payments)
+
+
+async def main(documents: int, history: int, iterations: int):
+    from app.models.application import PermitApplication
+    from app.services.application_detail import ApplicationDetailService
+
+    engine, session_factory = await create_engine_and_sessions()
+    try:
+        async with session_factory() as db:
+            seeded = await seed_applications(db, 1000)
+            application_id = await db.scalar(
+                select(PermitApplication.id)
+                .where(PermitApplication.mmda_id == seeded["mmda_id"])
+                .order_by(PermitApplication.id)
+                .limit(1)
+            )
+            await seed_detail(db, application_id, seeded["mmda_id"], seeded["reviewer_id"], documents, history)
+
+        async def loader(db, include=None):
+            sections = ApplicationDetailService.parse_include(include)
+            application = await ApplicationDetailService.load(db, application_id, sections)
+            return len(application.documents), len(application.payments)
+
+        variants = {
+            "legacy": lambda db: legacy_detail(db, application_id),
+            "loader": lambda db: loader(db),
+            "partial": lambda db: loader(db, "documents,payments"),
+        }
+        counter = StatementCounter(engine)
+        rows = RowCounter(engine)
+        results = {}
+        for name, fn in variants.items():
+            results[name] = await measure(session_factory, counter, fn, iterations)
+            async with session_factory() as db:
+                with rows.track():
+                    await fn(db)
+            results[name]["rows"] = rows.count
+
+        print_report(f"Application detail ({documents} documents, {history} history entries)", results)
+        print(f"{'variant':<12}{'rows':>12}")
+        for name, row in results.items():
+            print(f"{name:<12}{row['rows']:>12}")
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--documents", type=int, default=60)
+    parser.add_argument("--history", type=int, default=80)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.documents, args.history, args.iterations))
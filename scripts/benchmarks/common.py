@@ -0,0 +1,178 @@
+"""
+Shared helpers for the benchmark scripts.
+
+Benchmarks run against a real PostgreSQL/PostGIS database. Point
+BENCHMARK_DATABASE_URL at a scratch database (it falls back to
+APOSTGRES_DATABASE_URL) - the seed helpers insert throwaway rows.
+"""
+import os
+import random
+import statistics
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from importlib import import_module
+from typing import Awaitable, Callable, Dict, List
+
+from sqlalchemy import event, insert, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.config import settings
+from app.core.constants import ApplicationStatus, ReviewStatus, UserRole
+from app.models.base import Base
+
+BENCHMARK_MMDA_NAME = "Benchmark Assembly"
+BENCHMARK_PERMIT_TYPE = "benchmark"
+INSERT_BATCH_SIZE = 5000
+
+
+def load_models():
+    """Import every model module so mappers and tables are registered"""
+    for model in settings.DB_MODELS:
+        import_module(model)
+
+
+def benchmark_database_url() -> str:
+    return os.getenv("BENCHMARK_DATABASE_URL") or settings.APOSTGRES_DATABASE_URL
+
+
+async def create_engine_and_sessions():
+    load_models()
+    engine = create_async_engine(benchmark_database_url(), pool_size=5)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    return engine, async_sessionmaker(bind=engine, expire_on_commit=False, autoflush=False)
+
+
+class StatementCounter:
+    """Counts statements sent to the database while active"""
+
+    def __init__(self, engine: AsyncEngine):
+        self.engine = engine.sync_engine
+        self.count = 0
+
+    def _on_execute(self, *args, **kwargs):
+        self.count += 1
+
+    @contextmanager
+    def track(self):
+        self.count = 0
+        event.listen(self.engine, "before_cursor_execute", self._on_execute)
+        try:
+            yield self
+        finally:
+            event.remove(self.engine, "before_cursor_execute", self._on_execute)
+
+
+async def measure(
+    session_factory: async_sessionmaker,
+    counter: StatementCounter,
+    fn: Callable[[AsyncSession], Awaitable],
+    iterations: int = 20,
+) -> Dict:
+    """Run fn repeatedly and report latency percentiles and round trips per call"""
+    timings: List[float] = []
+    round_trips = 0
+    result = None
+    for _ in range(iterations):
+        async with session_factory() as db:
+            with counter.track():
+                started = time.perf_counter()
+                result = await fn(db)
+                timings.append((time.perf_counter() - started) * 1000)
+            round_trips = counter.count
+
+    timings.sort()
+    return {
+        "round_trips": round_trips,
+        "p50_ms": round(statistics.median(timings), 2),
+        "p95_ms": round(timings[int(len(timings) * 0.95) - 1], 2),
+        "mean_ms": round(statistics.mean(timings), 2),
+        "result": result,
+    }
+
+
+def print_report(title: str, rows: Dict[str, Dict]):
+    print(f"\n{title}")
+    print(f"{'variant':<12}{'round trips':>12}{'p50 ms':>10}{'p95 ms':>10}{'mean ms':>10}")
+    for name, row in rows.items():
+        print(f"{name:<12}{row['round_trips']:>12}{row['p50_ms']:>10}{row['p95_ms']:>10}{row['mean_ms']:>10}")
+
+
+async def seed_applications(db: AsyncSession, total: int = 100_000) -> Dict:
+    """
+    Seed one MMDA with `total` applications spread across statuses and ages,
+    plus a reviewer with completed reviews. Re-running reuses the existing rows.
+    """
+    from app.models.application import PermitApplication
+    from app.models.document import PermitTypeModel
+    from app.models.review import ApplicationReview
+    from app.models.user import MMDA, User
+
+    mmda_id = await db.scalar(select(MMDA.id).where(MMDA.name == BENCHMARK_MMDA_NAME))
+    if mmda_id is None:
+        mmda_id = await db.scalar(
+            insert(MMDA)
+            .values(name=BENCHMARK_MMDA_NAME, type="metropolitan", region="Benchmark")
+            .returning(MMDA.id)
+        )
+
+    if await db.get(PermitTypeModel, BENCHMARK_PERMIT_TYPE) is None:
+        await db.execute(
+            insert(PermitTypeModel).values(
+                id=BENCHMARK_PERMIT_TYPE,
+                name="Benchmark Permit",
+                base_fee=100,
+                standard_duration_days=30,
+            )
+        )
+
+    reviewer_email = "benchmark.reviewer@example.com"
+    reviewer_id = await db.scalar(select(User.id).where(User.email == reviewer_email))
+    if reviewer_id is None:
+        reviewer_id = await db.scalar(
+            insert(User)
+            .values(email=reviewer_email, role=UserRole.REVIEW_OFFICER, is_active=True)
+            .returning(User.id)
+        )
+
+    existing = await db.scalar(
+        select(PermitApplication.id).where(PermitApplication.mmda_id == mmda_id).limit(1)
+    )
+    if existing is None:
+        rng = random.Random(42)
+        now = datetime.now()
+        statuses = list(ApplicationStatus)
+        for offset in range(0, total, INSERT_BATCH_SIZE):
+            rows = []
+            for i in range(offset, min(offset + INSERT_BATCH_SIZE, total)):
+                submitted_at = now - timedelta(days=rng.uniform(0, 90))
+                rows.append({
+                    "application_number": f"BENCH-{i:07d}",
+                    "mmda_id": mmda_id,
+                    "applicant_id": reviewer_id,
+                    "permit_type_id": BENCHMARK_PERMIT_TYPE,
+                    "status": rng.choice(statuses),
+                    "project_name": f"Benchmark project {i}",
+                    "project_address": "Benchmark Street",
+                    "submitted_at": submitted_at,
+                    "updated_at": submitted_at + timedelta(days=rng.uniform(0, 30)),
+                })
+            await db.execute(insert(PermitApplication), rows)
+
+        application_ids = (await db.scalars(
+            select(PermitApplication.id)
+            .where(PermitApplication.mmda_id == mmda_id)
+            .limit(total // 20)
+        )).all()
+        await db.execute(insert(ApplicationReview), [
+            {
+                "application_id": application_id,
+                "review_officer_id": reviewer_id,
+                "status": ReviewStatus.COMPLETED,
+            }
+            for application_id in application_ids
+        ])
+
+    await db.commit()
+    return {"mmda_id": mmda_id, "reviewer_id": reviewer_id}
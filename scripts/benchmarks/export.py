@@ -0,0 +1,80 @@
+"""
+Application export: loading every ORM row and encoding one document vs
+streaming tuples from a server-side cursor and encoding per partition.
+Reports wall time and peak Python memory (tracemalloc) for the MMDA export.
+
+    python -m scripts.benchmarks.export --applications 500000
+"""
+import argparse
+import asyncio
+import time
+import tracemalloc
+
+from sqlalchemy import select
+
+from scripts.benchmarks.common import create_engine_and_sessions, seed_applications
+
+
+async def buffered_export(session_factory, mmda_id):
+    """What the admin map did: the whole result set as ORM objects, then one encode"""
+    from app.core.responses import dumps
+    from app.models.application import PermitApplication
+
+    async with session_factory() as db:
+        result = await db.execute(select(PermitApplication).where(PermitApplication.mmda_id == mmda_id))
+        applications = result.scalars().all()
+        body = dumps([
+            {
+                "id": app.id,
+                "application_number": app.application_number,
+                "project_name": app.project_name,
+                "status": app.status,
+                "mmda_id": app.mmda_id,
+                "created_at": app.created_at,
+            }
+            for app in applications
+        ])
+    return len(body)
+
+
+async def streamed_export(session_factory, mmda_id, fmt):
+    from app.models.application import PermitApplication
+    from app.services.application_export import ApplicationExportService
+
+    size = 0
+    async for chunk in ApplicationExportService.stream(session_factory, PermitApplication.mmda_id == mmda_id, fmt):
+        size += len(chunk)
+    return size
+
+
+async def profile(name, coro):
+    tracemalloc.start()
+    started = time.perf_counter()
+    size = await coro
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:<16}{elapsed:>10.2f}{peak / 2**20:>12.1f}{size / 2**20:>12.1f}")
+
+
+async def main(applications: int):
+    engine, session_factory = await create_engine_and_sessions()
+    try:
+        async with session_factory() as db:
+            seeded = await seed_applications(db, applications)
+            await db.commit()
+        mmda_id = seeded["mmda_id"]
+
+        print(f"{'variant':<16}{'seconds':>10}{'peak MiB':>12}{'output MiB':>12}")
+        await profile("buffered", buffered_export(session_factory, mmda_id))
+        await profile("stream ndjson", streamed_export(session_factory, mmda_id, "ndjson"))
+        await profile("stream csv", streamed_export(session_factory, mmda_id, "csv"))
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--applications", type=int, default=500_000)
+    args = parser.parse_args()
+    asyncio.run(main(args.applications))
@@ -0,0 +1,50 @@
+"""
+Import cost of startup modules, from `python -X importtime` in fresh
+interpreters. --cold points the bytecode cache at an empty directory so every
+module is compiled from source, as on a fresh container.
+
+    python -m scripts.benchmarks.import_time app.core.constants app.main --runs 5 --cold
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+
+LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+
+def import_times(module: str, cold: bool) -> dict:
+    """{module: (self_us, cumulative_us)} for one interpreter importing `module`"""
+    env = dict(os.environ)
+    with tempfile.TemporaryDirectory() as cache:
+        if cold:
+            env["PYTHONPYCACHEPREFIX"] = cache
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            env=env, capture_output=True, text=True, check=True,
+        )
+    times = {}
+    for match in LINE.finditer(proc.stderr):
+        times[match.group(4)] = (int(match.group(1)), int(match.group(2)))
+    return times
+
+
+def main(modules, runs: int, cold: bool):
+    print(f"{'module':<40}{'self ms':>12}{'cumulative ms':>16}   ({'cold' if cold else 'warm'}, median of {runs})")
+    for module in modules:
+        samples = [import_times(module, cold)[module] for _ in range(runs)]
+        own = statistics.median(s[0] for s in samples) / 1000
+        cumulative = statistics.median(s[1] for s in samples) / 1000
+        print(f"{module:<40}{own:>12.1f}{cumulative:>16.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("modules", nargs="*", default=["app.core.constants", "app.main"])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--cold", action="store_true")
+    args = parser.parse_args()
+    main(args.modules, args.runs, args.cold)
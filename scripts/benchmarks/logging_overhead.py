@@ -0,0 +1,120 @@
+"""
+Per-request logging cost: the old print() of tokens/payloads and SQL echo vs
+the level-gated, queued logger from app.core.logging.
+
+    python -m scripts.benchmarks.logging_overhead --requests 20000
+    python -m scripts.benchmarks.logging_overhead --requests 20000 --database
+
+Output goes to a line-buffered temp file, like an unbuffered container stdout;
+a terminal or a slow log shipper only makes the unqueued variants slower.
+--database also runs a small query with echo on and off (needs
+BENCHMARK_DATABASE_URL).
+"""
+import argparse
+import asyncio
+import contextlib
+import logging
+import tempfile
+import time
+from datetime import timedelta
+
+from app.core.logging import configure_logging, shutdown_logging
+from app.core.security import create_jwt_token, decode_jwt_token
+
+logger = logging.getLogger("benchmark.request")
+
+
+def baseline_request(user_id: int):
+    token = create_jwt_token({"sub": str(user_id)}, timedelta(hours=1))
+    return decode_jwt_token(token)
+
+
+def legacy_request(user_id: int):
+    """What the auth path used to do on every request"""
+    token = create_jwt_token({"sub": str(user_id)}, timedelta(hours=1))
+    print("Created token:", token)
+    print("Raw token from cookies:", token)
+    payload = decode_jwt_token(token)
+    print("Decoded payload:", payload)
+    print("user", payload["sub"])
+    return payload
+
+
+def gated_request(user_id: int):
+    token = create_jwt_token({"sub": str(user_id)}, timedelta(hours=1))
+    payload = decode_jwt_token(token)
+    logger.debug("Decoded token for user %s", payload["sub"])
+    return payload
+
+
+def sampled_request(user_id: int):
+    token = create_jwt_token({"sub": str(user_id)}, timedelta(hours=1))
+    payload = decode_jwt_token(token)
+    logger.info("Request authenticated", extra={"user_id": payload["sub"]})
+    return payload
+
+
+def run(fn, requests: int) -> dict:
+    started = time.perf_counter()
+    for i in range(requests):
+        fn(i)
+    elapsed = time.perf_counter() - started
+    return {"req_per_s": round(requests / elapsed), "mean_us": round(elapsed / requests * 1_000_000, 1)}
+
+
+async def run_queries(echo: bool, queries: int) -> dict:
+    from sqlalchemy import text
+    from scripts.benchmarks.common import create_engine_and_sessions
+
+    engine, session_factory = await create_engine_and_sessions()
+    engine.sync_engine.echo = echo
+    try:
+        async with session_factory() as db:
+            started = time.perf_counter()
+            for i in range(queries):
+                await db.execute(text("SELECT :n"), {"n": i})
+            elapsed = time.perf_counter() - started
+    finally:
+        await engine.dispose()
+    return {"req_per_s": round(queries / elapsed), "mean_us": round(elapsed / queries * 1_000_000, 1)}
+
+
+def print_rows(title: str, rows: dict, baseline: str):
+    print(f"\n{title}", flush=True)
+    print(f"{'variant':<22}{'req/s':>10}{'mean us':>10}{'overhead us':>14}")
+    for name, row in rows.items():
+        overhead = round(row["mean_us"] - rows[baseline]["mean_us"], 1)
+        print(f"{name:<22}{row['req_per_s']:>10}{row['mean_us']:>10}{overhead:>14}")
+
+
+def main(requests: int, database: bool):
+    run(baseline_request, requests)  # Warm up
+    rows = {"no logging": run(baseline_request, requests)}
+    with tempfile.TemporaryFile("w", buffering=1) as sink:
+        with contextlib.redirect_stdout(sink):
+            rows["print (legacy)"] = run(legacy_request, requests)
+
+        configure_logging(level="INFO", fmt="json", levels="", sample_rate=1.0, stream=sink)
+        rows["debug, gated off"] = run(gated_request, requests)
+        rows["info json, all"] = run(sampled_request, requests)
+
+        configure_logging(level="INFO", fmt="json", levels="", sample_rate=0.1, stream=sink)
+        rows["info json, 10% sample"] = run(sampled_request, requests)
+        shutdown_logging()
+
+        print_rows(f"Auth path logging over {requests} requests", rows, "no logging")
+
+        if database:
+            queries = max(requests // 10, 1)
+            with contextlib.redirect_stdout(sink):
+                echo_on = asyncio.run(run_queries(True, queries))
+            echo_off = asyncio.run(run_queries(False, queries))
+            print_rows(f"SQL echo over {queries} queries", {"echo=False": echo_off, "echo=True": echo_on}, "echo=False")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--database", action="store_true")
+    args = parser.parse_args()
+    main(args.requests, args.database)
@@ -0,0 +1,106 @@
+"""
+Engine configurations under concurrent load: the hot dashboard queries
+(reviewer stats, status rollup, map permits) issued by N concurrent clients,
+with the prepared-statement cache off (the old setting), on, and in PgBouncer
+mode. Point BENCHMARK_PGBOUNCER_URL at a PgBouncer in front of the same
+database to include the PgBouncer run.
+
+    python -m scripts.benchmarks.pool_config --concurrency 20 --seconds 15
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+from sqlalchemy import and_
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.config import settings
+from app.core.database import engine_options
+from scripts.benchmarks.common import benchmark_database_url, create_engine_and_sessions, seed_applications
+
+CONFIGS = {
+    "no cache": {"DB_STATEMENT_CACHE_SIZE": 0, "DB_POOL_PRE_PING": True},
+    "cache": {},
+    "cache no ping": {"DB_POOL_PRE_PING": False},
+}
+
+
+async def dashboard_requests(db, seeded):
+    """One reviewer dashboard's worth of queries"""
+    from app.models.application import PermitApplication
+    from app.services.permit_projections import PermitProjectionService
+    from app.services.reviewer_stats import ReviewerStatsService
+    from app.services.status_rollup import StatusRollupService
+
+    mmda_id, reviewer_id = seeded["mmda_id"], seeded["reviewer_id"]
+    scope = PermitApplication.mmda_id == mmda_id
+    await ReviewerStatsService.get_reviewer_stats(db, scope, reviewer_id)
+    await StatusRollupService.counts_by_mmda(db, [mmda_id])
+    await PermitProjectionService.map_permits(db, and_(scope, PermitApplication.id % 100 == 0))
+
+
+async def dashboard_once(session_factory, seeded):
+    async with session_factory() as db:
+        await dashboard_requests(db, seeded)
+
+
+async def run_load(url, overrides, seeded, concurrency, seconds):
+    config = settings.model_copy(update={"DB_POOL_SIZE": concurrency, "DB_MAX_OVERFLOW": 0, **overrides})
+    engine = create_async_engine(url, **engine_options(url, config))
+    session_factory = async_sessionmaker(bind=engine, expire_on_commit=False, autoflush=False)
+    timings = []
+    deadline = time.perf_counter() + seconds
+
+    async def client():
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            async with session_factory() as db:
+                await dashboard_requests(db, seeded)
+            timings.append((time.perf_counter() - started) * 1000)
+
+    try:
+        # Warm the pool (and each connection's statement cache) before measuring
+        await asyncio.gather(*[dashboard_once(session_factory, seeded) for _ in range(concurrency)])
+        await asyncio.gather(*[client() for _ in range(concurrency)])
+    finally:
+        await engine.dispose()
+
+    timings.sort()
+    return {
+        "rps": round(len(timings) / seconds, 1),
+        "p50_ms": round(statistics.median(timings), 2),
+        "p95_ms": round(timings[int(len(timings) * 0.95) - 1], 2),
+    }
+
+
+async def main(applications, concurrency, seconds):
+    engine, session_factory = await create_engine_and_sessions()
+    try:
+        async with session_factory() as db:
+            seeded = await seed_applications(db, applications)
+            await db.commit()
+    finally:
+        await engine.dispose()
+
+    url = benchmark_database_url()
+    runs = [(name, url, overrides) for name, overrides in CONFIGS.items()]
+    pgbouncer_url = os.getenv("BENCHMARK_PGBOUNCER_URL")
+    if pgbouncer_url:
+        runs.append(("pgbouncer", pgbouncer_url, {"DB_PGBOUNCER": True}))
+
+    print(f"\n{concurrency} clients, {seconds}s each")
+    print(f"{'config':<16}{'dashboards/s':>14}{'p50 ms':>10}{'p95 ms':>10}")
+    for name, run_url, overrides in runs:
+        row = await run_load(run_url, overrides, seeded, concurrency, seconds)
+        print(f"{name:<16}{row['rps']:>14}{row['p50_ms']:>10}{row['p95_ms']:>10}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--applications", type=int, default=100_000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--seconds", type=float, default=15)
+    args = parser.parse_args()
+    asyncio.run(main(args.applications, args.concurrency, args.seconds))
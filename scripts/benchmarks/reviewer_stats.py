@@ -0,0 +1,151 @@
+"""
+Reviewer dashboard stats: six round trips + Python overdue loop vs a single
+FILTER-aggregate statement.
+
+    python -m scripts.benchmarks.reviewer_stats --applications 100000
+"""
+import argparse
+import asyncio
+from datetime import datetime, time, timedelta
+
+from sqlalchemy import func, or_, select
+
+from scripts.benchmarks.common import (
+    StatementCounter,
+    create_engine_and_sessions,
+    measure,
+    print_report,
+    seed_applications,
+)
+
+
+async def legacy_reviewer_stats(db, base_filter, user_id):
+    """The per-metric implementation the stats service replaced"""
+    from app.core.constants import ApplicationStatus, ReviewStatus
+    from app.models.application import PermitApplication
+    from app.models.document import PermitTypeModel
+    from app.models.review import ApplicationReview
+
+    now = datetime.now()
+    today_start = datetime.combine(now.date(), time.min)
+    today_end = datetime.combine(now.date(), time.max)
+    completed = or_(
+        PermitApplication.status == ApplicationStatus.APPROVED,
+        PermitApplication.status == ApplicationStatus.REJECTED
+    )
+
+    pending_review = (await db.execute(
+        select(func.count(PermitApplication.id))
+        .where(base_filter, PermitApplication.status == ApplicationStatus.SUBMITTED)
+    )).scalar_one() or 0
+
+    permits_with_duration = await db.execute(
+        select(
+            PermitApplication.id,
+            PermitApplication.status,
+            PermitApplication.submitted_at,
+            PermitTypeModel.standard_duration_days
+        )
+        .join(PermitTypeModel)
+        .where(base_filter)
+    )
+    overdue_count = 0
+    for permit in permits_with_duration:
+        if not permit.submitted_at:
+            continue
+        time_in_review = now - permit.submitted_at
+        standard_duration = permit.standard_duration_days or 30
+        if permit.status == ApplicationStatus.SUBMITTED and time_in_review > timedelta(days=2):
+            overdue_count += 1
+        elif (permit.status == ApplicationStatus.UNDER_REVIEW and
+              time_in_review > timedelta(days=standard_duration / 2)):
+            overdue_count += 1
+        elif time_in_review > timedelta(days=standard_duration):
+            overdue_count += 1
+
+    completed_today = (await db.execute(
+        select(func.count(PermitApplication.id))
+        .where(base_filter, completed, PermitApplication.updated_at.between(today_start, today_end))
+    )).scalar_one() or 0
+
+    completed_today_reviewer = (await db.execute(
+        select(func.count())
+        .select_from(ApplicationReview)
+        .join(PermitApplication, ApplicationReview.application_id == PermitApplication.id)
+        .where(
+            ApplicationReview.review_officer_id == user_id,
+            ApplicationReview.status == ReviewStatus.COMPLETED,
+            ApplicationReview.updated_at.between(today_start, today_end),
+            base_filter
+        )
+    )).scalar_one() or 0
+
+    avg_review_time = (await db.execute(
+        select(func.avg(
+            func.extract('epoch', PermitApplication.updated_at - PermitApplication.submitted_at) / 86400
+        ))
+        .where(base_filter, completed, PermitApplication.submitted_at.isnot(None))
+    )).scalar_one() or 0
+
+    avg_reviewer_time = (await db.execute(
+        select(func.avg(
+            func.extract('epoch', ApplicationReview.updated_at - ApplicationReview.created_at) / 86400
+        ))
+        .join(PermitApplication, ApplicationReview.application_id == PermitApplication.id)
+        .where(
+            ApplicationReview.review_officer_id == user_id,
+            ApplicationReview.status == ReviewStatus.COMPLETED,
+            base_filter
+        )
+    )).scalar_one() or 0
+
+    return {
+        "pending_review": pending_review,
+        "overdue": overdue_count,
+        "completed_today": completed_today,
+        "completed_today_reviewer": completed_today_reviewer,
+        "avg_review_time_days": round(float(avg_review_time), 1) if avg_review_time else 0,
+        "avg_review_time_days_reviewer": round(float(avg_reviewer_time), 1) if avg_reviewer_time else 0,
+    }
+
+
+async def main(applications: int, iterations: int):
+    from app.models.application import PermitApplication
+    from app.services.reviewer_stats import ReviewerStatsService
+
+    engine, session_factory = await create_engine_and_sessions()
+    try:
+        async with session_factory() as db:
+            seeded = await seed_applications(db, applications)
+
+        base_filter = PermitApplication.mmda_id == seeded["mmda_id"]
+        user_id = seeded["reviewer_id"]
+        counter = StatementCounter(engine)
+
+        legacy = await measure(
+            session_factory, counter,
+            lambda db: legacy_reviewer_stats(db, base_filter, user_id),
+            iterations
+        )
+        single = await measure(
+            session_factory, counter,
+            lambda db: ReviewerStatsService.get_reviewer_stats(db, base_filter, user_id),
+            iterations
+        )
+
+        print_report(
+            f"Reviewer stats over {applications} applications ({iterations} iterations)",
+            {"legacy": legacy, "single": single}
+        )
+        if legacy["result"] != single["result"]:
+            print(f"⚠️ Results differ:\n  legacy={legacy['result']}\n  single={single['result']}")
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--applications", type=int, default=100_000)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.applications, args.iterations))
@@ -0,0 +1,36 @@
+"""
+Startup seeding: the content-hash skip path vs a forced top-up run where every
+seeder checks its table and finds nothing missing.
+
+    python -m scripts.benchmarks.seeding --iterations 5
+"""
+import argparse
+import asyncio
+
+from scripts.benchmarks.common import StatementCounter, create_engine_and_sessions, measure, print_report
+
+
+async def main(iterations: int):
+    from scripts.seed_db import seed_all
+
+    engine, session_factory = await create_engine_and_sessions()
+    try:
+        async with session_factory() as db:
+            await seed_all(db, force=True)
+
+        variants = {
+            "skip": lambda db: seed_all(db),
+            "forced": lambda db: seed_all(db, force=True),
+        }
+        counter = StatementCounter(engine)
+        results = {name: await measure(session_factory, counter, fn, iterations) for name, fn in variants.items()}
+        print_report("Reference data seeding (already seeded)", results)
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.iterations))
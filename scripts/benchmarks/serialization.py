@@ -0,0 +1,149 @@
+"""
+Response serialization cost per N rows, without a database: the pydantic /
+jsonable_encoder / stdlib json path FastAPI takes for a response_model vs the
+tuple projection + orjson path (app.core.responses).
+
+- applications: /permits/my-applications rows (ApplicationOut, with documents)
+- map permits: dashboard map permits with a parcel polygon. The old path runs
+  shapely's mapping() per row; the new path splices json_agg output from
+  Postgres, whose cost lands in the database and isn't measured here.
+
+    python -m scripts.benchmarks.serialization --rows 10000
+"""
+import argparse
+import json
+import statistics
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import List
+
+from geoalchemy2.shape import from_shape
+from pydantic import TypeAdapter
+from shapely.geometry import Polygon
+
+from app.core.constants import ApplicationStatus, DocumentStatus
+from app.core.responses import RawJSON, compose, dumps, orjson
+from app.schemas.permit_application import ApplicationOut
+
+
+def application_tuples(rows: int):
+    now = datetime(2025, 1, 1, 12, 0, 0)
+    statuses = list(ApplicationStatus)
+    return [
+        (
+            i, f"APP-{i:06d}", f"Project {i}", statuses[i % len(statuses)], now - timedelta(minutes=i),
+            "new_construction", "New Construction", 1 + i % 5, f"Assembly {i % 5}",
+            [(7, "Site Plan", f"uploads/{i}/site.pdf", DocumentStatus.PENDING)],
+        )
+        for i in range(rows)
+    ]
+
+
+def as_orm_like(row):
+    app_id, number, name, status, created_at, type_id, type_name, mmda_id, mmda_name, documents = row
+    return SimpleNamespace(
+        id=app_id, application_number=number, project_name=name, status=status, created_at=created_at,
+        permit_type=SimpleNamespace(id=type_id, name=type_name),
+        mmda=SimpleNamespace(id=mmda_id, name=mmda_name),
+        documents=[
+            SimpleNamespace(document_type=SimpleNamespace(id=t, name=n), file_path=path, status=s)
+            for t, n, path, s in documents
+        ],
+    )
+
+
+def legacy_applications(objects) -> bytes:
+    # What FastAPI does for response_model=List[ApplicationOut] after the handler's from_orm
+    adapter = TypeAdapter(List[ApplicationOut])
+    models = [ApplicationOut.model_validate(obj) for obj in objects]
+    content = adapter.dump_python(adapter.validate_python(models), mode="json")
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode()
+
+
+def fast_applications(rows) -> bytes:
+    return dumps([
+        {
+            "id": app_id,
+            "application_number": number,
+            "project_name": name,
+            "status": status,
+            "created_at": created_at,
+            "permit_type": {"id": type_id, "name": type_name},
+            "mmda": {"id": mmda_id, "name": mmda_name},
+            "documents": [
+                {"document_type": {"id": t, "name": n}, "file_path": path, "status": s}
+                for t, n, path, s in documents
+            ],
+        }
+        for app_id, number, name, status, created_at, type_id, type_name, mmda_id, mmda_name, documents in rows
+    ])
+
+
+def map_rows(rows: int):
+    polygon = from_shape(Polygon([(-0.2, 5.6), (-0.19, 5.6), (-0.19, 5.61), (-0.2, 5.61), (-0.2, 5.6)]), srid=4326)
+    return [
+        SimpleNamespace(
+            id=i, project_name=f"Project {i}", status=ApplicationStatus.SUBMITTED,
+            permit_type=SimpleNamespace(id="new_construction", name="New Construction"),
+            mmda_id=1, parcel_geometry=polygon, latitude=5.605, longitude=-0.195,
+        )
+        for i in range(rows)
+    ]
+
+
+def legacy_map(permits) -> bytes:
+    from app.api.v1.routers.documents import serialize_geom
+
+    content = {
+        "permits": [
+            {
+                "id": p.id,
+                "project_name": p.project_name,
+                "status": p.status.value,
+                "permit_type": {"id": p.permit_type.id, "name": p.permit_type.name},
+                "mmda_id": p.mmda_id,
+                "parcel_geometry": serialize_geom(p.parcel_geometry),
+                "latitude": p.latitude,
+                "longitude": p.longitude,
+            }
+            for p in permits
+        ],
+        "mmdas": [],
+    }
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def timed(fn, arg, repeats: int):
+    samples = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        fn(arg)
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def main(rows: int, repeats: int):
+    tuples = application_tuples(rows)
+    objects = [as_orm_like(row) for row in tuples]
+    permits = map_rows(rows)
+    # The Postgres side of the new map path returns this text; only the splice is timed
+    permits_json = RawJSON(legacy_map(permits)[len(b'{"permits":'):-len(b',"mmdas":[]}')])
+
+    results = {
+        "applications  pydantic+json": timed(legacy_applications, objects, repeats),
+        "applications  tuples+" + ("orjson" if orjson else "json"): timed(fast_applications, tuples, repeats),
+        "map permits   shapely+json": timed(legacy_map, permits, repeats),
+        "map permits   json_agg splice": timed(lambda raw: compose({"permits": raw, "mmdas": []}), permits_json, repeats),
+    }
+    print(f"{'path':<36}{'ms per ' + str(rows) + ' rows':>20}")
+    for name, ms in results.items():
+        print(f"{name:<36}{ms:>20.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+    main(args.rows, args.repeats)
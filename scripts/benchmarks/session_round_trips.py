@@ -0,0 +1,144 @@
+"""
+Database round trips per request for each session lifecycle, counted with
+asyncpg's query logger (so BEGIN/COMMIT/ROLLBACK and pre-ping pings are
+included, unlike the X-DB-Query-Count header, which only counts statements).
+
+- legacy: a new async_scoped_session registry per request and an
+  unconditional commit (the old get_session)
+- aget_db: one sessionmaker, commit only after writes
+- aget_read_db: the autocommit read-only session
+
+    python -m scripts.benchmarks.session_round_trips --iterations 50
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from asyncio import current_task
+from contextlib import asynccontextmanager
+
+from sqlalchemy import event, func, select, update
+from sqlalchemy.ext.asyncio import async_scoped_session, create_async_engine
+
+from app.core.config import settings
+from app.core.database import DatabaseSessionManager, engine_options
+from scripts.benchmarks.common import benchmark_database_url, create_engine_and_sessions, seed_applications
+
+
+class RoundTripCounter:
+    """Every message asyncpg sends, via its query logger"""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, record):
+        self.count += 1
+
+    def attach(self, engine):
+        @event.listens_for(engine.sync_engine, "connect")
+        def on_connect(dbapi_connection, _):
+            dbapi_connection.driver_connection.add_query_logger(self)
+
+
+def legacy_session(manager):
+    @asynccontextmanager
+    async def session_scope():
+        registry = async_scoped_session(manager.session_factory, scopefunc=current_task)
+        async with registry() as session:
+            try:
+                yield session
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+            finally:
+                await session.close()
+    return session_scope
+
+
+async def no_db(db, seeded):
+    return None
+
+
+async def dashboard_read(db, seeded):
+    """Principal lookup (cache miss) plus the reviewer stats query"""
+    from app.models.application import PermitApplication
+    from app.services.principal import PrincipalService
+    from app.services.reviewer_stats import ReviewerStatsService
+
+    await PrincipalService.load(db, seeded["reviewer_id"])
+    await ReviewerStatsService.get_reviewer_stats(db, PermitApplication.mmda_id == seeded["mmda_id"], seeded["reviewer_id"])
+
+
+async def single_write(db, seeded):
+    from app.models.application import PermitApplication
+
+    application_id = await db.scalar(select(func.min(PermitApplication.id)).where(PermitApplication.mmda_id == seeded["mmda_id"]))
+    await db.execute(update(PermitApplication).where(PermitApplication.id == application_id).values(updated_at=func.now()))
+
+
+VARIANTS = {
+    "no-db route": [("legacy", no_db), ("aget_db", no_db)],
+    "read route": [("legacy", dashboard_read), ("aget_db", dashboard_read), ("aget_read_db", dashboard_read)],
+    "write route": [("legacy", single_write), ("aget_db", single_write)],
+}
+
+
+async def measure(manager, counter, lifecycle, handler, seeded, iterations):
+    scopes = {
+        "legacy": legacy_session(manager),
+        "aget_db": manager.get_session,
+        "aget_read_db": manager.get_read_session,
+    }
+    round_trips, timings = [], []
+    for _ in range(iterations):
+        await asyncio.sleep(0)
+        before = counter.count
+        started = time.perf_counter()
+        async with scopes[lifecycle]() as db:
+            await handler(db, seeded)
+        timings.append((time.perf_counter() - started) * 1000)
+        # Query logger callbacks are scheduled with call_soon
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        round_trips.append(counter.count - before)
+    return statistics.mean(round_trips), statistics.median(timings)
+
+
+async def main(applications, iterations):
+    engine, session_factory = await create_engine_and_sessions()
+    try:
+        async with session_factory() as db:
+            seeded = await seed_applications(db, applications)
+            await db.commit()
+    finally:
+        await engine.dispose()
+
+    url = benchmark_database_url()
+    for pre_ping in (True, False):
+        config = settings.model_copy(update={"DB_POOL_PRE_PING": pre_ping, "DB_POOL_SIZE": 1, "DB_MAX_OVERFLOW": 0})
+        manager = DatabaseSessionManager()
+        manager.use_engine(create_async_engine(url, **engine_options(url, config)))
+        counter = RoundTripCounter()
+        counter.attach(manager.engine)
+        try:
+            # First connect runs the dialect's setup queries; keep them out of the counts
+            async with manager.get_read_session() as db:
+                await db.execute(select(1))
+
+            print(f"\npool_pre_ping={pre_ping}")
+            print(f"{'route':<14}{'session':<14}{'round trips':>12}{'p50 ms':>10}")
+            for route, variants in VARIANTS.items():
+                for lifecycle, handler in variants:
+                    trips, p50 = await measure(manager, counter, lifecycle, handler, seeded, iterations)
+                    print(f"{route:<14}{lifecycle:<14}{trips:>12.1f}{p50:>10.2f}")
+        finally:
+            await manager.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--applications", type=int, default=10_000)
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.applications, args.iterations))
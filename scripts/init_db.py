@@ -0,0 +1,57 @@
+"""
+Prepare the database before any API worker starts: schema, reference data and
+the derived-data backfills. Run once per deploy (release phase / init job):
+
+    python -m scripts.init_db [--force]
+
+Concurrent runs are serialized on a PostgreSQL advisory lock; whoever goes
+second finds the seed hash already recorded and only checks it.
+"""
+import argparse
+import asyncio
+import logging
+import zlib
+
+from app.core.database import session_manager
+from app.core.logging import configure_logging
+from app.services.mmda_boundaries import MMDABoundaryService
+from app.services.reference_cache import ReferenceDataCache
+from app.services.status_rollup import StatusRollupService
+from scripts.seed_db import seed_all
+
+logger = logging.getLogger(__name__)
+
+INIT_LOCK_KEY = zlib.crc32(b"digi-permit:init")
+
+
+async def run_init(force: bool = False) -> bool:
+    """Schema, seed data and backfills, one process at a time. Returns whether anything was seeded"""
+    await session_manager.ensure_database()
+    async with session_manager.advisory_lock(INIT_LOCK_KEY):
+        logger.info("🔒 Holding the init lock")
+        await session_manager.setup_schema()
+        async with session_manager.get_session() as db:
+            seeded = await seed_all(db, force=force)
+            await StatusRollupService.reconcile_if_empty(db)
+            backfilled = await MMDABoundaryService.backfill(db)
+            if seeded or backfilled:
+                # Running workers refetch their cached lookup lists
+                await ReferenceDataCache.bump(db)
+    logger.info("🎉 Database initialized")
+    return seeded
+
+
+async def main(force: bool):
+    await session_manager.init()
+    try:
+        await run_init(force)
+    finally:
+        await session_manager.close()
+
+
+if __name__ == "__main__":
+    configure_logging()
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--force", action="store_true", help="Run the seeders even if the seed data is unchanged")
+    args = parser.parse_args()
+    asyncio.run(main(args.force))
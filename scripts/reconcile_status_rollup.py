@@ -0,0 +1,31 @@
+"""
+Rebuild application_status_rollup from permit_applications.
+
+Run after bulk imports, manual status edits, or whenever dashboard counts
+look off:
+
+    python -m scripts.reconcile_status_rollup
+"""
+import asyncio
+import logging
+
+from app.core.database import session_manager
+from app.core.logging import configure_logging
+from app.services.status_rollup import StatusRollupService
+
+configure_logging()
+logger = logging.getLogger(__name__)
+
+
+async def main():
+    await session_manager.init()
+    try:
+        async with session_manager.get_session() as db:
+            buckets = await StatusRollupService.reconcile(db)
+        logger.info(f"🎉 Status rollup reconciled ({buckets} buckets)")
+    finally:
+        await session_manager.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
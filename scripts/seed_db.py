@@ -1,10 +1,11 @@
-from sqlalchemy import select, func
-from app.models.document import PermitTypeModel, DocumentTypeModel
-from app.services.Zoning_initializer import ZoningInitializer
+from app.core import constants
+from app.models.document import PermitTypeModel
+from app.services.Zoning_initializer import USE_REQUIREMENTS_PATH, ZoningInitializer
 from app.services.applicant_type_initializer import ApplicantTypeInitializer
-from app.services.mmda_initializer import MMDAInitializer
+from app.services.mmda_initializer import GEOJSON_PATH, MMDAInitializer
 from app.services.permit_initializer import PermitSystemInitializer
 from app.services.previous_land_initializer import PreviousLandUseSeeder
+from app.services.seeding import SeedingService
 from app.services.site_condition_drainage_initializer import SiteConditionAndDrainageInitializer
 from app.core.config import settings
 import logging
@@ -12,17 +13,46 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = logging.getLogger(__name__)
 
-async def seed_all(db: AsyncSession) -> bool:
-    """Orchestrate all database seeding operations with external session management"""
+SEED_NAME = "reference_data"
+# Everything the seeders read; a change to any of these changes the hash
+SEED_SOURCES = (
+    "PERMIT_TYPE_DATA",
+    "DOCUMENT_TYPES_DATA",
+    "PERMIT_REQUIREMENTS",
+    "SITE_CONDITION_DATA",
+    "DRAINAGE_TYPE_DATA",
+    "APPLICANT_TYPE_DATA",
+    "ZONE_DATA",
+    "ZONE_USES",
+    "PREVIOUS_LAND_USES",
+    "DEPARTMENTS_DATA",
+    "COMMITTEES_DATA",
+)
+SEED_FILES = (USE_REQUIREMENTS_PATH, GEOJSON_PATH)
+
+
+def seed_content_hash() -> str:
+    return SeedingService.content_hash(
+        {name: getattr(constants, name) for name in SEED_SOURCES},
+        SEED_FILES,
+    )
+
+
+async def seed_all(db: AsyncSession, force: bool = False) -> bool:
+    """
+    Orchestrate all database seeding operations in one transaction.
+
+    Skipped entirely when the stored content hash matches the seed data;
+    otherwise every seeder tops up missing rows and the hash is recorded.
+    """
     try:
-        # Check if seeding is needed
-        if not await needs_seeding(db):
+        content_hash = seed_content_hash()
+        if not (force or settings.FORCE_SEED) and await SeedingService.applied_hash(db, SEED_NAME) == content_hash:
             logger.info("⏩ Database already seeded, skipping")
             return False
             
         logger.info("🚀 Starting database seeding process...")
         
-        
         # 1. Seed document types and requirements
         await PermitSystemInitializer.initialize_document_types(db)
         await PermitSystemInitializer.initialize_permit_types(db)
@@ -31,7 +61,7 @@ async def seed_all(db: AsyncSession) -> bool:
         #2 seed Site Conditions and Drainage types
         await SiteConditionAndDrainageInitializer.initialize(db)
         
-        # 3. Seed zoning districts
+        # 3. Seed applicant types
         await ApplicantTypeInitializer.initialize(db)
         # 4. Seed zoning districts
         await ZoningInitializer.initialize_zoning_districts(db)
@@ -39,30 +69,24 @@ async def seed_all(db: AsyncSession) -> bool:
         await PreviousLandUseSeeder.seed(db)
         #5. Seed MMDA, Departments, and Committees
         await MMDAInitializer.initialize_mmdas(db)
-        # Commit is handled by the caller
-        logger.info("✅ Seeding operations completed (commit pending)")
+
+        await SeedingService.mark_applied(db, SEED_NAME, content_hash)
+        await db.commit()
+        logger.info(f"✅ Seeding operations completed ({content_hash[:12]})")
         return True
             
     except Exception as e:
         logger.error(f"🔥 Seeding failed: {e}")
-        # Rollback should be handled by the caller
+        await db.rollback()
         raise
 
     
 async def needs_seeding(db: AsyncSession) -> bool:
-    """Check if seeding is required"""
-    # Check if permit types exist
-    result = await db.execute(select(func.count(PermitTypeModel.id)))
-    permit_count = result.scalar()
-    
-    # Check if document types exist
-    result = await db.execute(select(func.count(DocumentTypeModel.id)))
-    doc_count = result.scalar()
-    
-    return permit_count == 0 or doc_count == 0 or settings.FORCE_SEED
+    """Check if seeding is required: the seed data changed since it was last applied"""
+    return settings.FORCE_SEED or await SeedingService.applied_hash(db, SEED_NAME) != seed_content_hash()
 
 async def seed_permit_types(db: AsyncSession):
     """Seed permit types only"""  
     logger.info("⏳ Seeding permit types...")
     await PermitTypeModel.seed_defaults(db)
-    logger.info("✅ Permit types seeded")
\ No newline at end of file
+    logger.info("✅ Permit types seeded")